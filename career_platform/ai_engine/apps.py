@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AiEngineConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ai_engine"
+
+    def ready(self):
+        from .crawler import should_start_scheduler, opportunity_crawler
+
+        if should_start_scheduler():
+            opportunity_crawler.start_scheduler()
@@ -0,0 +1,169 @@
+# ai_engine/core/skill_knowledge.py
+import os
+import json
+import threading
+import time
+from types import MappingProxyType
+
+DEFAULT_KNOWLEDGE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'datasets', 'mappings', 'skill_knowledge.json'
+)
+
+# Fields every skill entry exposes after defaults are applied
+ENTRY_FIELDS = ('learning_path', 'duration', 'resources', 'projects', 'reason')
+
+
+def _freeze(value):
+    """Turn parsed JSON into read-only structures so entries can be shared safely"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Return a plain (JSON serializable) copy of a frozen structure"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+class SkillKnowledgeBase:
+    """Indexed skill knowledge base for learning paths, durations, resources, projects and gap reasons.
+
+    The data lives in ``datasets/mappings/skill_knowledge.json`` (override with the
+    ``SKILL_KNOWLEDGE_PATH`` environment variable). It is loaded once, shared read-only
+    between requests and reloaded automatically when the file changes on disk.
+    """
+
+    RELOAD_CHECK_INTERVAL = 30  # seconds between mtime checks
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv('SKILL_KNOWLEDGE_PATH', DEFAULT_KNOWLEDGE_PATH)
+        self._lock = threading.Lock()
+        self._loaded_mtime = None
+        self._last_check = 0.0
+        self._defaults = MappingProxyType({})
+        self._aliases = MappingProxyType({})
+        self._skills = MappingProxyType({})
+        self._branches = MappingProxyType({})
+        self._technical_priority = MappingProxyType({})
+        self._cache = {}
+
+    # ---------- loading ----------
+
+    def _ensure_loaded(self):
+        now = time.monotonic()
+        if self._loaded_mtime is not None and now - self._last_check < self.RELOAD_CHECK_INTERVAL:
+            return
+
+        with self._lock:
+            self._last_check = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError as e:
+                if self._loaded_mtime is None:
+                    print(f"⚠️ Skill knowledge base not found: {e}")
+                    self._loaded_mtime = 0
+                return
+
+            if mtime == self._loaded_mtime:
+                return
+
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skill knowledge base load failed: {e}")
+                if self._loaded_mtime is None:
+                    self._loaded_mtime = 0
+                return
+
+            self._defaults = _freeze(data.get('defaults', {}))
+            self._aliases = _freeze({k.lower().strip(): v.lower().strip() for k, v in data.get('aliases', {}).items()})
+            self._skills = _freeze({k.lower().strip(): v for k, v in data.get('skills', {}).items()})
+            self._branches = _freeze({k.lower().strip(): v for k, v in data.get('branches', {}).items()})
+            self._technical_priority = _freeze(data.get('technical_priority', {}))
+            self._cache = {}
+            self._loaded_mtime = mtime
+            print(f"📚 Skill knowledge base loaded: {len(self._skills)} skills, {len(self._aliases)} aliases")
+
+    def reload(self):
+        """Force a reload on the next lookup"""
+        with self._lock:
+            self._loaded_mtime = None
+            self._last_check = 0.0
+        self._ensure_loaded()
+
+    # ---------- indexing ----------
+
+    def canonical_id(self, skill):
+        """Map a free-text skill name to its canonical id"""
+        self._ensure_loaded()
+        key = (skill or '').lower().strip()
+        return self._aliases.get(key, key)
+
+    def branch_key(self, branch):
+        """Resolve a branch name (e.g. 'Computer Science') to its knowledge base key"""
+        self._ensure_loaded()
+        branch_lower = (branch or '').lower()
+        for key in self._branches:
+            if key in branch_lower:
+                return key
+        return None
+
+    def technical_priority(self):
+        """Base market demand for the tracked technical skills"""
+        self._ensure_loaded()
+        return self._technical_priority
+
+    def priority_bonus(self, skill, branch):
+        """Branch-specific priority bonus for a skill"""
+        key = self.branch_key(branch)
+        if key is None:
+            return 0
+        return self._branches[key].get('priority_bonus', {}).get(self.canonical_id(skill), 0)
+
+    def _resolve(self, skill_id, branch_key):
+        cache_key = (skill_id, branch_key)
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+        merged = dict(self._defaults)
+        merged.update(self._skills.get(skill_id, {}))
+        if branch_key is not None:
+            merged.update(self._branches[branch_key].get('skills', {}).get(skill_id, {}))
+
+        entry = MappingProxyType({field: merged.get(field) for field in ENTRY_FIELDS})
+        self._cache[cache_key] = entry
+        return entry
+
+    # ---------- lookups ----------
+
+    def lookup(self, skill, branch=None):
+        """Get learning path, duration, resources, projects and reason for one skill"""
+        return self.bulk_lookup([skill], branch)[skill]
+
+    def bulk_lookup(self, skills, branch=None):
+        """Look up every skill gap in one call - returns {skill: entry}"""
+        self._ensure_loaded()
+        branch_key = self.branch_key(branch)
+        branch_label = branch or ''
+
+        results = {}
+        for skill in skills:
+            if skill in results:
+                continue
+            entry = _thaw(self._resolve(self.canonical_id(skill), branch_key))
+            if entry.get('reason'):
+                entry['reason'] = entry['reason'].replace('{branch}', branch_label)
+            results[skill] = entry
+        return results
+
+
+# Create global instance
+skill_knowledge = SkillKnowledgeBase()
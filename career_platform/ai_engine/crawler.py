@@ -0,0 +1,243 @@
+# ai_engine/crawler.py
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+
+from django.db import close_old_connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .core.skill_knowledge import skill_knowledge
+from .models.opportunity import Opportunity, CrawlRequest
+from .scrapers.internship_scraper import InternshipScraper
+from .scrapers.course_scraper import CourseScraper
+from .scrapers.link_manager import format_internship_link, format_course_link
+from .link_verifier import link_verifier
+
+CRAWLER_ENABLED = os.getenv('OPPORTUNITY_CRAWLER_ENABLED', 'False') == 'True'
+# Run the scheduler inside this process - set on ONE process only; the default is cron + crawl_opportunities
+CRAWLER_IN_PROCESS = os.getenv('CRAWLER_IN_PROCESS', '0') == '1'
+CRAWL_INTERVAL_SECONDS = int(os.getenv('OPPORTUNITY_CRAWL_INTERVAL', str(6 * 3600)))
+CRAWL_LIMIT = int(os.getenv('OPPORTUNITY_CRAWL_LIMIT', '8'))
+
+# Branches crawled by default - same values as StudentProfile.BRANCH_CHOICES
+DEFAULT_BRANCHES = [
+    'Computer Science', 'Electrical Engineering', 'Civil Engineering', 'Mechanical Engineering',
+    'Electronics Engineering', 'Information Technology', 'Chemical Engineering', 'Biotechnology',
+]
+
+VALID_PLATFORMS = {key for key, _ in Opportunity.PLATFORMS}
+
+
+def skill_keys(skills):
+    """Canonical skill ids for a comma separated skill string"""
+    keys = []
+    for skill in (skills or '').split(','):
+        key = skill_knowledge.canonical_id(skill)
+        if key and key not in keys:
+            keys.append(key[:100])
+    return keys
+
+
+class OpportunityCrawler:
+    """Background crawler that keeps the Opportunity table fresh per (skill, branch).
+
+    Every slot stores the internships and courses the scrapers return for one
+    canonical skill in one branch. LinkManager only reads these rows, so request
+    latency never depends on third-party sites. Slots missed at request time are
+    queued in the CrawlRequest table and crawled first by the next run, whether
+    that is the crawl_opportunities cron job or the in-process scheduler.
+    """
+
+    def __init__(self, interval=CRAWL_INTERVAL_SECONDS, limit=CRAWL_LIMIT):
+        self.interval = interval
+        self.limit = limit
+        self.internship_scraper = InternshipScraper()
+        self.course_scraper = CourseScraper()
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_run = None
+        self.verify_per_tick = int(os.getenv('LINK_VERIFY_PER_TICK', '500'))
+
+    # ---------- targets ----------
+
+    def default_skills(self):
+        return list(skill_knowledge.technical_priority().keys())
+
+    def stale_slots(self, branches=None, skills=None):
+        """(branch, skill_key) slots never crawled or older than the crawl interval"""
+        branches = branches or DEFAULT_BRANCHES
+        skills = [skill_knowledge.canonical_id(s) for s in (skills or self.default_skills())]
+        cutoff = timezone.now() - timedelta(seconds=self.interval)
+
+        crawled = {
+            (row['branch'], row['skill_key']): row['crawled']
+            for row in Opportunity.objects.filter(branch__in=branches, skill_key__in=skills)
+            .values('branch', 'skill_key').annotate(crawled=Max('last_crawled'))
+        }
+        return [
+            (branch, skill) for branch in branches for skill in skills
+            if crawled.get((branch, skill)) is None or crawled[(branch, skill)] < cutoff
+        ]
+
+    def queue_slots(self, branch, skills):
+        """Ask the next crawl run to crawl slots that were missing at request time"""
+        requests = [CrawlRequest(branch=branch[:100], skill_key=key) for key in skill_keys(skills)]
+        try:
+            CrawlRequest.objects.bulk_create(requests, ignore_conflicts=True)
+        except Exception as e:
+            print(f"⚠️ Could not queue crawl for {branch}: {e}")
+
+    def pending_slots(self):
+        """Queued (branch, skill_key) slots, oldest request first"""
+        return [tuple(slot) for slot in CrawlRequest.objects.order_by('requested_at').values_list('branch', 'skill_key')]
+
+    # ---------- crawling ----------
+
+    def crawl_slot(self, branch, skill):
+        """Scrape and store internships + courses for one (branch, skill) slot"""
+        internships = self.internship_scraper.get_internships_by_skills(skill, branch, limit=self.limit)
+        courses = self.course_scraper.get_courses_by_missing_skills(skill, branch, limit=self.limit)
+
+        stored = self.store(branch, skill, 'internship', internships, format_internship_link)
+        stored += self.store(branch, skill, 'course', courses, format_course_link)
+        return stored
+
+    def store(self, branch, skill, opportunity_type, items, formatter):
+        """Upsert one slot's rows and deactivate the ones the site no longer returns"""
+        now = timezone.now()
+        seen_ids = []
+
+        with transaction.atomic():
+            for item in items:
+                link = formatter(item)
+                platform = link['platform'] if link['platform'] in VALID_PLATFORMS else 'other'
+                opportunity, _ = Opportunity.objects.update_or_create(
+                    opportunity_type=opportunity_type,
+                    branch=branch,
+                    skill_key=skill,
+                    url=link['url'][:500],
+                    defaults={
+                        'title': link['title'][:200],
+                        'company_org': (link.get('company') or link.get('provider') or '')[:200],
+                        'platform': platform,
+                        'provider': (link.get('provider') or '')[:200],
+                        'skills_required': item.get('skills') or item.get('skills_covered') or skill,
+                        'category': (item.get('category') or branch)[:100],
+                        'experience_level': (item.get('level') or 'All Levels')[:50],
+                        'salary_info': (item.get('stipend') or item.get('salary') or '')[:100],
+                        'location': (item.get('location') or '')[:200],
+                        'duration': (item.get('duration') or '')[:100],
+                        'stipend': (item.get('stipend') or '')[:100],
+                        'details': link['details'][:300],
+                        'relevance_score': int(link.get('relevance_score') or 0),
+                        'is_active': True,
+                        'last_crawled': now,
+                    }
+                )
+                seen_ids.append(opportunity.id)
+
+            # Keep old rows (users may have saved them) but stop serving them
+            Opportunity.objects.filter(
+                opportunity_type=opportunity_type, branch=branch, skill_key=skill
+            ).exclude(id__in=seen_ids).update(is_active=False, last_crawled=now)
+
+        return len(seen_ids)
+
+    def crawl(self, branches=None, skills=None, force=False, max_slots=None):
+        """Crawl every requested slot (only stale ones unless force=True)"""
+        if force:
+            branches = branches or DEFAULT_BRANCHES
+            skills = [skill_knowledge.canonical_id(s) for s in (skills or self.default_skills())]
+            slots = [(branch, skill) for branch in branches for skill in skills]
+        else:
+            slots = self.stale_slots(branches, skills)
+
+        pending = self.pending_slots()
+        queued = set(pending)
+        slots = pending + [slot for slot in slots if slot not in queued]
+        if max_slots:
+            slots = slots[:max_slots]
+
+        started = time.time()
+        stored = 0
+        failed = 0
+        for branch, skill in slots:
+            if self._stop.is_set():
+                break
+            try:
+                stored += self.crawl_slot(branch, skill)
+            except Exception as e:
+                failed += 1
+                print(f"❌ Crawl failed for {skill} ({branch}): {e}")
+            if (branch, skill) in queued:
+                # Dequeued once attempted - a failed slot stays stale and is retried by stale_slots
+                CrawlRequest.objects.filter(branch=branch, skill_key=skill).delete()
+
+        self.last_run = timezone.now()
+        summary = {
+            'slots': len(slots),
+            'stored': stored,
+            'failed': failed,
+            'seconds': round(time.time() - started, 1),
+        }
+        if slots:
+            print(f"🕷️ Opportunity crawl finished: {summary}")
+        return summary
+
+    # ---------- in-process scheduler ----------
+
+    def start_scheduler(self, poll_seconds=60, initial_delay=30, max_slots_per_tick=20):
+        """Run the crawler in a daemon thread - pending slots first, then stale ones"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._scheduler_loop,
+            args=(poll_seconds, initial_delay, max_slots_per_tick),
+            name='opportunity-crawler',
+            daemon=True
+        )
+        self._thread.start()
+        print(f"🕷️ Opportunity crawler scheduled every {self.interval}s")
+
+    def stop_scheduler(self):
+        self._stop.set()
+
+    def _scheduler_loop(self, poll_seconds, initial_delay, max_slots_per_tick):
+        # Don't hit the database while Django is still starting up
+        if self._stop.wait(initial_delay):
+            return
+        while not self._stop.is_set():
+            close_old_connections()
+            try:
+                self.crawl(max_slots=max_slots_per_tick)
+                # Link health is checked here too, never at request time
+                link_verifier.verify_stale(limit=self.verify_per_tick)
+            except Exception as e:
+                print(f"❌ Opportunity crawler error: {e}")
+            finally:
+                close_old_connections()
+            self._stop.wait(poll_seconds)
+
+
+def should_start_scheduler():
+    """Only when this process opted in with CRAWLER_IN_PROCESS=1.
+
+    Every gunicorn/uvicorn worker imports the app, so starting by default would
+    run one crawler per worker. Production runs ``manage.py crawl_opportunities``
+    from cron instead; the in-process scheduler is for runserver or a single
+    dedicated process. Never for migrate/shell or runserver's reloader parent.
+    """
+    if not (CRAWLER_ENABLED and CRAWLER_IN_PROCESS):
+        return False
+    if os.path.basename(sys.argv[0]) == 'manage.py':
+        command = sys.argv[1] if len(sys.argv) > 1 else ''
+        return command == 'runserver' and os.environ.get('RUN_MAIN') == 'true'
+    return True
+
+
+# Create global instance
+opportunity_crawler = OpportunityCrawler()
@@ -0,0 +1,142 @@
+# ai_engine/link_verifier.py
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import requests
+from django.db.models import Q
+from django.utils import timezone
+
+from .models.opportunity import Opportunity
+from .scrapers.endpoints import resolve_url
+from .scrapers.resilience import GuardedSession, CircuitOpenError, RateLimitedError
+
+VERIFY_MAX_AGE_HOURS = int(os.getenv('LINK_VERIFY_MAX_AGE_HOURS', '24'))
+VERIFY_WORKERS = int(os.getenv('LINK_VERIFY_WORKERS', '16'))
+VERIFY_BATCH_SIZE = int(os.getenv('LINK_VERIFY_BATCH_SIZE', '200'))
+VERIFY_TIMEOUT = 5
+# Rows skipped for a protected host come back into the stale set after this long
+VERIFY_RETRY_MINUTES = int(os.getenv('LINK_VERIFY_RETRY_MINUTES', '30'))
+
+# Returned when a link could not be checked right now (open circuit / rate limit)
+SKIPPED = None
+
+
+class LinkVerifier:
+    """Concurrent HEAD checker that keeps Opportunity.link_status up to date.
+
+    Rows are checked in batches with at most ``max_workers`` requests in flight,
+    and no more per host than its token bucket refills each second. Identical
+    URLs in a batch are checked once, and only rows never verified or older than
+    ``LINK_VERIFY_MAX_AGE_HOURS`` are picked up, so the request path never needs
+    a HEAD call to know whether a link works. Rows skipped because their host is
+    rate limited or its circuit is open are retried after
+    ``LINK_VERIFY_RETRY_MINUTES`` instead of heading the next run again.
+    """
+
+    def __init__(self, max_workers=VERIFY_WORKERS, batch_size=VERIFY_BATCH_SIZE, timeout=VERIFY_TIMEOUT):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.session = GuardedSession()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+
+    def check_url(self, url):
+        """'active', 'broken', 'unknown' - or SKIPPED when the host is being protected"""
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in (405, 501):
+                # Some sites refuse HEAD - a streamed GET only reads the headers
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+                response.close()
+        except (CircuitOpenError, RateLimitedError):
+            return SKIPPED
+        except requests.RequestException:
+            return 'unknown'
+
+        if response.status_code < 400:
+            return 'active'
+        if response.status_code in (404, 410):
+            return 'broken'
+        return 'unknown'
+
+    def host_limit(self, host):
+        """Requests allowed in flight for one host - its token bucket's rate per second"""
+        bucket, _ = self.session.guards.get(host)
+        return max(1, math.ceil(bucket.rate))
+
+    def check_urls(self, urls):
+        """Check unique URLs concurrently - returns {url: status}"""
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+
+        hosts = {url: urlsplit(resolve_url(url)).netloc.lower() for url in unique_urls}
+        urls_per_host = defaultdict(int)
+        for host in hosts.values():
+            urls_per_host[host] += 1
+        limits = {host: min(count, self.host_limit(host)) for host, count in urls_per_host.items()}
+        slots = {host: threading.Semaphore(limit) for host, limit in limits.items()}
+
+        def check(url):
+            with slots[hosts[url]]:
+                return self.check_url(url)
+
+        # More workers than the hosts' buckets allow would only turn into RateLimitedError skips
+        workers = min(self.max_workers, sum(limits.values()))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_urls, executor.map(check, unique_urls)))
+
+    def stale_queryset(self, max_age_hours=VERIFY_MAX_AGE_HOURS):
+        cutoff = timezone.now() - timedelta(hours=max_age_hours)
+        return Opportunity.objects.filter(is_active=True).filter(
+            Q(last_verified__isnull=True) | Q(last_verified__lt=cutoff)
+        )
+
+    def verify_stale(self, max_age_hours=VERIFY_MAX_AGE_HOURS, limit=None):
+        """Re-check stale Opportunity rows batch by batch and persist the results"""
+        started = time.time()
+        stale = self.stale_queryset(max_age_hours).order_by('last_verified', 'id').values_list('id', 'url')
+        rows = list(stale[:limit] if limit else stale)
+
+        summary = {'checked': 0, 'active': 0, 'broken': 0, 'unknown': 0, 'skipped': 0, 'unique_urls': 0}
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            results = self.check_urls(url for _, url in batch)
+            summary['unique_urls'] += len(results)
+
+            ids_by_status = defaultdict(list)
+            skipped_ids = []
+            for row_id, url in batch:
+                status = results.get(url)
+                if status is SKIPPED:
+                    skipped_ids.append(row_id)
+                    continue
+                ids_by_status[status].append(row_id)
+
+            now = timezone.now()
+            if skipped_ids:
+                # Keep the old status, but only become stale again once the retry interval has passed
+                retry_at = now - timedelta(hours=max_age_hours) + timedelta(minutes=VERIFY_RETRY_MINUTES)
+                Opportunity.objects.filter(id__in=skipped_ids).update(last_verified=retry_at)
+                summary['skipped'] += len(skipped_ids)
+            for status, ids in ids_by_status.items():
+                Opportunity.objects.filter(id__in=ids).update(link_status=status, last_verified=now)
+                summary[status] += len(ids)
+                summary['checked'] += len(ids)
+
+        summary['seconds'] = round(time.time() - started, 1)
+        if rows:
+            print(f"🔗 Link verification finished: {summary}")
+        return summary
+
+
+# Create global instance
+link_verifier = LinkVerifier()
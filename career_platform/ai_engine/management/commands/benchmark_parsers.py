@@ -0,0 +1,68 @@
+# ai_engine/management/commands/benchmark_parsers.py
+import os
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand
+
+from ai_engine.scrapers import parsing
+
+FIXTURES_DIR = os.path.join(os.path.dirname(parsing.__file__), 'fixtures')
+
+
+def full_coursera(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return soup.find_all('li', {'class': parsing.COURSERA_CARD_CLASSES})
+
+
+def full_nptel(content):
+    return BeautifulSoup(content, 'html.parser').find_all('a', href=True)
+
+
+# platform -> (fixture, old full-tree parse, new strained parse)
+BENCHMARKS = {
+    'coursera': ('coursera_search.html', full_coursera, parsing.parse_coursera_cards),
+    'nptel': ('nptel_portal.html', full_nptel, parsing.parse_nptel_links),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare full html.parser trees with the strained scraper parsers over saved HTML fixtures'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Parses per platform and parser')
+
+    def measure(self, func, content, iterations):
+        func(content)  # warm up
+        started = time.perf_counter()
+        for _ in range(iterations):
+            result = func(content)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / iterations
+
+        tracemalloc.start()
+        func(content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed_ms, peak / 1024, len(result)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        self.stdout.write(f"Parser: {parsing.PARSER} (lxml available: {parsing.LXML_AVAILABLE}), {iterations} iterations\n")
+        self.stdout.write(f"{'platform':<10} {'page KB':>8} {'mode':<9} {'ms/page':>9} {'peak KB':>9} {'elements':>9}")
+
+        for platform, (fixture, full_parse, fast_parse) in BENCHMARKS.items():
+            with open(os.path.join(FIXTURES_DIR, fixture), 'rb') as f:
+                content = f.read()
+
+            results = {}
+            for mode, func in (('full', full_parse), ('strained', fast_parse)):
+                results[mode] = self.measure(func, content, iterations)
+                ms, peak_kb, count = results[mode]
+                self.stdout.write(f"{platform:<10} {len(content) / 1024:>8.0f} {mode:<9} {ms:>9.2f} {peak_kb:>9.0f} {count:>9}")
+
+            if results['full'][2] != results['strained'][2]:
+                self.stdout.write(self.style.WARNING(f"⚠️ {platform}: strained parser found a different number of elements"))
+            else:
+                speedup = results['full'][0] / results['strained'][0] if results['strained'][0] else 0
+                self.stdout.write(self.style.SUCCESS(f"✅ {platform}: same elements, {speedup:.1f}x faster"))
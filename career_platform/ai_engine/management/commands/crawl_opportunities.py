@@ -0,0 +1,26 @@
+# ai_engine/management/commands/crawl_opportunities.py
+from django.core.management.base import BaseCommand
+
+from ai_engine.crawler import opportunity_crawler
+
+
+class Command(BaseCommand):
+    help = 'Crawl internships and courses into the Opportunity table per skill/branch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--branch', action='append', help='Branch to crawl (repeatable, default: all)')
+        parser.add_argument('--skill', action='append', help='Skill to crawl (repeatable, default: tracked skills)')
+        parser.add_argument('--force', action='store_true', help='Re-crawl slots that are still fresh')
+        parser.add_argument('--max-slots', type=int, default=None, help='Stop after this many slots')
+
+    def handle(self, *args, **options):
+        summary = opportunity_crawler.crawl(
+            branches=options['branch'],
+            skills=options['skill'],
+            force=options['force'],
+            max_slots=options['max_slots'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Crawled {summary['slots']} slots, stored {summary['stored']} opportunities "
+            f"({summary['failed']} failed) in {summary['seconds']}s"
+        ))
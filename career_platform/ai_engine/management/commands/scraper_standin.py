@@ -0,0 +1,81 @@
+# ai_engine/management/commands/scraper_standin.py
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from ai_engine.scrapers.standin import StandinServer
+
+
+class Command(BaseCommand):
+    help = 'Run the offline scraper stand-in server, or benchmark the full scraping path against it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency-ms', type=int, default=200, help='Delay added to every response')
+        parser.add_argument('--jitter-ms', type=int, default=50)
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Share of responses answered with 503')
+        parser.add_argument('--timeout-rate', type=float, default=0.0, help='Share of responses that hang')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--benchmark', type=int, default=0,
+                            help='Instead of serving, time this many course lookups through the stand-in')
+        parser.add_argument('--no-cache', action='store_true', help='Bypass the scraper response cache while benchmarking')
+
+    def handle(self, *args, **options):
+        server = StandinServer(
+            port=0 if options['benchmark'] else options['port'],
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            error_rate=options['error_rate'],
+            timeout_rate=options['timeout_rate'],
+            seed=options['seed'],
+        )
+        if not options['benchmark']:
+            self.stdout.write(f"Set SCRAPER_STANDIN_URL=http://127.0.0.1:{options['port']} to point the scrapers here")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                server.stop()
+            return
+
+        server.start()
+        try:
+            self.run_benchmark(server, options['benchmark'], options['no_cache'])
+        finally:
+            server.stop()
+
+    def run_benchmark(self, server, runs, no_cache):
+        os.environ['SCRAPER_STANDIN_URL'] = server.url
+
+        from ai_engine.scrapers.course_scraper import CourseScraper
+        from ai_engine.scrapers.http_cache import ResponseCache
+        from ai_engine.scrapers.resilience import host_guards
+
+        # One host serves every platform here - don't let the per-host limiter skew timings
+        host_guards.configure(f"127.0.0.1:{server.port}", rate=1000, burst=1000)
+
+        # Fresh throwaway cache so runs start cold and never touch the real one
+        cache_dir = tempfile.mkdtemp(prefix='standin_cache_')
+        scraper = CourseScraper()
+        scraper.session.cache = ResponseCache(cache_dir=cache_dir)
+        scraper.session.cache.enabled = not no_cache
+
+        skill_sets = ['python, sql', 'machine learning, python', 'java, data structures', 'web development, docker']
+        timings = []
+        for i in range(runs):
+            started = time.perf_counter()
+            scraper.get_courses_by_missing_skills(skill_sets[i % len(skill_sets)], 'Computer Science', limit=8)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {runs} lookups: p50 {statistics.median(timings):.0f} ms, p95 {p95:.0f} ms, max {timings[-1]:.0f} ms"
+        ))
+        self.stdout.write(f"Stand-in hits: {dict(server.hits)}")
+        self.stdout.write(f"Cache: {scraper.session.cache.metrics()}")
+        self.stdout.write(f"Circuits: {host_guards.status()}")
+        shutil.rmtree(cache_dir, ignore_errors=True)
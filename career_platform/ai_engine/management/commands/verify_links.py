@@ -0,0 +1,27 @@
+# ai_engine/management/commands/verify_links.py
+from django.core.management.base import BaseCommand
+
+from ai_engine.link_verifier import link_verifier, VERIFY_MAX_AGE_HOURS
+
+
+class Command(BaseCommand):
+    help = 'Concurrently re-check stale Opportunity links and store link_status'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age-hours', type=int, default=VERIFY_MAX_AGE_HOURS,
+                            help='Re-check rows verified longer ago than this')
+        parser.add_argument('--limit', type=int, default=None, help='Check at most this many rows')
+        parser.add_argument('--workers', type=int, default=None, help='Concurrent requests in flight')
+        parser.add_argument('--batch-size', type=int, default=None, help='Rows per batch')
+
+    def handle(self, *args, **options):
+        if options['workers']:
+            link_verifier.max_workers = options['workers']
+        if options['batch_size']:
+            link_verifier.batch_size = options['batch_size']
+
+        summary = link_verifier.verify_stale(max_age_hours=options['max_age_hours'], limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Checked {summary['checked']} links ({summary['active']} active, {summary['broken']} broken, "
+            f"{summary['unknown']} unknown, {summary['skipped']} skipped) in {summary['seconds']}s"
+        ))
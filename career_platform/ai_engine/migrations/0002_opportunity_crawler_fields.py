@@ -0,0 +1,94 @@
+# Generated by Django 5.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_engine", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="opportunity",
+            name="platform",
+            field=models.CharField(
+                choices=[
+                    ("internshala", "Internshala"),
+                    ("naukri", "Naukri"),
+                    ("linkedin", "LinkedIn"),
+                    ("coursera", "Coursera"),
+                    ("nptel", "NPTEL"),
+                    ("geeksforgeeks", "GeeksForGeeks"),
+                    ("udemy", "Udemy"),
+                    ("edx", "edX"),
+                    ("skillshare", "Skillshare"),
+                    ("indeed", "Indeed"),
+                    ("glassdoor", "Glassdoor"),
+                    ("company_careers", "Company Careers"),
+                    ("government", "Government"),
+                    ("startup", "Startup"),
+                    ("other", "Other"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="opportunity",
+            name="url",
+            field=models.URLField(max_length=500),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="branch",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="skill_key",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="provider",
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="location",
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="duration",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="stipend",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="details",
+            field=models.CharField(blank=True, max_length=300),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="relevance_score",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="opportunity",
+            name="last_crawled",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="opportunity",
+            index=models.Index(
+                fields=["opportunity_type", "branch", "skill_key"],
+                name="opportunity_lookup_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_engine", "0002_opportunity_crawler_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="opportunity",
+            name="link_status",
+            field=models.CharField(
+                choices=[
+                    ("unknown", "Unknown"),
+                    ("active", "Active"),
+                    ("broken", "Broken"),
+                ],
+                default="unknown",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="opportunity",
+            name="last_verified",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="opportunity",
+            index=models.Index(
+                fields=["last_verified"], name="opportunity_verified_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-19 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_engine", "0003_opportunity_link_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawlRequest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("branch", models.CharField(max_length=100)),
+                ("skill_key", models.CharField(max_length=100)),
+                ("requested_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("branch", "skill_key")},
+            },
+        ),
+    ]
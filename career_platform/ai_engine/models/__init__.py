@@ -1,5 +1,5 @@
 # ai_engine/models/__init__.py
-from .opportunity import Opportunity, SavedOpportunity
+from .opportunity import Opportunity, SavedOpportunity, CrawlRequest
 from .analytics import StudentAnalytics
 
-__all__ = ['Opportunity', 'SavedOpportunity', 'StudentAnalytics']
\ No newline at end of file
+__all__ = ['Opportunity', 'SavedOpportunity', 'CrawlRequest', 'StudentAnalytics']
\ No newline at end of file
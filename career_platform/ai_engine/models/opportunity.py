@@ -16,24 +16,69 @@ class Opportunity(models.Model):
         ('coursera', 'Coursera'),
         ('nptel', 'NPTEL'),
         ('geeksforgeeks', 'GeeksForGeeks'),
+        ('udemy', 'Udemy'),
+        ('edx', 'edX'),
+        ('skillshare', 'Skillshare'),
+        ('indeed', 'Indeed'),
+        ('glassdoor', 'Glassdoor'),
+        ('company_careers', 'Company Careers'),
+        ('government', 'Government'),
+        ('startup', 'Startup'),
         ('other', 'Other'),
     ]
     
+    LINK_STATUSES = [
+        ('unknown', 'Unknown'),
+        ('active', 'Active'),
+        ('broken', 'Broken'),
+    ]
+    
     title = models.CharField(max_length=200)
     company_org = models.CharField(max_length=200)
     opportunity_type = models.CharField(max_length=20, choices=OPPORTUNITY_TYPES)
     platform = models.CharField(max_length=20, choices=PLATFORMS)
-    url = models.URLField()
+    url = models.URLField(max_length=500)
     skills_required = models.TextField()
     category = models.CharField(max_length=100)
     experience_level = models.CharField(max_length=50)
     salary_info = models.CharField(max_length=100, blank=True)
     is_active = models.BooleanField(default=True)
-    last_verified = models.DateTimeField(auto_now=True)
+    link_status = models.CharField(max_length=20, choices=LINK_STATUSES, default='unknown')
+    # Set by the link verifier (ai_engine/link_verifier.py), not on every save
+    last_verified = models.DateTimeField(null=True, blank=True)
+    
+    # Filled by the background crawler (ai_engine/crawler.py)
+    branch = models.CharField(max_length=100, blank=True)
+    skill_key = models.CharField(max_length=100, blank=True)
+    provider = models.CharField(max_length=200, blank=True)
+    location = models.CharField(max_length=200, blank=True)
+    duration = models.CharField(max_length=100, blank=True)
+    stipend = models.CharField(max_length=100, blank=True)
+    details = models.CharField(max_length=300, blank=True)
+    relevance_score = models.IntegerField(default=0)
+    last_crawled = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['opportunity_type', 'branch', 'skill_key'], name='opportunity_lookup_idx'),
+            models.Index(fields=['last_verified'], name='opportunity_verified_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.company_org} ({self.platform})"
 
+class CrawlRequest(models.Model):
+    # Slot missed at request time - queued by LinkManager, crawled first by the next crawl run
+    branch = models.CharField(max_length=100)
+    skill_key = models.CharField(max_length=100)
+    requested_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ['branch', 'skill_key']
+    
+    def __str__(self):
+        return f"{self.skill_key} ({self.branch})"
+
 class SavedOpportunity(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     opportunity = models.ForeignKey(Opportunity, on_delete=models.CASCADE)
@@ -1,14 +1,25 @@
 # ai_engine/scrapers/course_scraper.py - ENHANCED VERSION
+import os
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, wait
+from .http_cache import CachedSession
+from .parsing import parse_coursera_cards, parse_nptel_links
 import time
 import random
 
+# Global deadline for one concurrent scrape - worst case is ONE timeout, not the sum
+SCRAPER_DEADLINE_SECONDS = float(os.getenv('SCRAPER_DEADLINE_SECONDS', '10'))
+SCRAPER_MAX_WORKERS = int(os.getenv('SCRAPER_MAX_WORKERS', '16'))
+
+# Shared pool for platform and per-skill requests. Never used as a context manager:
+# shutting it down would block on stragglers that already missed the deadline.
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPER_MAX_WORKERS, thread_name_prefix='course-scraper')
+
 class CourseScraper:
     """ENHANCED web scraper for course platforms with BRANCH-SPECIFIC courses"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = CachedSession()  # shared disk cache for repeated searches
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -52,7 +63,20 @@ class CourseScraper:
             }
         }
     
-    def get_coursera_courses(self, skills, branch='Computer Science', limit=6):
+    @staticmethod
+    def request_timeout(deadline, default):
+        """Per-request timeout that never outlives the caller's deadline (a time.monotonic() value)"""
+        if deadline is None:
+            return default
+        return max(0.1, min(default, deadline - time.monotonic()))
+    
+    @staticmethod
+    def cancel_pending(not_done):
+        """Drop queued requests that missed the deadline so they don't hold pool slots"""
+        for future in not_done:
+            future.cancel()
+    
+    def get_coursera_courses(self, skills, branch='Computer Science', limit=6, deadline=None):
         """Get REAL courses from Coursera with branch-specific optimization"""
         print(f"🔍 REAL Searching Coursera for: {skills} (Branch: {branch})")
         
@@ -62,12 +86,10 @@ class CourseScraper:
             search_query = "+".join(mapped_skills[:3])  # Use top 3 mapped skills
             
             url = f"https://www.coursera.org/search?query={search_query}"
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            response = self.session.get(url, timeout=self.request_timeout(deadline, 10))
             courses = []
-            # Updated selectors for Coursera
-            course_elements = soup.find_all('li', {'class': ['cds-9', 'cds-ProductCard-col']})[:limit*2]
+            # Updated selectors for Coursera - only the result cards are parsed
+            course_elements = parse_coursera_cards(response.content, limit*2)
             
             for element in course_elements:
                 try:
@@ -109,7 +131,7 @@ class CourseScraper:
             print(f"❌ Coursera scraping failed: {e}")
             return self.get_branch_specific_fallback_courses(skills, branch, limit)
     
-    def get_nptel_courses(self, skills, branch='Computer Science', limit=6):
+    def get_nptel_courses(self, skills, branch='Computer Science', limit=6, deadline=None):
         """Get REAL NPTEL courses with branch-specific optimization"""
         print(f"🔍 REAL Searching NPTEL for: {skills} (Branch: {branch})")
         
@@ -123,11 +145,9 @@ class CourseScraper:
             }
             
             portal_url = branch_portals.get(branch, 'https://onlinecourses.nptel.ac.in/')
-            response = self.session.get(portal_url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            response = self.session.get(portal_url, timeout=self.request_timeout(deadline, 10))
             courses = []
-            course_links = soup.find_all('a', href=True)
+            course_links = parse_nptel_links(response.content)
             
             skill_list = [skill.strip().lower() for skill in skills.split(',')]
             
@@ -173,45 +193,61 @@ class CourseScraper:
         print(f"🔍 Searching GeeksForGeeks for: {skills} (Branch: {branch})")
         
         try:
-            # GFG has different sections for different skills
-            skill_mappings = {
-                'python': 'python-programming',
-                'java': 'java-programming',
-                'data structures': 'data-structures',
-                'algorithms': 'algorithms',
-                'machine learning': 'machine-learning',
-                'web development': 'web-development'
-            }
-            
-            all_courses = []
+            deadline = time.monotonic() + SCRAPER_DEADLINE_SECONDS
+            targets = self.get_gfg_targets(skills)
+            futures = [scrape_executor.submit(self.fetch_gfg_course, skill, url, branch, deadline) for skill, url in targets]
+            done, not_done = wait(futures, timeout=SCRAPER_DEADLINE_SECONDS)
+            self.cancel_pending(not_done)
+            return self.build_gfg_courses(self.collect_results(futures, done), skills, branch, limit)
             
-            for skill in skills.split(','):
-                skill = skill.strip().lower()
-                mapped_skill = skill_mappings.get(skill, skill)
-                url = f"https://www.geeksforgeeks.org/{mapped_skill}-course/"
-                
-                try:
-                    response = self.session.get(url, timeout=8)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # Look for course content
-                        course_data = {
-                            'title': f"{skill.title()} - GFG Course",
-                            'platform': 'geeksforgeeks',
-                            'provider': 'GeeksForGeeks',
-                            'url': url,
-                            'skills_covered': skill.title(),
-                            'duration': '4-8 weeks',
-                            'level': 'Beginner to Intermediate',
-                            'free': True,
-                            'rating': 4.6,
-                            'category': f'{branch} - Programming',
-                            'relevance_score': 85
-                        }
-                        all_courses.append(course_data)
-                except:
-                    continue
+        except Exception as e:
+            print(f"❌ GeeksForGeeks scraping failed: {e}")
+            return self.get_branch_specific_fallback_courses(skills, branch, limit)
+    
+    def get_gfg_targets(self, skills):
+        """(skill, course url) pairs for every requested skill"""
+        # GFG has different sections for different skills
+        skill_mappings = {
+            'python': 'python-programming',
+            'java': 'java-programming',
+            'data structures': 'data-structures',
+            'algorithms': 'algorithms',
+            'machine learning': 'machine-learning',
+            'web development': 'web-development'
+        }
+        targets = []
+        for skill in skills.split(','):
+            skill = skill.strip().lower()
+            mapped_skill = skill_mappings.get(skill, skill)
+            targets.append((skill, f"https://www.geeksforgeeks.org/{mapped_skill}-course/"))
+        return targets
+    
+    def fetch_gfg_course(self, skill, url, branch, deadline=None):
+        """Check one GFG course page - returns course data or None"""
+        try:
+            response = self.session.get(url, timeout=self.request_timeout(deadline, 8))
+            if response.status_code == 200:
+                return {
+                    'title': f"{skill.title()} - GFG Course",
+                    'platform': 'geeksforgeeks',
+                    'provider': 'GeeksForGeeks',
+                    'url': url,
+                    'skills_covered': skill.title(),
+                    'duration': '4-8 weeks',
+                    'level': 'Beginner to Intermediate',
+                    'free': True,
+                    'rating': 4.6,
+                    'category': f'{branch} - Programming',
+                    'relevance_score': 85
+                }
+        except Exception:
+            pass
+        return None
+    
+    def build_gfg_courses(self, fetched_courses, skills, branch, limit):
+        """Merge fetched GFG courses, falling back to GFG's main courses"""
+        try:
+            all_courses = [course for course in fetched_courses if course]
             
             # Add GFG's main courses as fallback
             if not all_courses:
@@ -240,7 +276,7 @@ class CourseScraper:
             
         except Exception as e:
             print(f"❌ GeeksForGeeks scraping failed: {e}")
-            return self.get_branch_specific_gfg_courses(skills, branch, limit)
+            return self.get_branch_specific_fallback_courses(skills, branch, limit)
     
     def get_udemy_courses(self, skills, branch='Computer Science', limit=6):
         """Get Udemy courses with REAL active URLs and branch-specific content"""
@@ -453,22 +489,50 @@ class CourseScraper:
         
         return fallback_courses[:limit]
     
+    def collect_results(self, futures, done):
+        """Results of the finished futures (in submit order), skipping failures"""
+        results = []
+        for future in futures:
+            if future in done and future.exception() is None and future.result() is not None:
+                results.append(future.result())
+        return results
+    
     def get_courses_by_missing_skills(self, missing_skills, branch, limit=8):
         """Get courses specifically for missing skills with branch context"""
         print(f"🎯 Getting BRANCH-SPECIFIC courses for: {missing_skills} in {branch}")
         
-        all_courses = []
+        started = time.time()
+        deadline = time.monotonic() + SCRAPER_DEADLINE_SECONDS
         
-        # Get courses from multiple platforms with branch context
-        coursera_courses = self.get_coursera_courses(missing_skills, branch, limit=3)
-        nptel_courses = self.get_nptel_courses(missing_skills, branch, limit=3)
-        gfg_courses = self.get_geeksforgeeks_courses(missing_skills, branch, limit=3)
-        udemy_courses = self.get_udemy_courses(missing_skills, branch, limit=3)
+        # Fan out every platform and every GFG per-skill request at once
+        platform_futures = {
+            'coursera': scrape_executor.submit(self.get_coursera_courses, missing_skills, branch, 3, deadline),
+            'nptel': scrape_executor.submit(self.get_nptel_courses, missing_skills, branch, 3, deadline),
+            'udemy': scrape_executor.submit(self.get_udemy_courses, missing_skills, branch, 3),
+        }
+        gfg_futures = [
+            scrape_executor.submit(self.fetch_gfg_course, skill, url, branch, deadline)
+            for skill, url in self.get_gfg_targets(missing_skills)
+        ]
         
-        all_courses.extend(coursera_courses)
-        all_courses.extend(nptel_courses)
+        # One global deadline for everything - merge whatever came back
+        done, not_done = wait(list(platform_futures.values()) + gfg_futures, timeout=SCRAPER_DEADLINE_SECONDS)
+        if not_done:
+            print(f"⏱️ Course scrape deadline hit: {len(not_done)} requests still pending, using fallbacks")
+            self.cancel_pending(not_done)
+        
+        platform_courses = {}
+        for platform, future in platform_futures.items():
+            results = self.collect_results([future], done)
+            platform_courses[platform] = results[0] if results else self.get_branch_specific_fallback_courses(missing_skills, branch, 3)
+        gfg_courses = self.build_gfg_courses(self.collect_results(gfg_futures, done), missing_skills, branch, 3)
+        
+        all_courses = []
+        all_courses.extend(platform_courses['coursera'])
+        all_courses.extend(platform_courses['nptel'])
         all_courses.extend(gfg_courses)
-        all_courses.extend(udemy_courses)
+        all_courses.extend(platform_courses['udemy'])
+        print(f"⚡ Course fan-out finished in {time.time() - started:.2f}s")
         
         # Sort by relevance score
         all_courses.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
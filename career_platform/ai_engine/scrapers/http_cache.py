@@ -0,0 +1,236 @@
+# ai_engine/scrapers/http_cache.py
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .endpoints import resolve_url
+from .resilience import GuardedSession
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'career_connect_http_cache')
+
+# How long a cached page is served without asking the site again (seconds)
+DEFAULT_TTL = int(os.getenv('SCRAPER_CACHE_TTL', '3600'))
+HOST_TTLS = {
+    'www.coursera.org': 6 * 3600,
+    'nptel.ac.in': 24 * 3600,
+    'onlinecourses.nptel.ac.in': 24 * 3600,
+    'www.geeksforgeeks.org': 12 * 3600,
+    'internshala.com': 3600,
+    'www.naukri.com': 3600,
+    'www.linkedin.com': 3600,
+}
+
+# Only these statuses are worth remembering (404 keeps dead GFG pages from being re-fetched)
+CACHEABLE_STATUS = (200, 404)
+
+
+def normalize_url(url, params=None):
+    """Cache key for a GET - lower-cased host, sorted and lower-cased query, no fragment"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=False)
+    if params:
+        query.extend((str(k), str(v)) for k, v in dict(params).items() if v not in (None, ''))
+    query = sorted((k.strip().lower(), v.strip().lower()) for k, v in query)
+    path = parts.path or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+class ResponseCache:
+    """Disk-backed (sqlite) HTTP response cache shared by every scraper.
+
+    Entries expire after a per-host TTL; expired entries that carry an ETag or
+    Last-Modified are revalidated with a conditional GET instead of being
+    downloaded again. The store is bounded by ``SCRAPER_CACHE_MAX_MB`` and evicts
+    the least recently used entries first.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None, default_ttl=DEFAULT_TTL, host_ttls=None):
+        self.cache_dir = cache_dir or os.getenv('SCRAPER_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes or int(float(os.getenv('SCRAPER_CACHE_MAX_MB', '100')) * 1024 * 1024)
+        self.default_ttl = default_ttl
+        self.host_ttls = dict(HOST_TTLS, **(host_ttls or {}))
+        self.enabled = os.getenv('SCRAPER_CACHE_ENABLED', 'True') == 'True'
+        self._lock = threading.Lock()
+        self._conn = None
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stale_served': 0, 'stores': 0, 'evictions': 0}
+
+    # ---------- storage ----------
+
+    def _connection(self):
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.cache_dir, 'responses.sqlite3'), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, body BLOB,'
+                ' etag TEXT, last_modified TEXT, expires_at REAL, last_access REAL, size INTEGER)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)')
+            self._conn = conn
+        return self._conn
+
+    def ttl_for(self, url):
+        return self.host_ttls.get(urlsplit(url).netloc.lower(), self.default_ttl)
+
+    def get(self, key):
+        """Cached entry for a key (fresh or stale) or None"""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT url, status, headers, body, etag, last_modified, expires_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+
+        url, status, headers, body, etag, last_modified, expires_at = row
+        return {
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': expires_at > time.time(),
+        }
+
+    def store(self, key, response):
+        """Save a response and evict least recently used entries over the size limit"""
+        body = response.content or b''
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in ('set-cookie', 'content-encoding', 'transfer-encoding')}
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, response.url, response.status_code, json.dumps(headers), sqlite3.Binary(body),
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now + self.ttl_for(key), now, len(body))
+            )
+            self.stats['stores'] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def refresh(self, key):
+        """Entry was revalidated (304) - start a new TTL window"""
+        with self._lock:
+            now = time.time()
+            self._connection().execute(
+                'UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?',
+                (now + self.ttl_for(key), now, key)
+            )
+            self._conn.commit()
+
+    def _evict(self, conn):
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute('SELECT key, size FROM responses ORDER BY last_access').fetchall():
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self.stats['evictions'] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock:
+            self._connection().execute('DELETE FROM responses')
+            self._conn.commit()
+
+    def metrics(self):
+        """Hit/miss counters plus current size of the store"""
+        lookups = self.stats['hits'] + self.stats['revalidated'] + self.stats['misses']
+        metrics = dict(self.stats)
+        metrics['hit_rate'] = round((self.stats['hits'] + self.stats['revalidated']) * 100.0 / lookups, 1) if lookups else 0.0
+        metrics['enabled'] = self.enabled
+        try:
+            with self._lock:
+                entries, size = self._connection().execute(
+                    'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+                ).fetchone()
+            metrics['entries'] = entries
+            metrics['size_mb'] = round(size / (1024 * 1024), 2)
+        except sqlite3.Error as e:
+            metrics['error'] = str(e)
+        return metrics
+
+
+def build_cached_response(entry, request_url):
+    """Turn a cache entry back into a requests.Response"""
+    response = requests.Response()
+    response.status_code = entry['status']
+    response._content = entry['body']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response.url = entry['url'] or request_url
+    response.reason = 'OK' if entry['status'] == 200 else ''
+    response.from_cache = True
+    return response
+
+
+class CachedSession(GuardedSession):
+    """Rate limited, circuit broken session whose GETs go through the shared disk cache"""
+
+    def __init__(self, cache=None):
+        super().__init__()
+        self.cache = cache or response_cache
+
+    def get(self, url, **kwargs):
+        if not self.cache.enabled or kwargs.get('stream'):
+            return super().get(url, **kwargs)
+
+        # Key on the URL actually fetched so stand-in pages never mix with real ones
+        key = normalize_url(resolve_url(url), kwargs.get('params'))
+        try:
+            entry = self.cache.get(key)
+        except sqlite3.Error as e:
+            print(f"⚠️ Scraper cache unavailable: {e}")
+            return super().get(url, **kwargs)
+
+        if entry and entry['fresh']:
+            self.cache.stats['hits'] += 1
+            return build_cached_response(entry, url)
+
+        # Stale entry with validators - ask the site whether it changed
+        if entry and (entry['etag'] or entry['last_modified']):
+            headers = dict(kwargs.pop('headers', None) or {})
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs['headers'] = headers
+
+        try:
+            response = super().get(url, **kwargs)
+        except requests.RequestException:
+            if entry:
+                # Site is down - an old page beats no page
+                self.cache.stats['stale_served'] += 1
+                return build_cached_response(entry, url)
+            raise
+
+        if response.status_code == 304 and entry:
+            self.cache.stats['revalidated'] += 1
+            self.cache.refresh(key)
+            return build_cached_response(entry, url)
+
+        self.cache.stats['misses'] += 1
+        if response.status_code in CACHEABLE_STATUS and 'no-store' not in response.headers.get('Cache-Control', ''):
+            try:
+                self.cache.store(key, response)
+            except sqlite3.Error as e:
+                print(f"⚠️ Scraper cache write failed: {e}")
+        response.from_cache = False
+        return response
+
+
+# Create global instance
+response_cache = ResponseCache()
@@ -4,12 +4,13 @@ from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import quote
+from .http_cache import CachedSession
 
 class InternshipScraper:
     """ENHANCED web scraper with REAL WORKABLE internship links"""
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = CachedSession()  # shared disk cache for repeated searches
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -282,24 +283,14 @@ class InternshipScraper:
         return location_map.get(company, 'Multiple Locations')
 
     def verify_links(self, internships):
-        """Verify if links are accessible (optional - can be slow)"""
-        verified_internships = []
+        """Verify if links are accessible - concurrent HEAD checks, one per unique URL"""
+        from ..link_verifier import link_verifier
         
+        results = link_verifier.check_urls(internship['url'] for internship in internships)
         for internship in internships:
-            try:
-                # Quick HEAD request to check if link exists
-                response = self.session.head(internship['url'], timeout=5)
-                if response.status_code in [200, 301, 302]:
-                    internship['link_status'] = 'active'
-                    verified_internships.append(internship)
-                else:
-                    internship['link_status'] = 'unknown'
-                    verified_internships.append(internship)
-            except:
-                internship['link_status'] = 'unknown'
-                verified_internships.append(internship)
+            internship['link_status'] = results.get(internship['url']) or 'unknown'
         
-        return verified_internships
+        return internships
 
     def get_internships_by_skills(self, skills, branch, limit=10):
         """MAIN METHOD: Get REAL workable internship links"""
@@ -0,0 +1,81 @@
+# ai_engine/scrapers/link_loader.py
+
+
+class LinkBatchLoader:
+    """Request-scoped batching + dedupe for LinkManager lookups.
+
+    Queue every lookup a response needs with ``prefetch_*``, call ``load()`` once,
+    then read results back with ``get_*``. Identical (skills, category, branch,
+    limit) lookups are resolved a single time and fanned back out. The job title
+    is left out of the key because LinkManager only uses it for logging.
+    """
+
+    def __init__(self, link_manager):
+        self.link_manager = link_manager
+        self._pending = {}
+        self._results = {}
+        self.requested = 0
+
+    @staticmethod
+    def normalize_skills(skills):
+        if isinstance(skills, (list, tuple)):
+            skills = ', '.join(skills)
+        return tuple(s.strip().lower() for s in (skills or '').split(',') if s.strip())
+
+    def _key(self, kind, skills, category, branch, limit):
+        return (kind, self.normalize_skills(skills), (category or '').lower(), branch or '', limit)
+
+    def _queue(self, kind, job_title, skills, category, branch, limit):
+        key = self._key(kind, skills, category, branch, limit)
+        self.requested += 1
+        if key not in self._results and key not in self._pending:
+            self._pending[key] = (job_title, skills, category, branch, limit)
+        return key
+
+    def prefetch_opportunity_links(self, job_title, skills, category, branch, limit=6):
+        return self._queue('internship', job_title, skills, category, branch, limit)
+
+    def prefetch_course_links(self, missing_skills, category, branch, limit=6):
+        return self._queue('course', None, missing_skills, category, branch, limit)
+
+    def _resolve(self, key, args):
+        job_title, skills, category, branch, limit = args
+        if key[0] == 'internship':
+            return self.link_manager.get_opportunity_links(job_title, skills, category, branch, limit=limit)
+        return self.link_manager.get_course_links(skills, category, branch, limit=limit)
+
+    def load(self):
+        """Resolve every queued unique lookup once"""
+        pending, self._pending = self._pending, {}
+        for key, args in pending.items():
+            try:
+                self._results[key] = self._resolve(key, args)
+            except Exception as e:
+                print(f"⚠️ Link lookup failed for {key[0]} {key[1]}: {e}")
+                self._results[key] = []
+
+    def _get(self, key):
+        if key not in self._results:
+            self.load()
+        # Copies so one recommendation can't change another's links
+        return [dict(link) for link in self._results.get(key, [])]
+
+    def get_opportunity_links(self, job_title, skills, category, branch, limit=6):
+        key = self._key('internship', skills, category, branch, limit)
+        if key not in self._results and key not in self._pending:
+            self.prefetch_opportunity_links(job_title, skills, category, branch, limit)
+        return self._get(key)
+
+    def get_course_links(self, missing_skills, category, branch, limit=6):
+        key = self._key('course', missing_skills, category, branch, limit)
+        if key not in self._results and key not in self._pending:
+            self.prefetch_course_links(missing_skills, category, branch, limit)
+        return self._get(key)
+
+    def stats(self):
+        unique = len(self._results) + len(self._pending)
+        return {
+            'lookups_requested': self.requested,
+            'unique_lookups': unique,
+            'calls_saved': self.requested - unique,
+        }
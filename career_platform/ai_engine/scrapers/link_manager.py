@@ -2,44 +2,115 @@
 from .internship_scraper import InternshipScraper
 from .course_scraper import CourseScraper
 
+
+def format_internship_link(internship):
+    """Internship dict from InternshipScraper -> link shown in the UI"""
+    # Format details based on available information
+    details_parts = []
+    if internship.get('stipend'):
+        details_parts.append(internship['stipend'])
+    elif internship.get('salary'):
+        details_parts.append(internship['salary'])
+    else:
+        details_parts.append('Competitive')
+    
+    details_parts.append(internship['location'])
+    details_parts.append(internship.get('duration', 'Flexible'))
+    
+    return {
+        'type': 'internship',
+        'platform': internship['platform'],
+        'title': internship['title'],
+        'url': internship['url'],
+        'company': internship['company'],
+        'details': ' • '.join(details_parts),
+        'relevance_score': internship.get('relevance_score', 75)
+    }
+
+
+def format_course_link(course):
+    """Course dict from CourseScraper -> link shown in the UI"""
+    price_info = "Free" if course.get('free', False) else "Paid"
+    rating = course.get('rating', 4.5)
+    level = course.get('level', 'All Levels')
+    
+    return {
+        'type': 'course',
+        'platform': course['platform'],
+        'title': course['title'],
+        'url': course['url'],
+        'provider': course.get('provider', course['platform']),
+        'details': f"{course.get('duration', 'Self-paced')} • {level} • {price_info} • ⭐{rating}",
+        'relevance_score': course.get('relevance_score', 75)
+    }
+
+
 class LinkManager:
-    """ENHANCED manager for REAL branch-specific links"""
+    """ENHANCED manager for REAL branch-specific links.
+    
+    Links are read from the Opportunity table, which the background crawler
+    (ai_engine/crawler.py) keeps fresh. Nothing here touches the network: on a
+    miss the slot is queued for crawling and the built-in offline links are used.
+    """
     
     def __init__(self):
         self.internship_scraper = InternshipScraper()
         self.course_scraper = CourseScraper()
     
+    def get_stored_links(self, opportunity_type, skills, branch, limit):
+        """Indexed read of crawled opportunities for (type, branch, skills)"""
+        from ..crawler import skill_keys, opportunity_crawler
+        from ..models.opportunity import Opportunity
+        
+        keys = skill_keys(skills)
+        try:
+            rows = (
+                Opportunity.objects
+                .filter(opportunity_type=opportunity_type, branch=branch, skill_key__in=keys, is_active=True)
+                .exclude(link_status='broken')
+                .order_by('-relevance_score', 'id')
+                .values('platform', 'title', 'url', 'company_org', 'provider', 'details', 'relevance_score')[:limit * 3]
+            )
+            rows = list(rows)
+        except Exception as e:
+            print(f"⚠️ Stored opportunities unavailable: {e}")
+            return []
+        
+        if not rows:
+            opportunity_crawler.queue_slots(branch, skills)
+            return []
+        
+        links = []
+        seen_urls = set()
+        for row in rows:
+            if row['url'] in seen_urls:
+                continue
+            seen_urls.add(row['url'])
+            link = {
+                'type': opportunity_type,
+                'platform': row['platform'],
+                'title': row['title'],
+                'url': row['url'],
+                'details': row['details'],
+                'relevance_score': row['relevance_score']
+            }
+            if opportunity_type == 'course':
+                link['provider'] = row['provider'] or row['platform']
+            else:
+                link['company'] = row['company_org']
+            links.append(link)
+        return links[:limit]
+    
     def get_opportunity_links(self, job_title, skills, category, branch, limit=6):
         """Get REAL internship/job links with branch-specific optimization"""
         print(f"🔗 Getting BRANCH-SPECIFIC links for {job_title} (Branch: {branch})...")
         
-        all_links = []
-        
-        # Get internship links based on skills and branch
-        internships = self.internship_scraper.get_internships_by_skills(skills, branch, limit=limit)
+        all_links = self.get_stored_links('internship', skills, branch, limit)
         
-        for internship in internships:
-            # Format details based on available information
-            details_parts = []
-            if internship.get('stipend'):
-                details_parts.append(internship['stipend'])
-            elif internship.get('salary'):
-                details_parts.append(internship['salary'])
-            else:
-                details_parts.append('Competitive')
-            
-            details_parts.append(internship['location'])
-            details_parts.append(internship.get('duration', 'Flexible'))
-            
-            all_links.append({
-                'type': 'internship',
-                'platform': internship['platform'],
-                'title': internship['title'],
-                'url': internship['url'],
-                'company': internship['company'],
-                'details': ' • '.join(details_parts),
-                'relevance_score': internship.get('relevance_score', 75)
-            })
+        if not all_links:
+            # Offline fallback - InternshipScraper's curated links need no network
+            internships = self.internship_scraper.get_internships_by_skills(skills, branch, limit=limit)
+            all_links = [format_internship_link(internship) for internship in internships]
         
         # Sort by relevance
         all_links.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
@@ -50,25 +121,13 @@ class LinkManager:
         """Get REAL course links for skill development with branch context"""
         print(f"🔗 Getting BRANCH-SPECIFIC course links for {missing_skills} (Branch: {branch})...")
         
-        all_courses = []
+        all_courses = self.get_stored_links('course', missing_skills, branch, limit)
         
-        # Get course links from multiple platforms with branch context
-        courses = self.course_scraper.get_courses_by_missing_skills(missing_skills, branch, limit=limit)
-        
-        for course in courses:
-            price_info = "Free" if course.get('free', False) else "Paid"
-            rating = course.get('rating', 4.5)
-            level = course.get('level', 'All Levels')
-            
-            all_courses.append({
-                'type': 'course',
-                'platform': course['platform'],
-                'title': course['title'],
-                'url': course['url'],
-                'provider': course.get('provider', course['platform']),
-                'details': f"{course.get('duration', 'Self-paced')} • {level} • {price_info} • ⭐{rating}",
-                'relevance_score': course.get('relevance_score', 75)
-            })
+        if not all_courses:
+            # Offline fallback - static Udemy + platform search links, no scraping on request
+            courses = self.course_scraper.get_udemy_courses(missing_skills, branch, limit=limit)
+            courses += self.course_scraper.get_branch_specific_fallback_courses(missing_skills, branch, limit)
+            all_courses = [format_course_link(course) for course in courses]
         
         # Sort by relevance
         all_courses.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
@@ -0,0 +1,46 @@
+# ai_engine/scrapers/parsing.py
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401 - only needed as the BeautifulSoup tree builder
+    LXML_AVAILABLE = True
+    print("✅ lxml available for fast scraper parsing")
+except ImportError:
+    LXML_AVAILABLE = False
+    print("⚠️ lxml not available - scrapers parse with html.parser. Install: pip install lxml")
+
+PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Coursera result cards - the only part of the search page the scraper reads
+COURSERA_CARD_CLASSES = ['cds-9', 'cds-ProductCard-col']
+
+
+def has_card_class(value):
+    """Strainer test - the class attribute arrives as one string while parsing"""
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else value
+    return any(c in COURSERA_CARD_CLASSES for c in classes)
+
+
+COURSERA_CARDS = SoupStrainer('li', attrs={'class': has_card_class})
+
+# NPTEL portals - the scraper only looks at links
+NPTEL_LINKS = SoupStrainer('a', href=True)
+
+
+def make_soup(content, parse_only=None, parser=None):
+    """BeautifulSoup that only builds the strained subtree, with lxml when available"""
+    return BeautifulSoup(content, parser or PARSER, parse_only=parse_only)
+
+
+def parse_coursera_cards(content, limit=None):
+    """Coursera search page -> result card elements"""
+    soup = make_soup(content, COURSERA_CARDS)
+    cards = soup.find_all('li', {'class': COURSERA_CARD_CLASSES})
+    return cards[:limit] if limit else cards
+
+
+def parse_nptel_links(content):
+    """NPTEL portal page -> every <a href> element"""
+    return make_soup(content, NPTEL_LINKS).find_all('a', href=True)
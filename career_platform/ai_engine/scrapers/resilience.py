@@ -0,0 +1,184 @@
+# ai_engine/scrapers/resilience.py
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from .endpoints import resolve_url
+
+RATE_PER_SECOND = float(os.getenv('SCRAPER_RATE_PER_HOST', '2'))
+RATE_BURST = int(os.getenv('SCRAPER_RATE_BURST', '5'))
+RATE_MAX_WAIT = float(os.getenv('SCRAPER_RATE_MAX_WAIT', '2'))
+BREAKER_FAILURES = int(os.getenv('SCRAPER_BREAKER_FAILURES', '5'))
+BREAKER_RESET_SECONDS = float(os.getenv('SCRAPER_BREAKER_RESET', '60'))
+
+
+class CircuitOpenError(requests.RequestException):
+    """Host is failing - request skipped so callers go straight to their fallback"""
+
+
+class RateLimitedError(requests.RequestException):
+    """No token became available for the host within the allowed wait"""
+
+
+class TokenBucket:
+    """Classic token bucket - ``rate`` tokens per second, up to ``burst`` stored"""
+
+    def __init__(self, rate=RATE_PER_SECOND, burst=RATE_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait=RATE_MAX_WAIT):
+        """Take a token, sleeping up to ``max_wait`` seconds for one"""
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Opens after N consecutive failures, lets one probe through after the reset timeout"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=BREAKER_FAILURES, reset_timeout=BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    print(f"🔌 Circuit opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        with self._lock:
+            self._probe_in_flight = False
+
+    def status(self):
+        retry_in = None
+        if self.state == self.OPEN:
+            retry_in = max(0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1))
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'rejected_requests': self.rejected,
+            'retry_in_seconds': retry_in,
+        }
+
+
+class HostGuards:
+    """One token bucket + circuit breaker per host, shared by every scraper session"""
+
+    def __init__(self):
+        self._guards = {}
+        self._lock = threading.Lock()
+
+    def get(self, host):
+        with self._lock:
+            if host not in self._guards:
+                self._guards[host] = (TokenBucket(), CircuitBreaker())
+            return self._guards[host]
+
+    def configure(self, host, rate=None, burst=None):
+        """Override the token bucket for one host (e.g. a local stand-in)"""
+        bucket, _ = self.get(host)
+        with bucket._lock:
+            bucket.rate = rate or bucket.rate
+            bucket.burst = burst or bucket.burst
+            bucket.tokens = float(bucket.burst)
+
+    def status(self):
+        with self._lock:
+            guards = dict(self._guards)
+        return {host: breaker.status() for host, (_, breaker) in sorted(guards.items())}
+
+
+class GuardedSession(requests.Session):
+    """requests.Session with per-host rate limiting and circuit breaking"""
+
+    def __init__(self, guards=None):
+        super().__init__()
+        self.guards = guards or host_guards
+
+    def request(self, method, url, *args, **kwargs):
+        # Honour SCRAPER_BASE_URLS / SCRAPER_STANDIN_URL (e.g. the offline stand-in server)
+        url = resolve_url(url)
+        host = urlsplit(url).netloc.lower()
+        bucket, breaker = self.guards.get(host)
+
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {host}")
+        if not bucket.acquire():
+            # Not the host's fault - give the probe slot back without counting a failure
+            breaker.release_probe()
+            raise RateLimitedError(f"Rate limit reached for {host}")
+
+        settled = False
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code >= 500 or response.status_code == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            settled = True
+            return response
+        except requests.RequestException:
+            # Timeouts, resets, bad redirects/encodings - all count against the host
+            breaker.record_failure()
+            settled = True
+            raise
+        finally:
+            if not settled:
+                # Anything else (a bug, an interrupt) must not leave a half-open probe stuck
+                breaker.release_probe()
+
+
+# Create global instance
+host_guards = HostGuards()
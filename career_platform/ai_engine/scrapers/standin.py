@@ -0,0 +1,138 @@
+# ai_engine/scrapers/standin.py
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# First path segment -> recorded response replayed for every path under it
+PLATFORM_FIXTURES = {
+    'coursera': 'coursera_search.html',
+    'nptel': 'nptel_portal.html',
+    'geeksforgeeks': 'geeksforgeeks_course.html',
+}
+
+
+class StandinServer:
+    """Local stand-in for the pages CourseScraper fetches (Coursera/NPTEL/GFG), replayed from fixtures.
+
+    Requests look like ``/<platform>/<original path>``. Every response waits
+    ``latency_ms`` (+/- ``jitter_ms``); ``error_rate`` of them answer 503 and
+    ``timeout_rate`` hang for ``hang_seconds`` so client timeouts, circuit
+    breakers, caching (ETag / 304) and concurrency can all be exercised offline.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, latency_ms=200, jitter_ms=50,
+                 error_rate=0.0, timeout_rate=0.0, hang_seconds=30, seed=None):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.random = random.Random(seed)
+        self.hits = Counter()
+        self.fixtures = self.load_fixtures()
+        self._server = None
+        self._thread = None
+
+    def load_fixtures(self):
+        fixtures = {}
+        for platform, filename in PLATFORM_FIXTURES.items():
+            path = os.path.join(FIXTURES_DIR, filename)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    body = f.read()
+                fixtures[platform] = (body, '"%s"' % hashlib.sha1(body).hexdigest()[:16])
+        return fixtures
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def plan_response(self, platform):
+        """Decide delay and outcome for one request: ('ok' | 'error' | 'hang', seconds)"""
+        delay = max(0.0, (self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000)
+        roll = self.random.random()
+        if roll < self.timeout_rate:
+            return 'hang', self.hang_seconds
+        if roll < self.timeout_rate + self.error_rate:
+            return 'error', delay
+        return 'ok', delay
+
+    def make_handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def respond(self, send_body):
+                platform = self.path.lstrip('/').split('/', 1)[0]
+                standin.hits[platform] += 1
+                outcome, delay = standin.plan_response(platform)
+                time.sleep(delay)
+
+                if platform not in standin.fixtures:
+                    return self.send_simple(404, send_body)
+                if outcome != 'ok':
+                    return self.send_simple(503, send_body)
+
+                body, etag = standin.fixtures[platform]
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def send_simple(self, status, send_body):
+                body = b'stand-in error' if status >= 500 else b'not recorded'
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self.respond(True)
+
+            def do_HEAD(self):
+                self.respond(False)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve in a daemon thread (port 0 picks a free port)"""
+        self._server = ThreadingHTTPServer((self.host, self.port), self.make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='scraper-standin', daemon=True)
+        self._thread.start()
+        print(f"🧪 Scraper stand-in serving {sorted(self.fixtures)} at {self.url}")
+        return self
+
+    def serve_forever(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), self.make_handler())
+        self._server.daemon_threads = True
+        print(f"🧪 Scraper stand-in serving {sorted(self.fixtures)} at {self.url}")
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
@@ -0,0 +1,252 @@
+# ai_engine/search_index.py
+import math
+import re
+import threading
+import time
+from collections import defaultdict, Counter
+
+import numpy as np
+from django.db.models import Count, Max
+
+from .core.skill_knowledge import skill_knowledge
+from .models.opportunity import Opportunity
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+STOPWORDS = {'and', 'or', 'the', 'of', 'for', 'in', 'a', 'an', 'to', 'with', 'on', 'at', 'intern', 'internship', 'internships'}
+
+# Field weights - a term in the title/skills says more than one in the details line
+FIELD_WEIGHTS = {'title': 3, 'skills': 3, 'company': 1, 'category': 1, 'details': 1}
+BM25_K1 = 1.2
+BM25_B = 0.75
+SIGNATURE_CHECK_SECONDS = 60
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall((text or '').lower()) if t not in STOPWORDS]
+
+
+def skill_tags(skills):
+    """Canonical skill ids for a comma separated skill string"""
+    return {skill_knowledge.canonical_id(s) for s in (skills or '').split(',') if s.strip()}
+
+
+def parse_stipend(stipend):
+    """'₹15,000 /month' -> 15000, 'Competitive' -> None"""
+    amounts = [int(a.replace(',', '')) for a in re.findall(r'\d[\d,]*', stipend or '')]
+    if not amounts:
+        return None
+    amount = max(amounts)
+    if 'k' in (stipend or '').lower() and amount < 1000:
+        amount *= 1000
+    return amount
+
+
+def parse_duration_months(duration):
+    """'3-6 months' -> 6, '12 weeks' -> 3, 'Flexible' -> None"""
+    numbers = [int(n) for n in re.findall(r'\d+', duration or '')]
+    if not numbers:
+        return None
+    longest = max(numbers)
+    if 'week' in (duration or '').lower():
+        return max(1, round(longest / 4))
+    return longest
+
+
+class OpportunityIndex:
+    """In-process BM25 + skill-tag index over opportunities.
+
+    Each document carries weighted BM25 postings over its text fields plus the
+    canonical skill ids it requires. A query is the student's canonical skills
+    and branch. The score blends skill-tag coverage with BM25 relevance, so
+    ``match_score`` reflects how well the opportunity actually matches.
+
+    BM25 weights are precomputed per posting and kept in numpy arrays together
+    with the filter columns, so a query is a few vectorized adds and masks.
+    """
+
+    def __init__(self, documents=None):
+        self.documents = []
+        self.postings = {}
+        self.tag_postings = {}
+        self.built_at = None
+        if documents:
+            self.build(documents)
+
+    # ---------- building ----------
+
+    @staticmethod
+    def document_from_row(row):
+        """Normalize a DB row / scraper dict into an index document"""
+        return {
+            'id': row.get('id'),
+            'opportunity_type': row.get('opportunity_type', 'internship'),
+            'title': row.get('title', ''),
+            'company': row.get('company_org') or row.get('company', ''),
+            'platform': row.get('platform', 'other'),
+            'url': row.get('url', ''),
+            'branch': row.get('branch', ''),
+            'category': row.get('category', ''),
+            'skills': row.get('skills_required') or row.get('skills', ''),
+            'skill_key': row.get('skill_key', ''),
+            'location': row.get('location') or 'Remote',
+            'duration': row.get('duration') or 'Flexible',
+            'stipend': row.get('stipend') or row.get('salary_info') or 'Competitive',
+            'details': row.get('details', ''),
+            'link_status': row.get('link_status', 'unknown'),
+        }
+
+    def build(self, rows):
+        started = time.perf_counter()
+        self.documents = []
+        term_docs = defaultdict(list)
+        tag_docs = defaultdict(list)
+        lengths = []
+
+        for row in rows:
+            doc = self.document_from_row(row)
+            doc_id = len(self.documents)
+
+            term_freqs = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(doc[field]):
+                    term_freqs[token] += weight
+            for term, tf in term_freqs.items():
+                term_docs[term].append((doc_id, tf))
+
+            tags = skill_tags(doc['skills'])
+            if doc['skill_key']:
+                tags.add(doc['skill_key'])
+            for tag in tags:
+                tag_docs[tag].append(doc_id)
+
+            lengths.append(sum(term_freqs.values()))
+            self.documents.append(doc)
+
+        n_docs = len(self.documents)
+        lengths = np.array(lengths, dtype=np.float64)
+        avg_length = lengths.mean() if n_docs else 1.0
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / (avg_length or 1.0))
+
+        # Query independent part of BM25 for every (term, doc) posting
+        self.postings = {}
+        for term, plist in term_docs.items():
+            ids = np.fromiter((d for d, _ in plist), dtype=np.int32, count=len(plist))
+            tfs = np.fromiter((tf for _, tf in plist), dtype=np.float64, count=len(plist))
+            idf = math.log(1 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            self.postings[term] = (ids, idf * tfs * (BM25_K1 + 1) / (tfs + length_norm[ids]))
+        self.tag_postings = {tag: np.array(ids, dtype=np.int32) for tag, ids in tag_docs.items()}
+
+        # Filter columns
+        self.types = np.array([d['opportunity_type'] for d in self.documents], dtype=object)
+        self.branches = np.array([d['branch'].lower() for d in self.documents], dtype=object)
+        self.locations = np.array([d['location'].lower() for d in self.documents], dtype=object)
+        self.broken = np.array([d['link_status'] == 'broken' for d in self.documents], dtype=bool)
+        self.stipends = np.array([parse_stipend(d['stipend']) or np.nan for d in self.documents], dtype=np.float64)
+        self.durations = np.array([parse_duration_months(d['duration']) or np.nan for d in self.documents], dtype=np.float64)
+
+        self.built_at = time.time()
+        print(f"🔎 Opportunity index built: {n_docs} documents, {len(self.postings)} terms in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return self
+
+    # ---------- querying ----------
+
+    def filter_mask(self, opportunity_type, branch, location, min_stipend, max_duration):
+        mask = ~self.broken
+        if opportunity_type:
+            mask &= self.types == opportunity_type
+        if branch:
+            mask &= (self.branches == branch.lower()) | (self.branches == '')
+        if location:
+            location = location.lower()
+            # Few distinct locations - match each once, then map back to documents
+            matching = [loc for loc in set(self.locations)
+                        if location in loc or loc in ('remote', 'nationwide', 'multiple locations')]
+            mask &= np.isin(self.locations, matching)
+        # NaN (unknown stipend/duration) never passes a numeric filter
+        if min_stipend:
+            mask &= self.stipends >= min_stipend
+        if max_duration:
+            mask &= self.durations <= max_duration
+        return mask
+
+    def search(self, skills, branch=None, opportunity_type='internship', location=None,
+               min_stipend=None, max_duration=None, limit=12):
+        """Ranked documents for a student's skills - returns [(doc, relevance, match_score)]"""
+        query_tags = skill_tags(skills)
+        query_terms = Counter(t for tag in query_tags for t in tokenize(tag))
+        if not query_terms or not self.documents:
+            return []
+
+        n_docs = len(self.documents)
+        text_scores = np.zeros(n_docs)
+        for term, qtf in query_terms.items():
+            if term in self.postings:
+                ids, weights = self.postings[term]
+                text_scores[ids] += qtf * weights
+
+        coverage = np.zeros(n_docs)
+        for tag in query_tags:
+            if tag in self.tag_postings:
+                coverage[self.tag_postings[tag]] += 1
+        coverage /= len(query_tags)
+
+        candidates = np.nonzero((text_scores > 0) & self.filter_mask(opportunity_type, branch, location, min_stipend, max_duration))[0]
+        if not len(candidates):
+            return []
+
+        # 60% skill-tag coverage + 40% saturated text relevance
+        match_scores = np.rint(60 * coverage[candidates] + 40 * text_scores[candidates] / (text_scores[candidates] + 5))
+        order = np.lexsort((-text_scores[candidates], -match_scores))
+
+        results = []
+        seen_urls = set()
+        for position in order:
+            doc = self.documents[candidates[position]]
+            if doc['url'] in seen_urls:
+                continue
+            seen_urls.add(doc['url'])
+            results.append((doc, round(float(text_scores[candidates[position]]), 3), int(match_scores[position])))
+            if len(results) >= limit:
+                break
+        return results
+
+
+class OpportunitySearch:
+    """Keeps an OpportunityIndex over the Opportunity table in sync (rebuilt when rows change)"""
+
+    FIELDS = ('id', 'opportunity_type', 'title', 'company_org', 'platform', 'url', 'branch', 'category',
+              'skills_required', 'skill_key', 'location', 'duration', 'stipend', 'salary_info', 'details', 'link_status')
+
+    def __init__(self):
+        self.index = OpportunityIndex()
+        self._signature = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def table_signature(self):
+        return tuple(Opportunity.objects.filter(is_active=True).aggregate(
+            count=Count('id'), crawled=Max('last_crawled'), verified=Max('last_verified')
+        ).values())
+
+    def get_index(self):
+        now = time.monotonic()
+        if self._signature is not None and now - self._last_check < SIGNATURE_CHECK_SECONDS:
+            return self.index
+        with self._lock:
+            self._last_check = now
+            signature = self.table_signature()
+            if signature != self._signature:
+                rows = Opportunity.objects.filter(is_active=True).values(*self.FIELDS)
+                self.index = OpportunityIndex(list(rows))
+                self._signature = signature
+        return self.index
+
+    def search(self, skills, branch=None, **filters):
+        started = time.perf_counter()
+        results = self.get_index().search(skills, branch, **filters)
+        print(f"🔎 Opportunity search: {len(results)} results in {(time.perf_counter() - started) * 1000:.2f}ms")
+        return results
+
+
+# Create global instance
+opportunity_search = OpportunitySearch()
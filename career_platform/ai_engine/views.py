@@ -23,6 +23,10 @@ from .core.roadmap_generator import roadmap_generator
 # NEW: Import enhanced modules
 try:
     from .scrapers import LinkManager
+    from .scrapers.link_loader import LinkBatchLoader
+    from .search_index import OpportunityIndex, opportunity_search
+    from .scrapers.http_cache import response_cache
+    from .scrapers.resilience import host_guards
     from .models.opportunity import SavedOpportunity, Opportunity
     from .models.analytics import StudentAnalytics
     ENHANCED_FEATURES_AVAILABLE = True
@@ -772,6 +776,16 @@ def get_fallback_analytics_data():
 
 # ===== NEW INTERNSHIP & SKILL DEVELOPMENT APIS =====
 
+def get_internship_filters(request):
+    """Location / minimum stipend / maximum duration filters from the query string"""
+    filters = {'location': request.GET.get('location') or None}
+    for name in ('min_stipend', 'max_duration'):
+        try:
+            filters[name] = int(request.GET.get(name)) if request.GET.get(name) else None
+        except ValueError:
+            filters[name] = None
+    return filters
+
 @login_required
 def internship_matching_api(request):
     """API endpoint for internship matching - FIXED VERSION"""
@@ -784,27 +798,33 @@ def internship_matching_api(request):
             skills = student_profile.skills or 'Python, Programming'
             branch = student_profile.branch or 'Computer Science'
             
-            # Get internships using the fixed method
-            internships = link_manager.internship_scraper.get_internships_by_skills(skills, branch, limit=12)
+            # Ranked from the local opportunity index (crawled rows) - no scraping on request
+            filters = get_internship_filters(request)
+            results = opportunity_search.search(skills, branch, limit=12, **filters)
+            if not results:
+                # Nothing crawled yet - rank the scraper's offline links with the same scorer
+                internships = link_manager.internship_scraper.get_internships_by_skills(skills, branch, limit=12)
+                results = OpportunityIndex(internships).search(skills, branch, limit=12, **filters)
             
             # Format for response
             formatted_internships = []
-            for i, internship in enumerate(internships):
+            for i, (internship, relevance, match_score) in enumerate(results):
                 formatted_internships.append({
-                    'id': f"{internship['platform']}_{i}",
+                    'id': f"{internship['platform']}_{internship['id'] or i}",
                     'title': internship['title'],
                     'company': internship['company'],
                     'platform': internship['platform'],
                     'url': internship['url'],
-                    'location': internship.get('location', 'Remote'),
-                    'duration': internship.get('duration', '2-3 months'),
-                    'stipend': internship.get('stipend', 'Competitive'),
-                    'skills_required': internship.get('skills', 'Various'),
-                    'category': internship.get('category', 'Technology'),
+                    'location': internship['location'],
+                    'duration': internship['duration'],
+                    'stipend': internship['stipend'],
+                    'skills_required': internship['skills'] or 'Various',
+                    'category': internship['category'] or 'Technology',
                     'apply_by': '2024-12-31',
                     'posted_on': 'Recently',
-                    'is_verified': True,
-                    'match_score': min(95, 70 + i * 2)
+                    'is_verified': internship['link_status'] == 'active',
+                    'match_score': match_score,
+                    'relevance': relevance
                 })
             
             # Add featured internships
@@ -1218,9 +1238,17 @@ class CareerRecommendationView(View):
             recommendations = career_recommender.recommend_careers(student_profile, top_n=20)
             
             # NEW: Enhance with real links if available
+            # Queue every recommendation's lookups first so duplicates resolve once
+            link_loader = LinkBatchLoader(link_manager) if ENHANCED_FEATURES_AVAILABLE and link_manager else None
+            if link_loader:
+                for rec in recommendations:
+                    self.prefetch_links(link_loader, rec, student_profile.skills, student_profile.branch)
+                link_loader.load()
+                print(f"🔗 Link lookups batched: {link_loader.stats()}")
+            
             enhanced_recommendations = []
             for rec in recommendations:
-                enhanced_rec = self.enhance_with_links(rec, student_profile.skills) if ENHANCED_FEATURES_AVAILABLE else rec
+                enhanced_rec = self.enhance_with_links(rec, student_profile.skills, student_profile.branch, link_loader) if ENHANCED_FEATURES_AVAILABLE else rec
                 enhanced_recommendations.append(enhanced_rec)
             
             # NEW: Update analytics with patterns
@@ -1239,7 +1267,8 @@ class CareerRecommendationView(View):
                     'average_match_score': sum(rec['compatibility_score'] for rec in enhanced_recommendations) / len(enhanced_recommendations) if enhanced_recommendations else 0,
                     # NEW: Enhanced analytics
                     'total_real_links': sum(len(rec.get('internship_links', [])) for rec in enhanced_recommendations) if ENHANCED_FEATURES_AVAILABLE else 0,
-                    'has_enhanced_features': ENHANCED_FEATURES_AVAILABLE
+                    'has_enhanced_features': ENHANCED_FEATURES_AVAILABLE,
+                    'link_lookups': link_loader.stats() if link_loader else {}
                 },
                 'engine': 'Professional Career AI v2.0' + (' with Real Links' if ENHANCED_FEATURES_AVAILABLE else ''),
                 'data_sources': ['LinkedIn Job Postings', 'Career Datasets', 'Professional Templates'] + (['Internshala', 'Naukri', 'Coursera', 'NPTEL'] if ENHANCED_FEATURES_AVAILABLE else []),
@@ -1264,27 +1293,35 @@ class CareerRecommendationView(View):
                 'recommendations': self.get_enhanced_fallback_recommendations()
             })
     
+    def prefetch_links(self, link_loader, recommendation, student_skills, branch):
+        """Queue a recommendation's internship + course lookups on the request's loader"""
+        link_loader.prefetch_opportunity_links(recommendation['title'], student_skills, recommendation['category'], branch, limit=2)
+        link_loader.prefetch_course_links(', '.join(recommendation.get('missing_skills', [])), recommendation['category'], branch, limit=2)
+    
     # NEW: Method to enhance recommendations with real links
-    def enhance_with_links(self, recommendation, student_skills):
+    def enhance_with_links(self, recommendation, student_skills, branch='', link_loader=None):
         """Enhance recommendation with real internship and course links"""
         if not ENHANCED_FEATURES_AVAILABLE or not link_manager:
             return recommendation
             
         enhanced = recommendation.copy()
+        link_loader = link_loader or LinkBatchLoader(link_manager)
         
         try:
             # Get real internship links
-            internship_links = link_manager.get_opportunity_links(
+            internship_links = link_loader.get_opportunity_links(
                 recommendation['title'],
                 student_skills,
                 recommendation['category'],
+                branch,
                 limit=2
             )
             
             # Get course links for missing skills
-            course_links = link_manager.get_course_links(
+            course_links = link_loader.get_course_links(
                 ', '.join(recommendation.get('missing_skills', [])),
                 recommendation['category'],
+                branch,
                 limit=2
             )
             
@@ -1667,7 +1704,9 @@ class AIStatusView(View):
                     'real_links': ENHANCED_FEATURES_AVAILABLE,
                     'save_functionality': ENHANCED_FEATURES_AVAILABLE,
                     'analytics_dashboard': ENHANCED_FEATURES_AVAILABLE
-                }
+                },
+                'scraper_cache': response_cache.metrics() if ENHANCED_FEATURES_AVAILABLE else None,
+                'scraper_circuits': host_guards.status() if ENHANCED_FEATURES_AVAILABLE else {}
             })
             
         except Exception as e:
@@ -0,0 +1,195 @@
+# analytics/cohort_skill_gaps.py
+import time
+import numpy as np
+from django.conf import settings
+from django.db.models import Avg, Count, OuterRef, Subquery
+
+from users.models import StudentProfile
+from .models import CohortSkillStats
+from progress_tracker.models import UserProgress
+from ai_engine.core.skill_knowledge import skill_knowledge
+
+CACHE_PREFIX = 'cohort_skill_gaps'
+BITS_PER_WORD = 64
+
+
+class CohortSkillGapAggregator:
+    """Cohort-level skill gap aggregation for the university dashboard.
+
+    Every student's skills are normalized to canonical skill ids and packed into a
+    bitset over the tracked market skills. Missing-skill counts for a whole cohort
+    are then vectorized popcounts over a (students x words) uint64 matrix, so a
+    50k student cohort is aggregated in well under a second. Results are stored
+    per (college, branch, semester) in the CohortSkillStats table - shared by
+    every worker. Only the ``refresh_cohort_stats`` cron job computes and writes
+    them; web requests read the stored row, flagged ``stale`` once it is older
+    than ``COHORT_STATS_REFRESH_SECONDS``.
+    """
+
+    def __init__(self, refresh_seconds=None, top_n=10):
+        self.refresh_seconds = refresh_seconds or getattr(settings, 'COHORT_STATS_REFRESH_SECONDS', 900)
+        self.top_n = top_n
+        self._mask_cache = {}
+        self._tracked_signature = None
+
+    # ---------- skill normalization ----------
+
+    def get_tracked_skills(self):
+        """Market skills every cohort is measured against"""
+        tracked = list(skill_knowledge.technical_priority().keys())
+        if tuple(tracked) != self._tracked_signature:
+            self._tracked_signature = tuple(tracked)
+            self._mask_cache = {}
+        return tracked
+
+    def skill_mask(self, student_skill, tracked):
+        """Bitmask of tracked skills covered by one (raw) student skill"""
+        mask = self._mask_cache.get(student_skill)
+        if mask is None:
+            normalized = skill_knowledge.canonical_id(student_skill)
+            mask = 0
+            if normalized:
+                for bit, skill in enumerate(tracked):
+                    # Same matching rule as SkillAnalyzer.analyze_technical_skill_gaps
+                    if skill in normalized or normalized in skill:
+                        mask |= 1 << bit
+            self._mask_cache[student_skill] = mask
+        return mask
+
+    def build_bitsets(self, skill_rows, tracked):
+        """Pack every student's skills into a (students x words) uint64 matrix"""
+        words = max(1, (len(tracked) + BITS_PER_WORD - 1) // BITS_PER_WORD)
+        word_mask = (1 << BITS_PER_WORD) - 1
+        packed = []
+
+        for skills_text in skill_rows:
+            mask = 0
+            for raw_skill in (skills_text or '').lower().split(','):
+                raw_skill = raw_skill.strip()
+                if raw_skill:
+                    mask |= self.skill_mask(raw_skill, tracked)
+            packed.append([(mask >> (w * BITS_PER_WORD)) & word_mask for w in range(words)])
+
+        if not packed:
+            return np.zeros((0, words), dtype=np.uint64)
+        return np.array(packed, dtype=np.uint64)
+
+    @staticmethod
+    def count_bits(bitsets, n_bits):
+        """Vectorized popcount per bit position - how many students HAVE each skill"""
+        counts = np.zeros(n_bits, dtype=np.int64)
+        for bit in range(n_bits):
+            word, offset = divmod(bit, BITS_PER_WORD)
+            column = bitsets[:, word]
+            counts[bit] = int(((column >> np.uint64(offset)) & np.uint64(1)).sum())
+        return counts
+
+    # ---------- queries ----------
+
+    def get_cohort_queryset(self, college=None, branch=None, semester=None):
+        filters = {}
+        if college:
+            filters['college'] = college
+        if branch:
+            filters['branch'] = branch
+        if semester:
+            filters['semester'] = int(semester)
+        return StudentProfile.objects.filter(**filters)
+
+    def get_average_crs(self, cohort):
+        """Average of each student's latest CRS, computed in SQL"""
+        latest_crs = UserProgress.objects.filter(user=OuterRef('user')).order_by('-date').values('crs_score')[:1]
+        result = (
+            cohort.annotate(latest_crs=Subquery(latest_crs))
+            .filter(latest_crs__isnull=False)
+            .aggregate(average_crs=Avg('latest_crs'), students_with_crs=Count('id'))
+        )
+        average = result['average_crs']
+        return (round(average, 1) if average is not None else None), result['students_with_crs']
+
+    # ---------- aggregation ----------
+
+    def compute_cohort_stats(self, college=None, branch=None, semester=None):
+        """Compute skill gaps for a cohort from scratch"""
+        started = time.perf_counter()
+        tracked = self.get_tracked_skills()
+        cohort = self.get_cohort_queryset(college, branch, semester)
+
+        skill_rows = cohort.values_list('skills', flat=True).iterator(chunk_size=2000)
+        bitsets = self.build_bitsets(skill_rows, tracked)
+        total_students = int(bitsets.shape[0])
+
+        have_counts = self.count_bits(bitsets, len(tracked))
+        missing_counts = total_students - have_counts
+
+        missing_skills = []
+        for bit, skill in enumerate(tracked):
+            missing = int(missing_counts[bit])
+            missing_skills.append({
+                'skill': skill.title(),
+                'missing_count': missing,
+                'missing_share': round(missing * 100.0 / total_students, 1) if total_students else 0.0,
+            })
+        missing_skills.sort(key=lambda x: x['missing_count'], reverse=True)
+
+        average_crs, students_with_crs = self.get_average_crs(cohort)
+
+        stats = {
+            'cohort': {'college': college, 'branch': branch, 'semester': semester},
+            'total_students': total_students,
+            'average_crs': average_crs,
+            'students_with_crs': students_with_crs,
+            'top_missing_skills': missing_skills[:self.top_n],
+            'tracked_skills': len(tracked),
+            'computed_at': time.time(),
+            'compute_ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+        print(f"📊 Cohort stats computed for {stats['cohort']}: {total_students} students in {stats['compute_ms']}ms")
+        return stats
+
+    def cache_key(self, college=None, branch=None, semester=None):
+        parts = [str(college or '*'), str(branch or '*'), str(semester or '*')]
+        return f"{CACHE_PREFIX}:" + ':'.join(p.replace(' ', '_') for p in parts)
+
+    def get_stored_stats(self, college=None, branch=None, semester=None):
+        """Stored cohort stats for the request path - never computes or writes, None until refreshed"""
+        if semester:
+            semester = int(semester)
+        key = self.cache_key(college, branch, semester)
+        stats = CohortSkillStats.objects.filter(cohort_key=key).values_list('stats', flat=True).first()
+        if stats is None:
+            return None
+        stale = time.time() - stats.get('computed_at', 0) > self.refresh_seconds
+        return dict(stats, cache_hit=True, stale=stale)
+
+    def get_cohort_stats(self, college=None, branch=None, semester=None, force_refresh=False):
+        """Get stored cohort stats, recomputing when missing or older than the refresh interval"""
+        key = self.cache_key(college, branch, semester)
+        stats = None
+        if not force_refresh:
+            stats = CohortSkillStats.objects.filter(cohort_key=key).values_list('stats', flat=True).first()
+
+        if stats is None or time.time() - stats.get('computed_at', 0) > self.refresh_seconds:
+            stats = self.compute_cohort_stats(college, branch, semester)
+            CohortSkillStats.objects.update_or_create(cohort_key=key, defaults={'stats': stats})
+            stats = dict(stats, cache_hit=False)
+        else:
+            stats = dict(stats, cache_hit=True)
+        return stats
+
+    def refresh_all_cohorts(self):
+        """Recompute every (college, branch, semester) cohort plus the per-branch and overall views"""
+        refreshed = 0
+        cohorts = StudentProfile.objects.values_list('college', 'branch', 'semester').distinct()
+        for college, branch, semester in cohorts:
+            self.get_cohort_stats(college, branch, semester, force_refresh=True)
+            refreshed += 1
+        for branch in StudentProfile.objects.values_list('branch', flat=True).distinct():
+            self.get_cohort_stats(branch=branch, force_refresh=True)
+            refreshed += 1
+        self.get_cohort_stats(force_refresh=True)
+        return refreshed + 1
+
+
+# Create global instance
+cohort_aggregator = CohortSkillGapAggregator()
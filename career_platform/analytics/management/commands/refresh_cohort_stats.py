@@ -0,0 +1,15 @@
+# analytics/management/commands/refresh_cohort_stats.py
+import time
+from django.core.management.base import BaseCommand
+
+from analytics.cohort_skill_gaps import cohort_aggregator
+
+
+class Command(BaseCommand):
+    help = 'Recompute cached cohort skill gap stats (run from cron for periodic refresh)'
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        refreshed = cohort_aggregator.refresh_all_cohorts()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'✅ Refreshed {refreshed} cohorts in {elapsed:.2f}s'))
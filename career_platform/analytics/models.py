@@ -1,3 +1,16 @@
 from django.db import models
 
 # Create your models here.
+
+
+class CohortSkillStats(models.Model):
+    # Last computed stats of one cohort - written by refresh_cohort_stats, read by every web worker
+    cohort_key = models.CharField(max_length=255, unique=True)
+    stats = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'cohort skill stats'
+
+    def __str__(self):
+        return self.cohort_key
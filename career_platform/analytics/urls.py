@@ -0,0 +1,7 @@
+# analytics/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('api/cohort-skill-gaps/', views.cohort_skill_gaps_api, name='cohort_skill_gaps_api'),
+]
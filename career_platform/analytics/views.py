@@ -1,3 +1,32 @@
-from django.shortcuts import render
+# analytics/views.py
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 
-# Create your views here.
+from .cohort_skill_gaps import cohort_aggregator
+
+
+@login_required
+@require_GET
+def cohort_skill_gaps_api(request):
+    """Cohort skill gaps for the university dashboard (staff only) - ?college=&branch=&semester=
+
+    Only reads the stored stats; computing them is left to the
+    refresh_cohort_stats command.
+    """
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'error': 'Staff access required'}, status=403)
+    try:
+        stats = cohort_aggregator.get_stored_stats(
+            college=request.GET.get('college') or None,
+            branch=request.GET.get('branch') or None,
+            semester=request.GET.get('semester') or None,
+        )
+        if stats is None:
+            return JsonResponse({'success': False, 'error': 'Cohort stats not computed yet'}, status=404)
+        return JsonResponse({'success': True, 'data': stats})
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid semester'}, status=400)
+    except Exception as e:
+        print(f"❌ Cohort skill gap error: {e}")
+        return JsonResponse({'success': False, 'error': 'Could not load cohort skill gaps'}, status=500)
@@ -196,3 +196,8 @@ ALLOWED_EXTENSIONS = (
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Scraper endpoints - point scrapers at the offline stand-in (manage.py scraper_standin)
+# with SCRAPER_STANDIN_URL, or override single platforms, e.g. {'coursera': 'http://127.0.0.1:8765/coursera'}
+SCRAPER_STANDIN_URL = os.getenv('SCRAPER_STANDIN_URL', '')
+SCRAPER_BASE_URLS = {}
@@ -59,6 +59,7 @@ urlpatterns = [
     path('career-roadmap/<str:job_slug>/', ai_views.career_roadmap, name='career_roadmap'),
     path('progress/', include('progress_tracker.urls')),
     path('universitydashboard/', views.universitydashboard, name='universitydashboard'),
+    path('analytics/', include('analytics.urls')),
     path('skillforge/', views.skillforge, name='skillforge'),
 ]
 
@@ -1632,9 +1632,25 @@ def send_whatsapp_message(request):
                 'error': str(e)
             })
         
+@login_required
 def universitydashboard(request):
-    """University Dashboard View"""
-    return render(request, 'universitydashboard.html')
+    """University Dashboard View - with cohort skill gaps (staff only, stored stats only)"""
+    if not request.user.is_staff:
+        messages.error(request, 'The university dashboard is only available to staff.')
+        return redirect('dashboard')
+
+    cohort = None
+    try:
+        from analytics.cohort_skill_gaps import cohort_aggregator
+        cohort = cohort_aggregator.get_stored_stats(
+            college=request.GET.get('college') or None,
+            branch=request.GET.get('branch') or None,
+            semester=request.GET.get('semester') or None,
+        )
+    except Exception as e:
+        logger.error(f"❌ Cohort skill gap error: {e}")
+
+    return render(request, 'universitydashboard.html', {'cohort': cohort})
 
 def skillforge(request):
     """SkillForge Gamified Learning View"""
@@ -0,0 +1,127 @@
+# chatbot/audio_cache.py
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
+TTS_CACHE_DIR = os.getenv('TTS_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'career_connect_tts')
+TTS_CACHE_MAX_MB = int(os.getenv('TTS_CACHE_MAX_MB', '200'))
+AUDIO_FILENAME_RE = re.compile(r'^([0-9a-f]{64})\.mp3$')
+
+
+class AudioCache:
+    """Content-addressed store for synthesized speech.
+
+    Each clip is saved once as ``<sha256(language, text)>.mp3``, so a repeated
+    greeting or FAQ answer is served from disk with no synthesis. Hits touch the
+    file's mtime and the oldest clips are deleted once the directory grows past
+    ``TTS_CACHE_MAX_MB``.
+    """
+
+    def __init__(self, directory=TTS_CACHE_DIR, max_bytes=TTS_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size = None
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(text, language):
+        return hashlib.sha256(f"{language}\n{text}".encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def path_for_filename(self, filename):
+        """Cache path for a served filename, or None if it isn't one of ours"""
+        match = AUDIO_FILENAME_RE.match(filename or '')
+        if not match:
+            return None
+        path = self.path_for(match.group(1))
+        return path if os.path.exists(path) else None
+
+    def get_or_create(self, text, language, synthesize):
+        """Path of the clip for (text, language); ``synthesize(path)`` writes it on a miss"""
+        key = self.key(text, language)
+        path = self.path_for(key)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            # One synthesis per clip even when the same answer is requested concurrently
+            with key_lock:
+                if os.path.exists(path):
+                    self.stats['hits'] += 1
+                    try:
+                        os.utime(path)
+                    except OSError:
+                        pass
+                    return path
+
+                self.stats['misses'] += 1
+                fd, temp_path = tempfile.mkstemp(suffix='.mp3', dir=self.directory)
+                os.close(fd)
+                try:
+                    synthesize(temp_path)
+                    os.replace(temp_path, path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+        self._added(os.path.getsize(path))
+        return path
+
+    # ---------- size bound ----------
+
+    def _scan(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and AUDIO_FILENAME_RE.match(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _added(self, size):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(s for _, s, _ in self._scan())
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Delete least recently used clips until the cache is at 90% of its limit"""
+        entries = sorted(self._scan())
+        total = sum(s for _, s, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                self.stats['evictions'] += 1
+            except OSError:
+                pass
+        self._size = total
+
+    def metrics(self):
+        entries = self._scan()
+        stats = dict(self.stats)
+        stats.update({
+            'files': len(entries),
+            'size_mb': round(sum(s for _, s, _ in entries) / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+        })
+        return stats
+
+
+# Create global instance
+audio_cache = AudioCache()
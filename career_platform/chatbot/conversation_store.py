@@ -0,0 +1,323 @@
+# chatbot/conversation_store.py
+import atexit
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict, deque
+
+from django.db import DatabaseError, close_old_connections
+
+CHAT_HISTORY_MAX_TURNS = int(os.getenv('CHAT_HISTORY_MAX_TURNS', '10'))
+CHAT_HOT_USERS = int(os.getenv('CHAT_HOT_USERS', '2000'))
+CHAT_HOT_CONVERSATIONS_PER_USER = int(os.getenv('CHAT_HOT_CONVERSATIONS_PER_USER', '3'))
+# Extra time to gather a batch before writing - 0 writes each turn at once (other workers see it immediately)
+CHAT_WRITE_BEHIND_SECONDS = float(os.getenv('CHAT_WRITE_BEHIND_SECONDS', '0'))
+CHAT_WRITE_BATCH = int(os.getenv('CHAT_WRITE_BATCH', '200'))
+# Only ids handed out by start() - uuid4 hex
+CONVERSATION_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+
+class HotConversation:
+    """Recent turns of one conversation, its owner, and the newest table row they include"""
+
+    __slots__ = ('user_key', 'turns', 'last_id')
+
+    def __init__(self, user_key, turns, last_id=None):
+        self.user_key = user_key
+        self.turns = turns
+        self.last_id = last_id
+
+
+class ConversationStore:
+    """Server-side chat history on top of ChatConversation.
+
+    Each turn (message + response) is one ChatConversation row. Recent turns of
+    hot conversations live in memory: an LRU of users, each with an LRU of at
+    most ``CHAT_HOT_CONVERSATIONS_PER_USER`` conversations holding the last
+    ``CHAT_HISTORY_MAX_TURNS`` turns, so memory is bounded however many people
+    chat. New turns are written by a background thread with ``bulk_create``
+    (turns arriving during a write go in the next batch), so replies never wait
+    on the database.
+
+    The table is the shared copy between workers: a hot conversation remembers
+    the newest row it was loaded with, and is reloaded when another worker has
+    written a newer turn (one indexed query per read). A conversation missing
+    from memory - evicted, or started on another worker - is loaded from the
+    table. Every conversation belongs to the user who started it (anonymous
+    ones to whoever holds the unguessable id); reads and appends by anyone else
+    are refused.
+    """
+
+    def __init__(self, max_turns=CHAT_HISTORY_MAX_TURNS, hot_users=CHAT_HOT_USERS,
+                 conversations_per_user=CHAT_HOT_CONVERSATIONS_PER_USER, flush_seconds=CHAT_WRITE_BEHIND_SECONDS,
+                 batch_size=CHAT_WRITE_BATCH):
+        self.max_turns = max_turns
+        self.hot_users = hot_users
+        self.conversations_per_user = conversations_per_user
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self._users = OrderedDict()
+        self._owners = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer = None
+        self.stats = {'memory_hits': 0, 'db_loads': 0, 'stale_reloads': 0, 'rejected': 0, 'turns': 0, 'writes': 0,
+                      'write_errors': 0, 'evictions': 0}
+        atexit.register(self.flush)
+
+    @staticmethod
+    def new_id():
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def valid_id(conversation_id):
+        return isinstance(conversation_id, str) and bool(CONVERSATION_ID_RE.fullmatch(conversation_id))
+
+    @staticmethod
+    def user_key(user, conversation_id):
+        # Anonymous conversations each get their own slot rather than sharing one user
+        return f"user:{user.pk}" if user is not None else f"anon:{conversation_id}"
+
+    # ---------- hot conversations ----------
+
+    def _hot(self, conversation_id):
+        user_key = self._owners.get(conversation_id)
+        if user_key is None:
+            return None
+        self._users.move_to_end(user_key)
+        conversations = self._users[user_key]
+        conversations.move_to_end(conversation_id)
+        return conversations[conversation_id]
+
+    def _remember(self, conversation_id, entry):
+        conversations = self._users.setdefault(entry.user_key, OrderedDict())
+        self._users.move_to_end(entry.user_key)
+        conversations[conversation_id] = entry
+        conversations.move_to_end(conversation_id)
+        self._owners[conversation_id] = entry.user_key
+
+        while len(conversations) > self.conversations_per_user:
+            evicted, _ = conversations.popitem(last=False)
+            self._owners.pop(evicted, None)
+            self.stats['evictions'] += 1
+        while len(self._users) > self.hot_users:
+            _, evicted_conversations = self._users.popitem(last=False)
+            for evicted in evicted_conversations:
+                self._owners.pop(evicted, None)
+                self.stats['evictions'] += 1
+        return entry
+
+    def _forget(self, conversation_id):
+        user_key = self._owners.pop(conversation_id, None)
+        if user_key is not None:
+            self._users[user_key].pop(conversation_id, None)
+
+    def _peek(self, conversation_id):
+        """Hot entry without touching the LRU order (caller holds the lock)"""
+        user_key = self._owners.get(conversation_id)
+        return self._users[user_key].get(conversation_id) if user_key is not None else None
+
+    def _advance(self, rows, known):
+        """Point hot conversations at the rows just written, so the next read is a memory hit.
+
+        Skipped for a conversation another worker wrote to in the meantime - its
+        next read sees the newer row and reloads.
+        """
+        from .models import ChatConversation
+        written = {}
+        for row in rows:
+            if row.pk is not None and row.conversation_id in known:
+                written[row.conversation_id] = max(row.pk, written.get(row.conversation_id, 0))
+        if not written:
+            return
+        others = (ChatConversation.objects
+                  .filter(conversation_id__in=list(written), id__gt=min(known[c][1] or 0 for c in written))
+                  .exclude(pk__in=[row.pk for row in rows if row.pk is not None])
+                  .values_list('conversation_id', 'id'))
+        interfered = {cid for cid, pk in others if pk > (known[cid][1] or 0)}
+        with self._lock:
+            for cid, pk in written.items():
+                entry, last_id = known[cid]
+                if cid not in interfered and entry.last_id == last_id:
+                    entry.last_id = pk
+
+    def _newest_id(self, conversation_id):
+        from .models import ChatConversation
+        return (ChatConversation.objects.filter(conversation_id=conversation_id)
+                .order_by('-timestamp', '-id').values_list('id', flat=True).first())
+
+    def _load(self, conversation_id):
+        """HotConversation from the table plus anything still waiting to be written (user_key None if no turns)"""
+        from .models import ChatConversation
+        # Under the flush lock a turn is either still buffered or already in the table, never neither
+        with self._flush_lock:
+            rows = list(
+                ChatConversation.objects.filter(conversation_id=conversation_id)
+                .order_by('-timestamp', '-id')
+                .values_list('id', 'user_id', 'message', 'response')[:self.max_turns]
+            )
+            with self._lock:
+                pending = [t for t in self._pending if t.conversation_id == conversation_id]
+        last_id = rows[0][0] if rows else None
+        rows.reverse()
+        turns = deque(((r[2], r[3]) for r in rows), maxlen=self.max_turns)
+        turns.extend((t.message, t.response) for t in pending)
+
+        if pending:
+            user_id = pending[-1].user_id
+        elif rows:
+            user_id = rows[-1][1]
+        else:
+            return HotConversation(None, turns, last_id)
+        user_key = f"user:{user_id}" if user_id is not None else f"anon:{conversation_id}"
+        return HotConversation(user_key, turns, last_id)
+
+    def _entry(self, conversation_id, user, fresh=True):
+        """The caller's hot conversation, loaded or refreshed as needed - None if it belongs to someone else"""
+        user_key = self.user_key(user, conversation_id)
+        with self._lock:
+            entry = self._hot(conversation_id)
+        try:
+            if entry is not None and fresh and entry.user_key == user_key:
+                if self._newest_id(conversation_id) != entry.last_id:
+                    # Another worker wrote a turn since this copy was loaded
+                    self.stats['stale_reloads'] += 1
+                    entry = None
+                else:
+                    self.stats['memory_hits'] += 1
+            if entry is None:
+                loaded = self._load(conversation_id)
+                self.stats['db_loads'] += 1
+                if loaded.user_key is None:
+                    # Not issued here and never written anywhere - a made-up id
+                    self.stats['rejected'] += 1
+                    return None
+                with self._lock:
+                    hot = self._hot(conversation_id)
+                    if hot is not None and hot.last_id == loaded.last_id and hot.user_key == loaded.user_key:
+                        entry = hot
+                    else:
+                        self._forget(conversation_id)
+                        entry = self._remember(conversation_id, loaded)
+        except DatabaseError as e:
+            print(f"⚠️ Could not load conversation {conversation_id}: {e}")
+            return None
+
+        if entry.user_key != user_key:
+            self.stats['rejected'] += 1
+            return None
+        return entry
+
+    # ---------- public API ----------
+
+    def claim(self, conversation_id, user):
+        """True if ``user`` may continue this conversation - one start() gave out, and theirs"""
+        return self.valid_id(conversation_id) and self._entry(conversation_id, user, fresh=False) is not None
+
+    def history(self, conversation_id, user):
+        """Recent turns as chat messages - [{'role': 'user'|'assistant', 'content': ...}]"""
+        if not self.valid_id(conversation_id):
+            return []
+        user = user if getattr(user, 'is_authenticated', False) else None
+        entry = self._entry(conversation_id, user)
+        if entry is None:
+            return []
+
+        messages = []
+        with self._lock:
+            turns = list(entry.turns)
+        for message, response in turns:
+            messages.append({"role": "user", "content": message})
+            messages.append({"role": "assistant", "content": response})
+        return messages
+
+    def append(self, conversation_id, user, message, response):
+        """Record one turn - kept in memory now, written to the table right after"""
+        if not self.valid_id(conversation_id) or not message or not response:
+            return False
+        from .models import ChatConversation
+        user = user if getattr(user, 'is_authenticated', False) else None
+        entry = self._entry(conversation_id, user, fresh=False)
+        if entry is None:
+            print(f"⚠️ Turn for conversation {conversation_id} refused - not the caller's conversation")
+            return False
+        row = ChatConversation(user=user, conversation_id=conversation_id, message=message, response=response)
+
+        with self._lock:
+            entry.turns.append((message, response))
+            self._pending.append(row)
+            self.stats['turns'] += 1
+            wake = len(self._pending) >= self.batch_size or self.flush_seconds <= 0
+            self._start_writer()
+        if wake:
+            self._wake.set()
+        return True
+
+    def start(self, user=None):
+        """A fresh conversation id, hot from the first turn (nothing to load)"""
+        conversation_id = self.new_id()
+        user = user if getattr(user, 'is_authenticated', False) else None
+        with self._lock:
+            self._remember(conversation_id, HotConversation(self.user_key(user, conversation_id),
+                                                            deque(maxlen=self.max_turns)))
+        return conversation_id
+
+    # ---------- write-behind ----------
+
+    def _start_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name='chat-write-behind', daemon=True)
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            self._wake.wait(self.flush_seconds if self.flush_seconds > 0 else None)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write every buffered turn now"""
+        from .models import ChatConversation
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            with self._lock:
+                # Newest row each hot conversation knew of before this write
+                known = {}
+                for row in rows:
+                    entry = self._peek(row.conversation_id)
+                    if entry is not None:
+                        known[row.conversation_id] = (entry, entry.last_id)
+            close_old_connections()
+            try:
+                ChatConversation.objects.bulk_create(rows, batch_size=self.batch_size)
+                self.stats['writes'] += len(rows)
+            except DatabaseError as e:
+                self.stats['write_errors'] += len(rows)
+                print(f"⚠️ Could not save {len(rows)} chat turns: {e}")
+                return len(rows)
+            try:
+                self._advance(rows, known)
+            except DatabaseError as e:
+                # Those conversations just reload on their next read
+                print(f"⚠️ Could not check chat turns written elsewhere: {e}")
+            return len(rows)
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats.update({
+                'hot_users': len(self._users),
+                'hot_conversations': len(self._owners),
+                'pending_writes': len(self._pending),
+            })
+        return stats
+
+
+# Create global instance
+conversation_store = ConversationStore()
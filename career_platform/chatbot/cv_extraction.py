@@ -0,0 +1,153 @@
+# chatbot/cv_extraction.py
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree.ElementTree import iterparse
+
+try:
+    import pypdf
+    PDF_AVAILABLE = True
+except ImportError:
+    try:
+        import PyPDF2 as pypdf
+        PDF_AVAILABLE = True
+    except ImportError:
+        pypdf = None
+        PDF_AVAILABLE = False
+
+CV_MAX_PAGES = int(os.getenv('CV_MAX_PAGES', '50'))
+CV_MAX_CHARS = int(os.getenv('CV_MAX_CHARS', '200000'))
+# PDFs with at least this many pages (within the budget) are split across processes
+CV_PARALLEL_MIN_PAGES = int(os.getenv('CV_PARALLEL_MIN_PAGES', '16'))
+CV_EXTRACTION_PROCESSES = int(os.getenv('CV_EXTRACTION_PROCESSES', str(min(4, os.cpu_count() or 1))))
+PAGES_PER_TASK = 8
+
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+
+def _extract_pdf_pages(path, start, stop):
+    """Text of pages [start, stop) - runs in a worker process, so it opens the file itself"""
+    reader = pypdf.PdfReader(path)
+    return [reader.pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+def iter_docx_paragraphs(path):
+    """Paragraph texts of a DOCX, streamed from word/document.xml.
+
+    Runs are joined like python-docx's ``paragraph.text`` (tabs and breaks
+    included). Table cells are read too; the fallback copy of text boxes is
+    skipped so it isn't counted twice.
+    """
+    with zipfile.ZipFile(path) as archive:
+        with archive.open('word/document.xml') as xml:
+            parts = []
+            in_fallback = 0
+            for event, element in iterparse(xml, events=('start', 'end')):
+                tag = element.tag
+                if tag == MC_FALLBACK:
+                    in_fallback += 1 if event == 'start' else -1
+                    continue
+                if event == 'start' or in_fallback:
+                    if event == 'end' and tag == WORD_NS + 'p':
+                        element.clear()
+                    continue
+                if tag == WORD_NS + 't':
+                    parts.append(element.text or '')
+                elif tag == WORD_NS + 'tab':
+                    parts.append('\t')
+                elif tag in (WORD_NS + 'br', WORD_NS + 'cr'):
+                    parts.append('\n')
+                elif tag == WORD_NS + 'p':
+                    yield ''.join(parts)
+                    parts = []
+                    # Drop the parsed paragraph so memory stays flat on long documents
+                    element.clear()
+
+
+class CVTextExtractor:
+    """Text extraction for uploaded CVs with a page and character budget.
+
+    Text is gathered in a ``StringIO`` and extraction stops as soon as
+    ``CV_MAX_PAGES`` pages or ``CV_MAX_CHARS`` characters have been read - the
+    analysis never needs more than a CV's worth of text. Long PDFs are split
+    into page ranges extracted in a process pool (pypdf is pure Python, so
+    threads would not help); DOCX files are streamed paragraph by paragraph
+    instead of loading the whole document tree.
+    """
+
+    def __init__(self, max_pages=CV_MAX_PAGES, max_chars=CV_MAX_CHARS,
+                 parallel_min_pages=CV_PARALLEL_MIN_PAGES, processes=CV_EXTRACTION_PROCESSES):
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.parallel_min_pages = parallel_min_pages
+        self.processes = processes
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def pool(self):
+        with self._lock:
+            if self._pool is None:
+                # spawn: safe to start from a threaded server, and the only option on Windows
+                self._pool = ProcessPoolExecutor(max_workers=self.processes,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+
+    def _page_chunks(self, path, page_count):
+        """Page texts in order, a chunk at a time"""
+        if page_count < self.parallel_min_pages or self.processes < 2:
+            reader = pypdf.PdfReader(path)
+            for i in range(page_count):
+                yield [reader.pages[i].extract_text() or '']
+            return
+
+        ranges = [(start, min(start + PAGES_PER_TASK, page_count)) for start in range(0, page_count, PAGES_PER_TASK)]
+        futures = [self.pool().submit(_extract_pdf_pages, path, start, stop) for start, stop in ranges]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Budget reached (or an error) - don't extract pages nobody will read
+            for future in futures:
+                future.cancel()
+
+    def extract_pdf(self, path):
+        reader = pypdf.PdfReader(path)
+        page_count = min(len(reader.pages), self.max_pages)
+        text = io.StringIO()
+        for pages in self._page_chunks(path, page_count):
+            for page_text in pages:
+                if page_text:
+                    text.write(page_text)
+                    text.write('\n')
+            if text.tell() >= self.max_chars:
+                break
+        return text.getvalue()[:self.max_chars]
+
+    def extract_docx(self, path):
+        text = io.StringIO()
+        for paragraph in iter_docx_paragraphs(path):
+            if paragraph:
+                text.write(paragraph)
+                text.write('\n')
+                if text.tell() >= self.max_chars:
+                    break
+        return text.getvalue()[:self.max_chars]
+
+    def extract(self, path):
+        """Text of a .pdf or .docx file - raises ValueError for other formats"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.pdf':
+            if not PDF_AVAILABLE:
+                raise ValueError('No PDF library installed')
+            return self.extract_pdf(path)
+        if extension == '.docx':
+            return self.extract_docx(path)
+        raise ValueError(f'Unsupported file format: {extension}')
+
+
+# Create global instance
+cv_extractor = CVTextExtractor()
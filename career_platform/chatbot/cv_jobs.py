@@ -0,0 +1,226 @@
+# chatbot/cv_jobs.py
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.files.move import file_move_safe
+from django.core.files.uploadhandler import FileUploadHandler
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+CV_ANALYSIS_WORKERS = int(os.getenv('CV_ANALYSIS_WORKERS', '2'))
+CV_JOB_TIMEOUT = int(os.getenv('CV_JOB_TIMEOUT', '300'))
+CV_MAX_UPLOAD_MB = int(os.getenv('CV_MAX_UPLOAD_MB', '20'))
+CV_UPLOAD_DIR = os.getenv('CV_UPLOAD_DIR') or os.path.join(tempfile.gettempdir(), 'career_connect_cv')
+# Bump whenever extraction or the analysis report changes, so old results are not reused
+CV_ANALYZER_VERSION = '1'
+ATS_SCORE_RE = re.compile(r'\*\*(\d{1,3})/100\*\*')
+JOB_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+
+def ats_score_from_analysis(analysis):
+    """The score line of a CV analysis report ('**Score:** 🟢 **85/100**') -> 85"""
+    match = ATS_SCORE_RE.search(analysis or '')
+    return int(match.group(1)) if match else 0
+
+
+class ContentHashUploadHandler(FileUploadHandler):
+    """Hashes each uploaded file while Django streams it to memory/disk.
+
+    Install it first (``request.upload_handlers.insert(0, ...)``) before the
+    view touches ``request.FILES``; it passes every chunk on unchanged, so the
+    usual handlers still build the file. Digests end up in ``hashes`` by field.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.hashes = {}
+        self._hash = None
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self._hash = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self._hash.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        self.hashes[self.field_name] = self._hash.hexdigest()
+        return None
+
+
+def hash_uploaded_file(uploaded_file):
+    """sha256 of an upload the hashing handler didn't see"""
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+class CVJobRunner:
+    """Runs CV analysis as background jobs tracked by CVAnalysis rows.
+
+    ``submit`` stores the upload and returns a queued row at once - or, when
+    the same user already uploaded the same bytes (same sha256 and
+    ``CV_ANALYZER_VERSION``), the earlier row, finished or still running, so
+    the analyzer only runs on a miss. Extraction
+    and analysis run on a small thread pool and the row moves through
+    queued -> processing -> done/failed. Pollers read the row; SSE listeners in
+    the same process are woken the moment a job finishes. A job still queued
+    or processing after ``CV_JOB_TIMEOUT`` (e.g. the worker restarted) is
+    reported as failed.
+    """
+
+    def __init__(self, workers=CV_ANALYSIS_WORKERS, upload_dir=CV_UPLOAD_DIR, timeout=CV_JOB_TIMEOUT):
+        self.upload_dir = upload_dir
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cv-analysis')
+        self._finished = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.upload_dir, exist_ok=True)
+
+    @staticmethod
+    def valid_id(job_id):
+        return bool(JOB_ID_RE.match(job_id or ''))
+
+    def _store_upload(self, uploaded_file, extension):
+        """Move (or copy) the upload out of Django's per-request temp file"""
+        path = os.path.join(self.upload_dir, f"cv_upload_{uuid.uuid4().hex}{extension}")
+        if hasattr(uploaded_file, 'temporary_file_path'):
+            # Large uploads are already on disk - a rename instead of rewriting them
+            uploaded_file.file.flush()
+            file_move_safe(uploaded_file.temporary_file_path(), path)
+        else:
+            with open(path, 'wb') as destination:
+                for chunk in uploaded_file.chunks():
+                    destination.write(chunk)
+        return path
+
+    def find_existing(self, user, content_hash):
+        """Latest usable analysis of these bytes for this user - done first, then one still running"""
+        from .models import CVAnalysis
+        jobs = CVAnalysis.objects.filter(
+            user=user, content_hash=content_hash, analyzer_version=CV_ANALYZER_VERSION,
+            status__in=['queued', 'processing', 'done'],
+        ).exclude(job_id=None)
+        job = jobs.filter(status='done').order_by('-uploaded_at').first()
+        if job is None:
+            job = jobs.order_by('-uploaded_at').first()
+            # An abandoned job (worker restarted) is not worth waiting for
+            if job is not None and self.get(job.job_id, user).status == 'failed':
+                job = None
+        return job
+
+    def submit(self, uploaded_file, user, analyze, content_hash=None):
+        """Queue ``analyze(path) -> report`` for an uploaded CV and return its CVAnalysis row
+
+        The second value is True when an earlier analysis of the same file was reused.
+        """
+        from .models import CVAnalysis
+        user = user if getattr(user, 'is_authenticated', False) else None
+        content_hash = content_hash or hash_uploaded_file(uploaded_file)
+        existing = self.find_existing(user, content_hash)
+        if existing is not None:
+            print(f"📄 CV job {existing.job_id} reused for an identical upload")
+            return existing, True
+
+        extension = os.path.splitext(uploaded_file.name)[1].lower()
+        path = self._store_upload(uploaded_file, extension)
+        try:
+            job = CVAnalysis.objects.create(
+                user=user,
+                original_filename=uploaded_file.name[:255],
+                file_size=uploaded_file.size or 0,
+                job_id=uuid.uuid4().hex,
+                status='queued',
+                content_hash=content_hash,
+                analyzer_version=CV_ANALYZER_VERSION,
+            )
+        except Exception:
+            os.unlink(path)
+            raise
+
+        with self._lock:
+            self._finished[job.job_id] = threading.Event()
+        self.executor.submit(self._run, job.job_id, path, analyze)
+        return job, False
+
+    def _run(self, job_id, path, analyze):
+        from .models import CVAnalysis
+        close_old_connections()
+        try:
+            CVAnalysis.objects.filter(job_id=job_id).update(status='processing', started_at=timezone.now())
+            try:
+                analysis = analyze(path)
+                CVAnalysis.objects.filter(job_id=job_id).update(
+                    status='done',
+                    analysis_result=analysis,
+                    ats_score=ats_score_from_analysis(analysis),
+                    finished_at=timezone.now(),
+                )
+                print(f"📄 CV job {job_id} done")
+            except Exception as e:
+                print(f"❌ CV job {job_id} failed: {e}")
+                CVAnalysis.objects.filter(job_id=job_id).update(
+                    status='failed', error=str(e)[:1000], finished_at=timezone.now()
+                )
+        except DatabaseError as e:
+            print(f"⚠️ Could not update CV job {job_id}: {e}")
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            with self._lock:
+                finished = self._finished.pop(job_id, None)
+            if finished is not None:
+                finished.set()
+            close_old_connections()
+
+    def get(self, job_id, user=None):
+        """The CVAnalysis row for a job, or None if it doesn't exist or belongs to someone else"""
+        from .models import CVAnalysis
+        if not self.valid_id(job_id):
+            return None
+        job = CVAnalysis.objects.filter(job_id=job_id).first()
+        if job is None:
+            return None
+        if job.user_id is not None and (not getattr(user, 'is_authenticated', False) or user.pk != job.user_id):
+            return None
+
+        with self._lock:
+            running_here = job_id in self._finished
+        # Jobs queued in this process are still coming; elsewhere only the clock can tell
+        if job.status in ('queued', 'processing') and not running_here \
+                and job.uploaded_at < timezone.now() - timedelta(seconds=self.timeout):
+            job.status = 'failed'
+            job.error = 'Analysis was interrupted. Please upload your CV again.'
+            CVAnalysis.objects.filter(pk=job.pk, status__in=['queued', 'processing']).update(
+                status=job.status, error=job.error, finished_at=timezone.now()
+            )
+        return job
+
+    @staticmethod
+    def as_dict(job):
+        data = {
+            'job_id': job.job_id,
+            'status': job.status,
+            'filename': job.original_filename,
+            'file_size': job.file_size,
+        }
+        if job.status == 'done':
+            data.update({'response': job.analysis_result, 'ats_score': job.ats_score})
+        elif job.status == 'failed':
+            data['error'] = job.error or 'Failed to analyze CV. Please try again.'
+        return data
+
+
+# Create global instance
+cv_jobs = CVJobRunner()
@@ -0,0 +1,304 @@
+# chatbot/intent_engine.py
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+# Checked in this order - on a tie the earlier intent wins, like the old if-chain
+INTENT_KEYWORDS = OrderedDict([
+    ('greeting', ['hi', 'hello', 'hey', 'namaste', 'good morning', 'good afternoon']),
+    ('internship_search', ['internship', 'job', 'placement', 'opportunity', 'work', 'apply', 'vacancy']),
+    ('cv_analysis', ['cv', 'resume', 'curriculum vitae', 'ats', 'profile', 'document']),
+    ('skill_analysis', ['skill', 'learn', 'course', 'training', 'improve', 'develop', 'gap']),
+    ('interview_prep', ['interview', 'mock', 'hr', 'technical', 'prepare', 'question', 'answer']),
+    ('career_guidance', ['career', 'future', 'guidance', 'path', 'roadmap', 'plan', 'goal']),
+    ('small_talk', ['name', 'who are you', 'what can you do', 'how are you', 'weather', 'time']),
+    ('help', ['help', 'assist', 'support', 'guide', 'advice']),
+])
+
+SKILL_KEYWORDS = [
+    'python', 'java', 'javascript', 'c++', 'c#',
+    'html', 'css', 'react', 'angular', 'vue',
+    'django', 'flask', 'node', 'express',
+    'sql', 'mongodb', 'mysql', 'postgresql',
+    'aws', 'azure', 'cloud', 'docker', 'kubernetes',
+    'machine learning', 'ai', 'data science', 'analytics',
+    'web development', 'mobile development', 'android', 'ios'
+]
+MAX_SKILLS = 5
+
+TOPIC_KEYWORDS = [
+    'project', 'certification', 'course', 'placement',
+    'salary', 'company', 'interview', 'preparation',
+    'study', 'learning', 'practice', 'portfolio'
+]
+
+INTERNSHIP_KEYWORDS = ['internship', 'job', 'placement', 'opportunity', 'work', 'apply']
+SKILL_RELATED_KEYWORDS = ['skill', 'learn', 'course', 'training', 'develop', 'improve']
+
+# Keywords this short only count as whole words ('hi' is not in 'which', 'ai' is not in 'email')
+SHORT_KEYWORD_CHARS = 3
+# Inflections under which a keyword still counts inside a longer keyword ('learn' in 'learning')
+INFLECTIONS = {'s', 'es', 'ing', 'ed', 'er', 'ers', 'ment', 'ments'}
+
+# A keyword starts a word unless one of these comes right before it; short keywords must also end one
+WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+KEYWORD_START_BLOCKERS = WORD_CHARS | {'+', '#'}
+# First two characters of every word in a message - only keywords starting with one of them are searched
+WORD_START_RE = re.compile(r'(?<![a-z0-9+#])([a-z][\s\S])')
+
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+# Labelled examples the nearest-centroid model is trained on at startup
+TRAINING_EXAMPLES = {
+    'greeting': [
+        'hi', 'hello', 'hey there', 'namaste', 'good morning', 'good afternoon', 'good evening',
+        'hello careerpal', 'hey how is it going', 'hi there friend', 'yo', 'greetings',
+    ],
+    'internship_search': [
+        'find me internships', 'python internship for cse students', 'any job openings for freshers',
+        'where can i apply for summer internships', 'remote internship with stipend', 'placement opportunities for ece',
+        'show me vacancies in bangalore', 'web development internship', 'data science internship near me',
+        'work from home opportunities', 'internships at startups', 'which companies are hiring interns',
+        'software developer jobs for freshers', 'frontend developer job openings',
+    ],
+    'cv_analysis': [
+        'review my cv', 'check my resume', 'is my resume ats friendly', 'analyze my curriculum vitae',
+        'how do i improve my resume score', 'what should i put in my cv', 'resume format for freshers',
+        'upload my profile document', 'ats score of my resume', 'cv tips for internship', 'my resume keeps getting rejected',
+    ],
+    'skill_analysis': [
+        'what skills should i learn', 'skill gap for data scientist', 'courses to learn react', 'how do i improve my coding',
+        'best training for cloud computing', 'develop my python skills', 'which programming language should i learn first',
+        'free courses for machine learning', 'what to learn for web development', 'upskill in devops', 'certifications for aws',
+    ],
+    'interview_prep': [
+        'interview tips', 'mock interview', 'hr interview questions', 'technical interview preparation',
+        'how to prepare for an interview', 'common interview questions and answers', 'tell me about yourself answer',
+        'coding round preparation', 'how to answer why should we hire you', 'group discussion tips', 'aptitude test practice',
+    ],
+    'career_guidance': [
+        'career advice', 'which career path suits me', 'roadmap to become a data scientist', 'plan my future',
+        'career goals after btech', 'should i do masters or a job', 'guidance for choosing a domain', 'long term career plan',
+        'how to become a software engineer', 'is cybersecurity a good career', 'switch from mechanical to software',
+    ],
+    'small_talk': [
+        'what is your name', 'who are you', 'what can you do', 'how are you', 'how is the weather',
+        'what time is it', 'are you a robot', 'tell me a joke', 'who made you', 'thank you', 'thanks a lot', 'bye',
+    ],
+    'help': [
+        'help', 'i need help', 'can you assist me', 'support please', 'guide me', 'i need some advice',
+        'i am confused what to do', 'i am stuck', 'can you help me out', 'please assist',
+    ],
+}
+
+
+def model_features(message):
+    """Stemmed unigrams + bigrams - a plural 's' is dropped ('skills' -> 'skill', not 'class')"""
+    tokens = [t[:-1] if len(t) > 3 and t[-1] == 's' and t[-2] != 's' else t
+              for t in TOKEN_RE.findall((message or '').lower())]
+    return tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+
+
+class IntentEngine:
+    """Intent, skills and topics for a chat message in one pass.
+
+    Every keyword list the offline path used to rescan with ``any(k in message)``
+    is merged into one table, so each distinct keyword is searched once per
+    message and every feature it implies (intent, skill, topic, flag) is
+    collected together. Searches are plain ``in``/``find`` (C-level, like the
+    old rules); a single combined regex with a lookahead at every word start
+    was slower than the rules it replaced. A keyword only counts at a word
+    start, the longest one at a position wins ('javascript' is not 'java'), and
+    keywords of ``SHORT_KEYWORD_CHARS`` or fewer must be whole words.
+
+    The intent is the keyword intent when exactly one matches, and ``general``
+    when none does - the old rules' answers. Only a tie between several keyword
+    intents is settled by a small TF-IDF nearest-centroid model trained at
+    startup on ``TRAINING_EXAMPLES``, so the model stays off the common path.
+    """
+
+    def __init__(self, examples=TRAINING_EXAMPLES):
+        self.intents = list(INTENT_KEYWORDS)
+        self._compile_keywords()
+        self._train(examples)
+        self.analyze_cached = lru_cache(maxsize=1024)(self._analyze)
+
+    # ---------- keyword pass ----------
+
+    def _compile_keywords(self):
+        # Every feature is one bit, in list order: intents, skills, topics, then the two flags -
+        # merging a keyword's features is an int OR and set bits come out already in list order
+        self.feature_bits = ([('intent', intent) for intent in self.intents]
+                             + [('skill', s) for s in SKILL_KEYWORDS]
+                             + [('topic', t) for t in TOPIC_KEYWORDS]
+                             + [('flag', 'internship_related'), ('flag', 'skill_related')])
+        bit_of = {feature: bit for bit, feature in enumerate(self.feature_bits)}
+        self._values = (list(self.intents) + [s.title() for s in SKILL_KEYWORDS]
+                        + list(TOPIC_KEYWORDS))
+        self._intent_mask = self._mask(bit_of, 'intent')
+        self._skill_mask = self._mask(bit_of, 'skill')
+        self._topic_mask = self._mask(bit_of, 'topic')
+        self._internship_bit = 1 << bit_of[('flag', 'internship_related')]
+        self._skill_related_bit = 1 << bit_of[('flag', 'skill_related')]
+
+        features = {}
+        for intent, keywords in INTENT_KEYWORDS.items():
+            for keyword in keywords:
+                features.setdefault(keyword, set()).add(('intent', intent))
+        for keyword in SKILL_KEYWORDS:
+            features.setdefault(keyword, set()).add(('skill', keyword))
+        for keyword in TOPIC_KEYWORDS:
+            features.setdefault(keyword, set()).add(('topic', keyword))
+        for keyword in INTERNSHIP_KEYWORDS:
+            features.setdefault(keyword, set()).add(('flag', 'internship_related'))
+        for keyword in SKILL_RELATED_KEYWORDS:
+            features.setdefault(keyword, set()).add(('flag', 'skill_related'))
+
+        # Keyword -> every feature it implies, including inflected shorter keywords
+        self.features = {}
+        for keyword in features:
+            implied = set(features[keyword])
+            for other in features:
+                if other != keyword and len(other) > SHORT_KEYWORD_CHARS and keyword.startswith(other) \
+                        and keyword[len(other):] in INFLECTIONS:
+                    implied |= features[other]
+            self.features[keyword] = sum(1 << bit_of[feature] for feature in implied)
+
+        # By first two characters, longest first - 'javascript' claims its position before 'java' is tried
+        self.search_order = {}
+        for keyword in sorted(features, key=len, reverse=True):
+            self.search_order.setdefault(keyword[:2], []).append((keyword, len(keyword) <= SHORT_KEYWORD_CHARS))
+
+    @staticmethod
+    def _mask(bit_of, kind):
+        return sum(1 << bit for feature, bit in bit_of.items() if feature[0] == kind)
+
+    @staticmethod
+    def _bits(mask):
+        """Set bit positions, lowest first"""
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+
+    @staticmethod
+    def _ends_word(text, end):
+        """Whole word ends at ``end``, allowing one plural 's' ('cvs', 'jobs')"""
+        if end < len(text) and text[end] == 's':
+            if end + 1 >= len(text) or text[end + 1] not in WORD_CHARS:
+                return True
+        return end >= len(text) or text[end] not in WORD_CHARS
+
+    def keyword_features(self, message):
+        """{('intent'|'skill'|'topic'|'flag', name)} the message's keywords point at"""
+        return {self.feature_bits[bit] for bit in self._bits(self.keyword_mask(message))}
+
+    def keyword_mask(self, message):
+        text = (message or '').lower()
+        claimed = set()
+        found = 0
+        for prefix in set(WORD_START_RE.findall(text)):
+            for keyword, short in self.search_order.get(prefix, ()):
+                if keyword not in text:
+                    continue
+                start = text.find(keyword)
+                while start != -1:
+                    if start not in claimed and (start == 0 or text[start - 1] not in KEYWORD_START_BLOCKERS) \
+                            and (not short or self._ends_word(text, start + len(keyword))):
+                        # Overlapping keywords at other positions still count ('learning' in 'machine learning')
+                        claimed.add(start)
+                        found |= self.features[keyword]
+                    start = text.find(keyword, start + 1)
+        return found
+
+    # ---------- model ----------
+
+    def _train(self, examples):
+        started = time.perf_counter()
+        documents = [(intent, Counter(model_features(text))) for intent, texts in examples.items() for text in texts]
+        self.vocabulary = {term: i for i, term in enumerate(sorted({t for _, counts in documents for t in counts}))}
+
+        doc_freq = Counter(t for _, counts in documents for t in counts)
+        self.idf = np.array([math.log((1 + len(documents)) / (1 + doc_freq[t])) + 1 for t in self.vocabulary])
+
+        centroids = np.zeros((len(self.intents), len(self.vocabulary)))
+        for intent, counts in documents:
+            vector = np.zeros(len(self.vocabulary))
+            for term, count in counts.items():
+                vector[self.vocabulary[term]] = count * self.idf[self.vocabulary[term]]
+            centroids[self.intents.index(intent)] += vector / np.linalg.norm(vector)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self.centroids = centroids / np.where(norms, norms, 1)
+        # Per-term (idf, centroid column) - scoring a short message in plain Python
+        # beats numpy's per-call overhead on arrays this small
+        self.term_weights = {
+            term: (float(self.idf[i]), tuple(float(w) for w in self.centroids[:, i]))
+            for term, i in self.vocabulary.items()
+        }
+
+        print(f"🧭 Intent model trained: {len(documents)} examples, {len(self.vocabulary)} terms in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    def intent_scores(self, message, candidates=None):
+        """Cosine similarity of the message to each intent centroid - or only to ``candidates`` (intent indexes)"""
+        if candidates is None:
+            candidates = range(len(self.intents))
+        # term -> (count * idf, centroid column)
+        weights = {}
+        for term in model_features(message):
+            entry = self.term_weights.get(term)
+            if entry is not None:
+                weights[term] = (weights[term][0] + entry[0], entry[1]) if term in weights else entry
+        norm = math.sqrt(sum(weight * weight for weight, _ in weights.values())) or 1.0
+        return [sum(weight * column[i] for weight, column in weights.values()) / norm for i in candidates]
+
+    # ---------- public API ----------
+
+    def _analyze(self, message):
+        found = self.keyword_mask(message)
+
+        # Intent bits are the intent indexes
+        candidates = self._bits(found & self._intent_mask)
+        if not candidates:
+            intent, confidence = 'general', None
+        elif len(candidates) == 1:
+            # Unambiguous keyword hit - no need to consult the model
+            intent, confidence = self.intents[candidates[0]], None
+        else:
+            scores = self.intent_scores(message, candidates)
+            # max() keeps the first index on a tie, i.e. the old priority order
+            best = max(range(len(candidates)), key=scores.__getitem__)
+            intent, confidence = self.intents[candidates[best]], round(scores[best], 3)
+
+        skills = topics = ()
+        if found & self._skill_mask:
+            skills = tuple(self._values[bit] for bit in self._bits(found & self._skill_mask)[:MAX_SKILLS])
+        if found & self._topic_mask:
+            topics = tuple(self._values[bit] for bit in self._bits(found & self._topic_mask))
+        return (intent, confidence, skills, topics,
+                bool(found & self._internship_bit), bool(found & self._skill_related_bit))
+
+    def analyze(self, message):
+        """{'intent', 'confidence', 'skills', 'topics', 'internship_related', 'skill_related'}
+
+        ``confidence`` is the model's similarity for the chosen intent, or None
+        when a single keyword intent (or no keyword at all) decided it.
+        """
+        intent, confidence, skills, topics, internship_related, skill_related = self.analyze_cached(message or '')
+        return {
+            'intent': intent,
+            'confidence': confidence,
+            'skills': list(skills),
+            'topics': list(topics),
+            'internship_related': internship_related,
+            'skill_related': skill_related,
+        }
+
+
+# Create global instance
+intent_engine = IntentEngine()
@@ -0,0 +1,111 @@
+# chatbot/llm_client.py
+import asyncio
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+    print("⚠️ httpx not available - async chat falls back to the pooled requests session. Install: pip install httpx")
+
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '200'))
+LLM_MAX_KEEPALIVE = int(os.getenv('LLM_MAX_KEEPALIVE', '50'))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv('LLM_KEEPALIVE_EXPIRY', '30'))
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '30'))
+LLM_CONNECT_TIMEOUT = 5
+
+
+class LLMRequestError(requests.RequestException):
+    """httpx failure re-raised as a RequestException so existing handlers catch it"""
+
+
+class LLMClient:
+    """Pooled keep-alive client for the OpenAI-compatible chat completions API.
+
+    Async callers share one ``httpx.AsyncClient`` per event loop - under
+    ``asgi.py`` that is the server's single loop, so TCP/TLS connections are
+    reused and a worker can keep hundreds of chats in flight without a thread
+    each. Sync callers share a ``requests.Session`` with a pool of the same size.
+    The chat views go through ``llm_gateway``, whose own loop owns the client.
+    """
+
+    def __init__(self, max_connections=LLM_MAX_CONNECTIONS, max_keepalive=LLM_MAX_KEEPALIVE, timeout=LLM_TIMEOUT):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.timeout = timeout
+        self._async_clients = {}
+        self._session = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def headers(api_key):
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    # ---------- sync ----------
+
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_keepalive)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+
+    def post(self, url, api_key, payload, stream=False):
+        """Raw pooled POST - callers handle the response (used for streaming)"""
+        return self.session().post(url, headers=self.headers(api_key), json=payload,
+                                   timeout=(LLM_CONNECT_TIMEOUT, self.timeout), stream=stream)
+
+    def complete(self, url, api_key, payload):
+        """Chat completion -> assistant message content"""
+        response = self.post(url, api_key, payload)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+    # ---------- async ----------
+
+    def async_client(self):
+        """The AsyncClient for the running loop - clients can't be shared across loops"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Forget clients whose loop has finished (e.g. one loop per request under WSGI)
+            self._async_clients = {l: c for l, c in self._async_clients.items() if not l.is_closed()}
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                    keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=LLM_CONNECT_TIMEOUT),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    async def acomplete(self, url, api_key, payload):
+        """Async chat completion -> assistant message content"""
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.complete, url, api_key, payload)
+
+        try:
+            response = await self.async_client().post(url, headers=self.headers(api_key), json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            # Keep the response so status-based retries can see 429/5xx
+            raise LLMRequestError(str(e), response=getattr(e, 'response', None)) from e
+        return response.json()["choices"][0]["message"]["content"]
+
+
+# Create global instance
+llm_client = LLMClient()
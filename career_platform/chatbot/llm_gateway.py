@@ -0,0 +1,237 @@
+# chatbot/llm_gateway.py
+import asyncio
+import concurrent.futures
+import os
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+import requests
+
+from .llm_client import llm_client
+
+LLM_MAX_IN_FLIGHT = int(os.getenv('LLM_MAX_IN_FLIGHT', '32'))
+LLM_MAX_QUEUE = int(os.getenv('LLM_MAX_QUEUE', '200'))
+LLM_QUEUE_TIMEOUT = float(os.getenv('LLM_QUEUE_TIMEOUT', '10'))
+LLM_RETRIES = int(os.getenv('LLM_RETRIES', '2'))
+LLM_RETRY_BASE_SECONDS = float(os.getenv('LLM_RETRY_BASE_SECONDS', '0.5'))
+LLM_RETRY_MAX_SECONDS = float(os.getenv('LLM_RETRY_MAX_SECONDS', '8'))
+# Latency budget for a chat reply - past it the local answer is sent (0 disables hedging)
+LLM_HEDGE_SECONDS = float(os.getenv('LLM_HEDGE_SECONDS', '4'))
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LLMBusyError(requests.RequestException):
+    """No LLM slot within LLM_QUEUE_TIMEOUT (or the queue is full) - callers fall back to local answers"""
+
+
+def retry_after_seconds(headers):
+    try:
+        return float(headers.get('Retry-After'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class LLMGateway:
+    """Bounded, retried and hedged access to the chat completions API.
+
+    Every LLM call of the worker - sync views, async views, streams - runs on
+    one gateway event loop (a daemon thread), so a single ``asyncio.Semaphore``
+    really bounds calls in flight at ``LLM_MAX_IN_FLIGHT``. Callers past that
+    queue in FIFO order for up to ``LLM_QUEUE_TIMEOUT`` (at most
+    ``LLM_MAX_QUEUE`` waiting) and get ``LLMBusyError`` after that. 429 and 5xx
+    answers are retried ``LLM_RETRIES`` times with full-jitter exponential
+    backoff, honouring ``Retry-After``.
+
+    The hedged calls return None once ``LLM_HEDGE_SECONDS`` pass, so the view
+    can answer locally. The model's reply keeps running on the gateway loop and
+    goes to ``on_late`` (the response cache) when it arrives, even though the
+    request that asked for it is long gone.
+    """
+
+    def __init__(self, max_in_flight=LLM_MAX_IN_FLIGHT, max_queue=LLM_MAX_QUEUE, queue_timeout=LLM_QUEUE_TIMEOUT,
+                 retries=LLM_RETRIES, hedge_seconds=LLM_HEDGE_SECONDS):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retries = retries
+        self.hedge_seconds = hedge_seconds
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+        self._queued = 0
+        self._loop = None
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'retries': 0, 'rejected': 0, 'failed': 0, 'hedged': 0, 'late_answers': 0,
+                      'queue_waits': 0, 'queue_wait_total': 0.0, 'queue_wait_max': 0.0}
+
+    # ---------- gateway loop ----------
+
+    def loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='llm-gateway', daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    async def _acquire(self):
+        """Wait for a slot (FIFO) - runs on the gateway loop"""
+        started = time.perf_counter()
+        if not self._semaphore.locked():
+            # A free slot is taken without yielding, so it never shows up as queued
+            await self._semaphore.acquire()
+        else:
+            if self._queued >= self.max_queue:
+                self._count('rejected')
+                raise LLMBusyError(f"LLM queue full ({self._queued} waiting)")
+            self._queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._count('rejected')
+                raise LLMBusyError(f"No LLM slot within {self.queue_timeout:g}s")
+            finally:
+                self._queued -= 1
+        self._in_flight += 1
+
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.stats['queue_waits'] += 1
+            self.stats['queue_wait_total'] += waited
+            self.stats['queue_wait_max'] = max(self.stats['queue_wait_max'], waited)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def _slot(self):
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def slot(self):
+        """Hold a slot from a sync thread (streams)"""
+        loop = self.loop()
+        asyncio.run_coroutine_threadsafe(self._acquire(), loop).result()
+        try:
+            yield
+        finally:
+            loop.call_soon_threadsafe(self._release)
+
+    # ---------- retries ----------
+
+    def _retry_delay(self, status_code, headers, attempt):
+        """Seconds to wait before retrying, or None to give up"""
+        if status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+            return None
+        delay = random.uniform(0, min(LLM_RETRY_MAX_SECONDS, LLM_RETRY_BASE_SECONDS * 2 ** attempt))
+        retry_after = retry_after_seconds(headers)
+        if retry_after is not None:
+            if retry_after > LLM_RETRY_MAX_SECONDS:
+                # Rate limited for longer than a user will wait - fail now and answer locally
+                return None
+            delay = max(delay, retry_after)
+        self._count('retries')
+        return delay
+
+    async def _complete(self, url, api_key, payload):
+        async with self._slot():
+            self._count('calls')
+            attempt = 0
+            while True:
+                try:
+                    return await llm_client.acomplete(url, api_key, payload)
+                except requests.RequestException as e:
+                    response = getattr(e, 'response', None)
+                    delay = self._retry_delay(getattr(response, 'status_code', None),
+                                              getattr(response, 'headers', None), attempt)
+                    if delay is None:
+                        self._count('failed')
+                        raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    # ---------- public API ----------
+
+    def submit(self, url, api_key, payload):
+        """Start a completion on the gateway loop -> concurrent.futures.Future of the reply text"""
+        return asyncio.run_coroutine_threadsafe(self._complete(url, api_key, payload), self.loop())
+
+    def _hedged(self, future, on_late):
+        """The caller stopped waiting - hand the reply to ``on_late`` whenever it arrives"""
+        self._count('hedged')
+
+        def deliver(done):
+            if done.cancelled() or done.exception() is not None:
+                return
+            try:
+                on_late(done.result())
+                self._count('late_answers')
+            except Exception as e:
+                print(f"⚠️ Could not keep late LLM answer: {e}")
+
+        future.add_done_callback(deliver)
+
+    def complete_hedged(self, url, api_key, payload, on_late):
+        """Reply text, or None if it isn't there within LLM_HEDGE_SECONDS"""
+        future = self.submit(url, api_key, payload)
+        try:
+            return future.result(timeout=self.hedge_seconds if self.hedge_seconds > 0 else None)
+        except concurrent.futures.TimeoutError:
+            self._hedged(future, on_late)
+            return None
+
+    async def acomplete_hedged(self, url, api_key, payload, on_late):
+        """Async complete_hedged"""
+        future = self.submit(url, api_key, payload)
+        # shield: giving up on the wait must not cancel the call itself
+        waiter = asyncio.shield(asyncio.wrap_future(future))
+        try:
+            return await asyncio.wait_for(waiter, self.hedge_seconds if self.hedge_seconds > 0 else None)
+        except asyncio.TimeoutError:
+            self._hedged(future, on_late)
+            return None
+
+    @contextmanager
+    def stream(self, url, api_key, payload):
+        """Streaming POST within a slot - 429/5xx are retried before any data is read"""
+        with self.slot():
+            self._count('calls')
+            attempt = 0
+            while True:
+                response = llm_client.post(url, api_key, payload, stream=True)
+                delay = self._retry_delay(response.status_code, response.headers, attempt)
+                if delay is None:
+                    break
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+            with response:
+                yield response
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self.stats)
+        waits = stats.pop('queue_waits')
+        stats['queue_wait_avg_ms'] = round(stats.pop('queue_wait_total') / waits * 1000, 1) if waits else 0.0
+        stats['queue_wait_max_ms'] = round(stats.pop('queue_wait_max') * 1000, 1)
+        stats.update({
+            'in_flight': self._in_flight,
+            'queued': self._queued,
+            'max_in_flight': self.max_in_flight,
+            'hedge_seconds': self.hedge_seconds,
+        })
+        return stats
+
+
+# Create global instance
+llm_gateway = LLMGateway()
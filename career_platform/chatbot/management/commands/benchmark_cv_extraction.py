@@ -0,0 +1,149 @@
+# chatbot/management/commands/benchmark_cv_extraction.py
+import os
+import random
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from chatbot.cv_extraction import CVTextExtractor, PDF_AVAILABLE, pypdf
+
+try:
+    from docx import Document
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+PAGE_COUNTS = (2, 20, 200)
+LINES_PER_PAGE = 45
+
+CV_LINES = [
+    'Developed a Django REST API serving 20000 requests per day',
+    'Built a React dashboard for placement analytics with 12 charts',
+    'Education: B.Tech Computer Science, Biju Patnaik University of Technology, CGPA 8.6',
+    'Skills: Python, Java, SQL, Docker, AWS, Git, HTML, CSS, JavaScript',
+    'Internship: Software Engineering Intern at Infosys, May 2024 - July 2024',
+    'Improved query latency by 35 percent by adding composite indexes',
+    'Project: Career Connect - internship recommender using TF-IDF and BM25',
+    'Certifications: AWS Cloud Practitioner, NPTEL Data Structures (Elite)',
+    'Led a team of 4 students to build an attendance system with face recognition',
+    'Contact: student@example.com | +91 98765 43210 | linkedin.com/in/student',
+]
+
+
+def cv_lines(pages):
+    rng = random.Random(pages)
+    return [[f"{rng.choice(CV_LINES)} ({page + 1}.{line + 1})" for line in range(LINES_PER_PAGE)]
+            for page in range(pages)]
+
+
+def write_pdf(path, pages):
+    """Minimal text-only PDF, one content stream per page"""
+    def escape(text):
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for lines in pages:
+        stream = 'BT /F1 9 Tf 40 800 Td 11 TL ' + ' '.join(f"({escape(line)}) '" for line in lines) + ' ET'
+        stream = stream.encode('latin-1')
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects))
+        kids.append(len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(b'%d 0 R' % k for k in kids), len(kids))
+
+    with open(path, 'wb') as f:
+        f.write(b'%PDF-1.4\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+        xref = f.tell()
+        f.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b'%010d 00000 n \n' % offset)
+        f.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+
+
+def write_docx(path, pages):
+    document = Document()
+    for lines in pages:
+        for line in lines:
+            document.add_paragraph(line)
+    document.save(path)
+
+
+def legacy_pdf(path):
+    """The old extraction: every page, serially, with string +="""
+    text = ""
+    reader = pypdf.PdfReader(path)
+    for page in reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    return text
+
+
+def legacy_docx(path):
+    text = ""
+    for para in Document(path).paragraphs:
+        if para.text:
+            text += para.text + "\n"
+    return text
+
+
+class Command(BaseCommand):
+    help = 'Benchmark CV text extraction (old serial extraction vs the budgeted, parallel engine) on generated CVs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, nargs='+', default=list(PAGE_COUNTS), help='CV lengths to generate')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+
+    def measure(self, func, path, repeat):
+        best, result = None, ''
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func(path)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best * 1000, result
+
+    def handle(self, *args, **options):
+        engine = CVTextExtractor()
+        unbudgeted = CVTextExtractor(max_pages=10 ** 6, max_chars=10 ** 9)
+        self.stdout.write(f"Engine: {engine.max_pages} pages / {engine.max_chars:,} chars budget, "
+                          f"{engine.processes} processes from {engine.parallel_min_pages} pages\n")
+        self.stdout.write(f"{'file':<14} {'mode':<20} {'ms':>10} {'chars':>10}")
+
+        with tempfile.TemporaryDirectory() as directory:
+            modes = []
+            if PDF_AVAILABLE:
+                modes.append(('pdf', write_pdf, legacy_pdf, engine.extract_pdf, unbudgeted.extract_pdf))
+            if DOCX_AVAILABLE:
+                modes.append(('docx', write_docx, legacy_docx, engine.extract_docx, unbudgeted.extract_docx))
+            if not modes:
+                self.stdout.write(self.style.ERROR("❌ Neither pypdf nor python-docx is installed"))
+                return
+
+            for extension, write, legacy, budgeted, full in modes:
+                for pages in options['pages']:
+                    path = os.path.join(directory, f"cv_{pages}.{extension}")
+                    write(path, cv_lines(pages))
+                    name = f"{pages}p .{extension}"
+                    # Start the worker processes outside the timings
+                    budgeted(path)
+                    full(path)
+
+                    results = {}
+                    for mode, func in (('old serial', legacy), ('engine', budgeted), ('engine (no budget)', full)):
+                        ms, text = self.measure(func, path, options['repeat'])
+                        results[mode] = (ms, text)
+                        self.stdout.write(f"{name:<14} {mode:<20} {ms:>10.1f} {len(text):>10,}")
+
+                    old_ms, old_text = results['old serial']
+                    if results['engine (no budget)'][1] != old_text:
+                        self.stdout.write(self.style.WARNING(f"⚠️ {name}: engine text differs from the old extraction"))
+                    else:
+                        ms = results['engine'][0]
+                        self.stdout.write(self.style.SUCCESS(f"✅ {name}: same text, {old_ms / ms:.1f}x the old speed within the budget"))
@@ -0,0 +1,108 @@
+# chatbot/management/commands/benchmark_intents.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from chatbot import intent_engine as engine_module
+from chatbot.intent_engine import intent_engine
+
+# Held-out messages (not in TRAINING_EXAMPLES) with the intent a person would give them
+EVALUATION_MESSAGES = [
+    ('hello there', 'greeting'),
+    ('hey, good morning!', 'greeting'),
+    ('namaste careerpal', 'greeting'),
+    ('hi, show me python internships', 'internship_search'),
+    ('machine learning internships for third year', 'internship_search'),
+    ('any openings for freshers in pune', 'internship_search'),
+    ('which companies hire mechanical interns', 'internship_search'),
+    ('how do i apply for the google internship', 'internship_search'),
+    ('paid internships in web development', 'internship_search'),
+    ('find remote jobs for java developers', 'internship_search'),
+    ('can you check my resume', 'cv_analysis'),
+    ('is my cv good enough for product companies', 'cv_analysis'),
+    ('what is an ats score', 'cv_analysis'),
+    ('rate my resume please', 'cv_analysis'),
+    ('which skills am i missing for a data analyst role', 'skill_analysis'),
+    ('what should i learn after html and css', 'skill_analysis'),
+    ('suggest a course for docker', 'skill_analysis'),
+    ('how can i get better at sql', 'skill_analysis'),
+    ('which technologies are trending this year', 'skill_analysis'),
+    ('tips for my amazon interview', 'interview_prep'),
+    ('what questions are asked in an hr round', 'interview_prep'),
+    ('how do i prepare for a technical round', 'interview_prep'),
+    ('give me a mock interview on dbms', 'interview_prep'),
+    ('which is the better career, data science or web development', 'career_guidance'),
+    ('roadmap to become a cloud engineer', 'career_guidance'),
+    ('what should i do after graduation', 'career_guidance'),
+    ('is it worth doing an mba', 'career_guidance'),
+    ('what is your name', 'small_talk'),
+    ('how are you today', 'small_talk'),
+    ('thanks, that was useful', 'small_talk'),
+    ('who built you', 'small_talk'),
+    ('i need some help', 'help'),
+    ('can you assist me with something', 'help'),
+    ('i am totally lost', 'help'),
+]
+
+
+def legacy_analyze(message):
+    """The keyword rules the engine replaced: one substring scan per list"""
+    message_lower = message.lower()
+    intent = 'general'
+    for name, keywords in engine_module.INTENT_KEYWORDS.items():
+        if any(keyword in message_lower for keyword in keywords):
+            intent = name
+            break
+    skills = [s.title() for s in engine_module.SKILL_KEYWORDS if s in message_lower][:engine_module.MAX_SKILLS]
+    topics = [t for t in engine_module.TOPIC_KEYWORDS if t in message_lower]
+    internship_related = any(k in message_lower for k in engine_module.INTERNSHIP_KEYWORDS)
+    skill_related = any(k in message_lower for k in engine_module.SKILL_RELATED_KEYWORDS)
+    return intent, skills, topics, internship_related, skill_related
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the chatbot intent engine against the old keyword rules (speed and accuracy)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help='Passes over the evaluation messages')
+        parser.add_argument('--verbose', action='store_true', help='List every message the two disagree on')
+
+    def throughput(self, func, messages, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for message in messages:
+                func(message)
+        return iterations * len(messages) / (time.perf_counter() - started)
+
+    def handle(self, *args, **options):
+        messages = [m for m, _ in EVALUATION_MESSAGES]
+        iterations = options['iterations']
+
+        legacy_rate = self.throughput(legacy_analyze, messages, iterations)
+        # Uncached - every message goes through the keyword pass, ties through the model too
+        engine_rate = self.throughput(intent_engine._analyze, messages, iterations)
+        # The views ask about the same message several times per reply - those are cache hits
+        cached_rate = self.throughput(intent_engine.analyze, messages, iterations)
+        self.stdout.write(f"{'mode':<16} {'messages/sec':>14}")
+        self.stdout.write(f"{'legacy rules':<16} {legacy_rate:>14,.0f}")
+        self.stdout.write(f"{'engine':<16} {engine_rate:>14,.0f}")
+        self.stdout.write(f"{'engine (cached)':<16} {cached_rate:>14,.0f}\n")
+
+        legacy_correct = engine_correct = agree = 0
+        for message, expected in EVALUATION_MESSAGES:
+            legacy = legacy_analyze(message)
+            result = intent_engine.analyze(message)
+            legacy_correct += legacy[0] == expected
+            engine_correct += result['intent'] == expected
+            agree += legacy[0] == result['intent']
+            if options['verbose'] and legacy[0] != result['intent']:
+                self.stdout.write(f"  {message!r}: expected {expected}, rules {legacy[0]}, engine {result['intent']} ({result['confidence']})")
+
+        total = len(EVALUATION_MESSAGES)
+        self.stdout.write(f"Intent accuracy on {total} labelled messages: rules {legacy_correct / total:.0%}, engine {engine_correct / total:.0%}")
+        self.stdout.write(f"Agreement with the rules: {agree / total:.0%}")
+
+        if engine_correct >= legacy_correct:
+            self.stdout.write(self.style.SUCCESS(f"✅ Intent engine: {engine_rate:,.0f} messages/sec uncached, {engine_correct - legacy_correct} more messages classified correctly than the rules"))
+        else:
+            self.stdout.write(self.style.WARNING(f"⚠️ Intent engine is less accurate than the rules ({engine_correct} vs {legacy_correct}) - add training examples"))
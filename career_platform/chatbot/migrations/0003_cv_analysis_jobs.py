@@ -0,0 +1,85 @@
+# Generated by Django 5.2 on 2026-10-19 14:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0002_conversation_store"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="error",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="file_size",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="finished_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="job_id",
+            field=models.CharField(blank=True, max_length=32, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                default="done",
+                max_length=20,
+            ),
+        ),
+        # Rows from before background jobs were already analysed - new jobs start queued
+        migrations.AlterField(
+            model_name="cvanalysis",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                default="queued",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="cvanalysis",
+            name="analysis_result",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AlterField(
+            model_name="cvanalysis",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-19 14:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0003_cv_analysis_jobs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="analyzer_version",
+            field=models.CharField(blank=True, default="", max_length=20),
+        ),
+        migrations.AddField(
+            model_name="cvanalysis",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name="cvanalysis",
+            index=models.Index(
+                fields=["user", "content_hash", "analyzer_version"],
+                name="cv_analysis_dedupe_idx",
+            ),
+        ),
+    ]
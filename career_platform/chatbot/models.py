@@ -5,7 +5,8 @@ from django.db import models
 from django.contrib.auth.models import User
 
 class ChatConversation(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Null for anonymous chats - the conversation_id still ties their turns together
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     message = models.TextField()
     response = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
@@ -13,13 +14,38 @@ class ChatConversation(models.Model):
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['conversation_id', '-timestamp'], name='chat_conversation_turns_idx'),
+        ]
 
 class CVAnalysis(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     original_filename = models.CharField(max_length=255)
-    analysis_result = models.TextField()
+    analysis_result = models.TextField(blank=True, default='')
     uploaded_at = models.DateTimeField(auto_now_add=True)
     ats_score = models.IntegerField(default=0)
     
+    # Background job state - the upload is analysed off the request thread
+    job_id = models.CharField(max_length=32, unique=True, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    error = models.TextField(blank=True, default='')
+    file_size = models.BigIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    # Re-uploads of the same file are answered from an earlier analysis
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    analyzer_version = models.CharField(max_length=20, blank=True, default='')
+    
     class Meta:
-        ordering = ['-uploaded_at']
\ No newline at end of file
+        ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['user', 'content_hash', 'analyzer_version'], name='cv_analysis_dedupe_idx'),
+        ]
\ No newline at end of file
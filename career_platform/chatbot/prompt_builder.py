@@ -0,0 +1,214 @@
+# chatbot/prompt_builder.py
+import logging
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TOKEN_BUDGET = int(os.getenv('PROMPT_TOKEN_BUDGET', '2500'))
+PROMPT_HISTORY_MESSAGES = int(os.getenv('PROMPT_HISTORY_MESSAGES', '6'))
+PROMPT_HISTORY_MESSAGE_TOKENS = int(os.getenv('PROMPT_HISTORY_MESSAGE_TOKENS', '350'))
+PROMPT_SUMMARY_TOKENS = int(os.getenv('PROMPT_SUMMARY_TOKENS', '120'))
+PROMPT_PREFIX_CACHE_SIZE = int(os.getenv('PROMPT_PREFIX_CACHE_SIZE', '512'))
+# Chat template tokens around every message (role header, end-of-turn)
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_WORDS_PER_QUESTION = 12
+SUMMARY_LEAD = "Earlier in this conversation the student asked about: "
+
+SYSTEM_PROMPT_TEMPLATE = """You are CareerPal AI, an advanced career assistant specialized for BPUT students in Odisha, India.
+
+USER PROFILE:
+{user_info}
+
+YOUR EXPERTISE:
+1. **CV/Resume Analysis**: ATS optimization, formatting, content improvement
+2. **Internship Matching**: Real opportunities from Indian companies
+3. **Skill Development**: Gap analysis, learning paths, course recommendations
+4. **Interview Preparation**: Technical questions, mock interviews, HR rounds
+5. **Career Planning**: Roadmaps, goal setting, progression strategies
+6. **BPUT Specific**: College resources, placement trends, alumni network
+
+RESPONSE GUIDELINES:
+- Be specific, actionable, and practical
+- Mention Indian companies (TCS, Infosys, Wipro, etc.)
+- Recommend free/affordable resources (NPTEL, YouTube, FreeCodeCamp)
+- Include Odisha-specific opportunities
+- Use emojis appropriately for engagement
+- Break complex advice into numbered/bulleted points
+- Always ask follow-up questions to continue conversation
+- Be encouraging and motivational
+
+FORMAT REQUIREMENTS:
+- Use markdown formatting for readability
+- Include emojis relevant to the topic
+- Bold important terms
+- Separate sections clearly
+
+EXAMPLE RESPONSES:
+- "🎯 Based on your Python skills, here are 3 internships..."
+- "📄 Your CV needs these ATS optimizations..."
+- "🚀 For web development, follow this 90-day roadmap..."
+
+"""
+
+
+def estimate_tokens(text):
+    """Llama-3 token count estimate without a tokenizer.
+
+    About 4 UTF-8 bytes or 3/4 of a word per token, whichever gives more - the
+    byte count keeps Hindi/Odia text and emojis from being undercounted.
+    """
+    if not text:
+        return 0
+    return max(len(text.encode('utf-8')) // 4, len(text.split()) * 4 // 3) + 1
+
+
+def clip_to_tokens(text, max_tokens):
+    """Head of ``text`` within roughly ``max_tokens``, cut at a word boundary"""
+    # Past 4 characters a token nothing fits, so long answers aren't measured in full
+    head = text[:max_tokens * 4 + 4]
+    tokens = estimate_tokens(head)
+    if tokens <= max_tokens:
+        return text
+    cut = max(int(len(head) * max_tokens / tokens) - 2, 0)
+    space = head.rfind(' ', 0, cut)
+    return head[:space if space > cut // 2 else cut].rstrip() + ' …'
+
+
+class PromptBuilder:
+    """System prompt + history + message for the Groq chat call, within a token budget.
+
+    The static part of the system prompt depends only on the user profile, so
+    it is rendered and measured once per profile signature (LRU of
+    ``PROMPT_PREFIX_CACHE_SIZE``); only the timestamp line is added per call.
+    The newest ``PROMPT_HISTORY_MESSAGES`` history messages are kept while they
+    fit ``PROMPT_TOKEN_BUDGET``, each clipped to
+    ``PROMPT_HISTORY_MESSAGE_TOKENS``. Older or dropped user questions are
+    folded into a one-line summary so the model keeps the thread. The current
+    message is never cut.
+    """
+
+    def __init__(self, budget=PROMPT_TOKEN_BUDGET, history_messages=PROMPT_HISTORY_MESSAGES,
+                 history_message_tokens=PROMPT_HISTORY_MESSAGE_TOKENS, summary_tokens=PROMPT_SUMMARY_TOKENS,
+                 prefix_cache_size=PROMPT_PREFIX_CACHE_SIZE):
+        self.budget = budget
+        self.history_messages = history_messages
+        self.history_message_tokens = history_message_tokens
+        self.summary_tokens = summary_tokens
+        self.prefix = lru_cache(maxsize=prefix_cache_size)(self._prefix)
+        self.stats = {'prompts': 0, 'prompt_tokens': 0, 'max_prompt_tokens': 0, 'clipped_messages': 0,
+                      'dropped_messages': 0, 'summaries': 0, 'over_budget': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _prefix(user_info):
+        """(static system prompt, its token estimate) for one user profile"""
+        prompt = SYSTEM_PROMPT_TEMPLATE.format(user_info=user_info)
+        return prompt, estimate_tokens(prompt)
+
+    @staticmethod
+    def _context_line():
+        return f"CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+
+    def system_prompt(self, user_info):
+        prefix, _ = self.prefix(user_info)
+        return prefix + self._context_line()
+
+    def _summary(self, messages):
+        """'Earlier ... asked about: a; b' from the user turns that didn't make it into the prompt"""
+        questions = []
+        for msg in reversed(messages):
+            if msg.get('role') != 'user' or not isinstance(msg.get('content'), str):
+                continue
+            words = msg['content'].split()
+            if not words:
+                continue
+            question = ' '.join(words[:SUMMARY_WORDS_PER_QUESTION])
+            if len(words) > SUMMARY_WORDS_PER_QUESTION:
+                question += '…'
+            if estimate_tokens(SUMMARY_LEAD + '; '.join(questions + [question])) > self.summary_tokens:
+                break
+            questions.append(question)
+        if not questions:
+            return None
+        questions.reverse()
+        return SUMMARY_LEAD + '; '.join(questions)
+
+    def build(self, message, conversation_history, user_info):
+        """Chat messages for one request"""
+        prefix, prefix_tokens = self.prefix(user_info)
+        context_line = self._context_line()
+        system = prefix + context_line
+        system_tokens = prefix_tokens + estimate_tokens(context_line) + MESSAGE_OVERHEAD_TOKENS
+        used = system_tokens
+        message_tokens = estimate_tokens(message) + MESSAGE_OVERHEAD_TOKENS
+        used += message_tokens
+
+        history = [m for m in conversation_history or [] if isinstance(m, dict) and isinstance(m.get('content'), str)]
+        window = history[-self.history_messages:] if self.history_messages > 0 else []
+        older = history[:len(history) - len(window)]
+
+        # Newest first, so a tight budget drops the oldest turns
+        kept = []
+        clipped = 0
+        reserve = self.summary_tokens + MESSAGE_OVERHEAD_TOKENS if older else 0
+        for index in range(len(window) - 1, -1, -1):
+            msg = window[index]
+            content = clip_to_tokens(msg['content'], self.history_message_tokens)
+            tokens = estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+            if used + tokens + reserve > self.budget:
+                older = history[:len(history) - len(window) + index + 1]
+                break
+            if content is not msg['content']:
+                clipped += 1
+            # Only conversation turns - a client can't slip in extra system messages
+            role = msg.get('role') if msg.get('role') in ('user', 'assistant') else 'user'
+            kept.append({'role': role, 'content': content})
+            used += tokens
+        kept.reverse()
+
+        messages = [{"role": "system", "content": system}]
+        summary = self._summary(older) if older else None
+        if summary and used + estimate_tokens(summary) + MESSAGE_OVERHEAD_TOKENS <= self.budget:
+            messages.append({"role": "system", "content": summary})
+            used += estimate_tokens(summary) + MESSAGE_OVERHEAD_TOKENS
+        else:
+            summary = None
+        messages.extend(kept)
+        messages.append({"role": "user", "content": message})
+
+        with self._lock:
+            self.stats['prompts'] += 1
+            self.stats['prompt_tokens'] += used
+            self.stats['max_prompt_tokens'] = max(self.stats['max_prompt_tokens'], used)
+            self.stats['clipped_messages'] += clipped
+            self.stats['dropped_messages'] += len(older)
+            if summary:
+                self.stats['summaries'] += 1
+            if used > self.budget:
+                self.stats['over_budget'] += 1
+        logger.info(f"Prompt ~{used} tokens (system {system_tokens}, message {message_tokens}, "
+                    f"history {len(kept)}/{len(history)} messages, {clipped} clipped, "
+                    f"summary {'yes' if summary else 'no'}, budget {self.budget})")
+        if used > self.budget:
+            logger.warning(f"Prompt ~{used} tokens is over the {self.budget} token budget - the message itself is too long")
+        return messages
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self.stats)
+        info = self.prefix.cache_info()
+        stats.update({
+            'budget': self.budget,
+            'avg_prompt_tokens': round(stats['prompt_tokens'] / stats['prompts']) if stats['prompts'] else 0,
+            'prefix_hits': info.hits,
+            'prefix_misses': info.misses,
+            'prefix_entries': info.currsize,
+        })
+        return stats
+
+
+# Create global instance
+prompt_builder = PromptBuilder()
@@ -0,0 +1,216 @@
+# chatbot/response_cache.py
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from difflib import SequenceMatcher
+
+import numpy as np
+
+CHAT_CACHE_ENABLED = os.getenv('CHAT_CACHE_ENABLED', 'true').lower() == 'true'
+CHAT_CACHE_TTL = int(os.getenv('CHAT_CACHE_TTL', str(6 * 60 * 60)))
+CHAT_CACHE_MAX_ENTRIES = int(os.getenv('CHAT_CACHE_MAX_ENTRIES', '2000'))
+CHAT_CACHE_SIMILARITY = float(os.getenv('CHAT_CACHE_SIMILARITY', '0.8'))
+
+VECTOR_DIM = 2048
+TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+STOPWORDS = {
+    'a', 'an', 'the', 'to', 'for', 'of', 'in', 'on', 'at', 'and', 'or', 'is', 'are', 'am', 'be',
+    'i', 'me', 'my', 'you', 'your', 'we', 'can', 'could', 'would', 'should', 'do', 'does', 'how',
+    'what', 'which', 'please', 'pls', 'tell', 'give', 'show', 'want', 'need', 'some', 'any', 'about',
+    'with', 'get', 'best', 'good', 'top', 'hi', 'hello', 'hey', 'suggest', 'recommend', 'find', 'help',
+    'know', 'like', 'guide', 'list', 'student', 'students',
+}
+# Messages that lean on the previous turn can't be answered from the cache
+FOLLOW_UP_WORDS = {'it', 'that', 'this', 'those', 'these', 'them', 'more', 'above', 'again', 'else', 'same', 'previous'}
+
+
+def normalize_message(message):
+    return ' '.join(TOKEN_RE.findall((message or '').lower()))
+
+
+def salient_tokens(message):
+    """Content words, lightly stemmed so 'internships' == 'internship'"""
+    tokens = []
+    for token in TOKEN_RE.findall((message or '').lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def hashed_vector(tokens):
+    """L2-normalised hashed word + char trigram vector"""
+    vector = np.zeros(VECTOR_DIM, dtype=np.float32)
+    features = [(t, 1.0) for t in tokens]
+    for token in tokens:
+        padded = f' {token} '
+        features.extend((padded[i:i + 3], 0.5) for i in range(len(padded) - 2))
+    for feature, weight in features:
+        index = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=4).digest(), 'little') % VECTOR_DIM
+        vector[index] += weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def tokens_compatible(tokens, other_tokens):
+    """Every word only one side has must be a spelling variant of a word on the other side.
+
+    Stops 'TCS interview' from answering 'Infosys interview' while still letting
+    'internship for CSE' match 'internships for cse'.
+    """
+    tokens, other_tokens = set(tokens), set(other_tokens)
+    for token in tokens ^ other_tokens:
+        counterparts = other_tokens - tokens if token in tokens else tokens - other_tokens
+        if not any(SequenceMatcher(None, token, c).ratio() >= 0.8 for c in counterparts):
+            return False
+    return True
+
+
+class ChatResponseCache:
+    """Exact + semantic cache of LLM answers, in front of the Groq call.
+
+    Entries are partitioned by user context (branch, year, language, plus a
+    digest of the name, skills and interests the prompt includes) so no student
+    is served an answer written for someone else's profile. The exact
+    layer matches the normalised message; the semantic layer compares hashed
+    n-gram vectors within the partition and accepts the closest entry above
+    ``CHAT_CACHE_SIMILARITY`` whose differing words are only spelling variants.
+    Entries expire after ``CHAT_CACHE_TTL`` and the least recently used are
+    evicted beyond ``CHAT_CACHE_MAX_ENTRIES``.
+    """
+
+    def __init__(self, ttl=CHAT_CACHE_TTL, max_entries=CHAT_CACHE_MAX_ENTRIES,
+                 similarity=CHAT_CACHE_SIMILARITY, enabled=CHAT_CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._partitions = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'exact_hits': 0, 'semantic_hits': 0, 'misses': 0, 'bypassed': 0,
+            'stores': 0, 'evictions': 0, 'expirations': 0,
+        }
+
+    @staticmethod
+    def personal_key(user_context):
+        """Digest of the personal fields the prompt carries (name, skills, interests)"""
+        parts = [str(user_context.get('username') or '').strip().lower()]
+        for field in ('skills', 'interests'):
+            values = user_context.get(field) or []
+            if isinstance(values, str):
+                values = values.split(',')
+            parts.append(','.join(sorted({str(v).strip().lower() for v in values if str(v).strip()})))
+        return hashlib.blake2b('\x1f'.join(parts).encode(), digest_size=8).hexdigest()
+
+    @classmethod
+    def context_key(cls, user_context, language='en'):
+        user_context = user_context or {}
+        branch = (user_context.get('department') or user_context.get('branch') or '').strip().lower()
+        year = str(user_context.get('year') or '').strip().lower()
+        return (branch, year, language or 'en', cls.personal_key(user_context))
+
+    @staticmethod
+    def is_cacheable(message):
+        tokens = TOKEN_RE.findall((message or '').lower())
+        return len(salient_tokens(message)) >= 2 and not FOLLOW_UP_WORDS.intersection(tokens)
+
+    # ---------- partitions (semantic layer) ----------
+
+    def _partition(self, context):
+        """(keys, matrix) for one context - rebuilt lazily after changes"""
+        partition = self._partitions.get(context)
+        if partition is None:
+            keys = [key for key in self._entries if key[0] == context]
+            matrix = np.stack([self._entries[k]['vector'] for k in keys]) if keys else np.zeros((0, VECTOR_DIM), dtype=np.float32)
+            partition = self._partitions[context] = (keys, matrix)
+        return partition
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        self._partitions.pop(key[0], None)
+
+    # ---------- public API ----------
+
+    def get(self, message, user_context=None, language='en', bypass=False):
+        """Cached answer or None"""
+        if bypass or not self.enabled:
+            self.stats['bypassed'] += 1
+            return None
+        if not self.is_cacheable(message):
+            return None
+
+        context = self.context_key(user_context, language)
+        key = (context, normalize_message(message))
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry['expires'] > now:
+                    self._entries.move_to_end(key)
+                    self.stats['exact_hits'] += 1
+                    return entry['response']
+                self._remove(key)
+                self.stats['expirations'] += 1
+
+            tokens = salient_tokens(message)
+            keys, matrix = self._partition(context)
+            if len(keys):
+                scores = matrix @ hashed_vector(tokens)
+                for index in np.argsort(-scores):
+                    if scores[index] < self.similarity:
+                        break
+                    candidate = self._entries.get(keys[index])
+                    if candidate is None or candidate['expires'] <= now:
+                        continue
+                    if tokens_compatible(tokens, candidate['tokens']):
+                        self._entries.move_to_end(keys[index])
+                        self.stats['semantic_hits'] += 1
+                        return candidate['response']
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, message, response, user_context=None, language='en', bypass=False):
+        if bypass or not self.enabled or not response or not self.is_cacheable(message):
+            return
+        context = self.context_key(user_context, language)
+        key = (context, normalize_message(message))
+        tokens = salient_tokens(message)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = {
+                'response': response,
+                'expires': time.time() + self.ttl,
+                'tokens': tokens,
+                'vector': hashed_vector(tokens),
+            }
+            self.stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._partitions.clear()
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['exact_hits'] + stats['semantic_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['exact_hits'] + stats['semantic_hits']) / lookups, 3) if lookups else 0.0
+        stats['enabled'] = self.enabled
+        return stats
+
+
+# Create global instance
+response_cache = ChatResponseCache()
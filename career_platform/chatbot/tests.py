@@ -1,3 +1,118 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
 # Create your tests here.
+from .conversation_store import ConversationStore
+from .response_cache import ChatResponseCache
+from . import views
+
+
+class FakeStream:
+    """Streaming Groq response with one content delta"""
+    status_code = 200
+    encoding = None
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self, chunk_size=None, decode_unicode=False):
+        yield 'data: {"choices": [{"delta": {"content": "streamed reply"}}]}'
+        yield 'data: [DONE]'
+
+
+class ConversationHistoryGroqTests(TestCase):
+    """Server-side history reaches the Groq payload on every chat path"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('student', password='x')
+        # Nothing is flushed during the test - the hot entry serves the history
+        self.store = ConversationStore(flush_seconds=3600)
+        self.conversation_id = self.store.start(self.user)
+        self.store.append(self.conversation_id, self.user, 'earlier question', 'earlier answer')
+        patches = [
+            mock.patch.object(views, 'conversation_store', self.store),
+            mock.patch.object(views.career_ai, 'groq_api_key', 'gsk_test'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.store._pending.clear)
+
+    def sent_contents(self, payload):
+        return [m['content'] for m in payload['messages']]
+
+    def test_chat_with_conversation_id_calls_groq_with_history(self):
+        with mock.patch.object(views.llm_gateway, 'complete_hedged', return_value='groq reply') as complete:
+            response = views.career_ai.chat_with_ai('tell me a joke', [], {}, use_cache=False,
+                                                    conversation_id=self.conversation_id, user=self.user)
+        self.assertEqual(complete.call_count, 1)
+        self.assertIn('groq reply', response)
+        contents = self.sent_contents(complete.call_args[0][2])
+        self.assertIn('earlier question', contents)
+        self.assertIn('earlier answer', contents)
+
+    def test_stream_with_conversation_id_calls_groq_with_history(self):
+        payloads = []
+
+        @contextmanager
+        def stream(url, api_key, payload):
+            payloads.append(payload)
+            yield FakeStream()
+
+        with mock.patch.object(views.llm_gateway, 'stream', stream):
+            chunks = list(views.career_ai.stream_chat('tell me a joke', [], {}, use_cache=False,
+                                                      conversation_id=self.conversation_id, user=self.user))
+        self.assertTrue(''.join(chunks).startswith('streamed reply'))
+        self.assertEqual(len(payloads), 1)
+        self.assertIn('earlier question', self.sent_contents(payloads[0]))
+
+    def test_other_user_does_not_get_the_history(self):
+        other = User.objects.create_user('other', password='x')
+        with mock.patch.object(views.llm_gateway, 'complete_hedged', return_value='groq reply') as complete:
+            views.career_ai.chat_with_ai('tell me a joke', [], {}, use_cache=False,
+                                         conversation_id=self.conversation_id, user=other)
+        self.assertEqual(complete.call_count, 1)
+        self.assertNotIn('earlier question', self.sent_contents(complete.call_args[0][2]))
+
+
+class ResponseCachePersonalContextTests(TestCase):
+    """Cached answers are never served across student profiles"""
+
+    def setUp(self):
+        self.cache = ChatResponseCache(enabled=True)
+        patches = [
+            mock.patch.object(views, 'response_cache', self.cache),
+            mock.patch.object(views.career_ai, 'groq_api_key', 'gsk_test'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.asha = {'username': 'asha', 'department': 'CSE', 'year': '3rd Year',
+                     'skills': ['Python', 'SQL'], 'interests': ['AI']}
+        self.ravi = dict(self.asha, username='ravi', skills=['Java'], interests=['Web Development'])
+
+    def test_same_branch_and_year_do_not_share_answers(self):
+        message = 'which internships suit my profile'
+        with mock.patch.object(views.llm_gateway, 'complete_hedged',
+                               side_effect=['Asha, try ML internships', 'Ravi, try backend internships']) as complete:
+            views.career_ai.chat_with_ai(message, [], self.asha)
+            response = views.career_ai.chat_with_ai(message, [], self.ravi)
+        self.assertEqual(complete.call_count, 2)
+        self.assertIn('Ravi', response)
+        self.assertNotIn('Asha', response)
+
+    def test_same_profile_is_served_from_the_cache(self):
+        message = 'which internships suit my profile'
+        with mock.patch.object(views.llm_gateway, 'complete_hedged', return_value='Asha, try ML internships') as complete:
+            views.career_ai.chat_with_ai(message, [], self.asha)
+            response = views.career_ai.chat_with_ai(message, [], dict(self.asha, skills=['sql', 'python']))
+        self.assertEqual(complete.call_count, 1)
+        self.assertIn('Asha', response)
+
+    def test_greeting_for_one_student_is_not_served_to_another(self):
+        self.cache.put('which internships suit my profile', 'Hi asha!', self.asha)
+        self.assertIsNone(self.cache.get('which internships suit my profile', self.ravi))
+        self.assertEqual(self.cache.get('which internships suit my profile', self.asha), 'Hi asha!')
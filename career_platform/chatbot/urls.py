@@ -5,7 +5,11 @@ from . import views
 urlpatterns = [
     # Chat endpoints
     path('chat/', views.chat_handler, name='chatbot_chat'),
+    path('chat-stream/', views.chat_stream, name='chatbot_chat_stream'),
+    path('chat-cache-stats/', views.chat_cache_stats, name='chat_cache_stats'),
     path('analyze-cv/', views.analyze_cv, name='analyze_cv'),
+    path('cv-analysis/<str:job_id>/', views.cv_analysis_status, name='cv_analysis_status'),
+    path('cv-analysis/<str:job_id>/events/', views.cv_analysis_events, name='cv_analysis_events'),
     path('find-internships/', views.find_internships, name='find_internships'),
     path('analyze-skills/', views.analyze_skills, name='analyze_skills'),
     path('user-context/', views.get_user_context, name='user_context'),
@@ -18,6 +22,7 @@ urlpatterns = [
     path('supported-languages/', views.get_supported_languages, name='supported_languages'),
 
     path('voice-chat/', views.voice_chat, name='voice_chat'),
+    path('voice-chat-stream/', views.voice_chat_stream, name='voice_chat_stream'),
     path('toggle-audio/', views.toggle_audio, name='toggle_audio'),
     path('change-language/', views.change_language, name='change_language'),
     path('text-to-speech/', views.text_to_speech_api, name='text_to_speech'),
@@ -1,5 +1,6 @@
 # chatbot/views.py - COMPLETELY FIXED VERSION
 import os
+import asyncio
 import json
 import requests
 import logging
@@ -7,22 +8,50 @@ import re
 import random
 import uuid
 import tempfile
+import threading
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse, FileResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django.core.files.storage import FileSystemStorage
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
+from asgiref.sync import sync_to_async
 from gtts import gTTS
 import speech_recognition as sr
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Streaming chat - enhancement suffixes are prepared on these threads while tokens stream
+STREAM_CHUNK_CHARS = 24
+STREAM_ENHANCE_TIMEOUT = 10
+enhancement_executor = ThreadPoolExecutor(max_workers=int(os.getenv('CHAT_ENHANCE_WORKERS', '4')))
+
+# Pipelined voice mode - each sentence is translated + synthesized on these threads
+VOICE_MIN_SENTENCE_CHARS = 40
+# No break after list markers ('2.', 'b.') or initials ('e.g.') - the marker belongs to what follows
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])(?<!\b\d\.)(?<!\b\d\d\.)(?<!\b[A-Za-z]\.)\s+|\n+')
+voice_executor = ThreadPoolExecutor(max_workers=int(os.getenv('VOICE_PIPELINE_WORKERS', '4')))
+
+# Background CV jobs - how often the events stream re-checks a job
+CV_EVENTS_POLL_SECONDS = 1
+# Offer the SSE events_url only when served by ASGI - under WSGI each open stream would pin a worker thread
+CV_EVENTS_ENABLED = os.getenv('CV_EVENTS_ENABLED', 'False') == 'True'
+
+
+def run_blocking(func):
+    """Wrap sync work (scraper, translation) for async views - runs in a thread pool, not the shared sync thread"""
+    return sync_to_async(func, thread_sensitive=False)
+
 # =============== MULTILINGUAL ADDITION ===============
+from utils.translation_memory import translation_memory
+
 try:
     from googletrans import Translator
     TRANSLATOR_AVAILABLE = True
@@ -55,8 +84,12 @@ class SimpleTranslationService:
                 return text
             
             if TRANSLATOR_AVAILABLE:
-                translated = translator.translate(text, dest=target_lang, src=source_lang)
-                return translated.text
+                # Translation memory first - repeat phrases and cached answers skip the network
+                return translation_memory.translate(
+                    text, target_lang, source_lang,
+                    translate_one=lambda t: translator.translate(t, dest=target_lang, src=source_lang).text,
+                    provider='googletrans'
+                )
             else:
                 # Fallback: Return English text if translation fails
                 return text
@@ -69,6 +102,16 @@ class SimpleTranslationService:
 translation_service = SimpleTranslationService()
 # =============== END MULTILINGUAL ADDITION ===============
 
+from .llm_gateway import llm_gateway
+from .response_cache import response_cache
+from .audio_cache import audio_cache
+from .intent_engine import intent_engine
+from .conversation_store import conversation_store
+from .cv_jobs import cv_jobs, ContentHashUploadHandler, CV_MAX_UPLOAD_MB, CV_JOB_TIMEOUT
+from .cv_extraction import cv_extractor
+from .ats_scanner import ats_scanner, SECTION_KEYWORDS
+from .prompt_builder import prompt_builder
+
 # Import your scraper
 try:
     from ai_engine.scrapers.internship_scraper import InternshipScraper
@@ -113,9 +156,6 @@ class EnhancedCareerPalAI:
         # Initialize scraper
         self.scraper = InternshipScraper() if SCRAPER_AVAILABLE else None
         
-        # User memory storage (in production, use database)
-        self.user_memory = {}
-        
         # Career knowledge base
         self.career_knowledge = self._load_career_knowledge()
 
@@ -171,7 +211,7 @@ class EnhancedCareerPalAI:
         }
     
     # =============== MULTILINGUAL CHAT METHOD ===============
-    def chat_with_ai_multilingual(self, message, conversation_history, user_context, language='en'):
+    def chat_with_ai_multilingual(self, message, conversation_history, user_context, language='en', use_cache=True, conversation_id=None, user=None):
         """Enhanced AI chat handler with multilingual support - NEW METHOD"""
         try:
             # If language is not English, translate message to English for AI processing
@@ -182,7 +222,7 @@ class EnhancedCareerPalAI:
                 message_en = message
             
             # Use existing chat_with_ai method to get English response
-            response_en = self.chat_with_ai(message_en, conversation_history, user_context)
+            response_en = self.chat_with_ai(message_en, conversation_history, user_context, use_cache, conversation_id, user)
             
             # Translate response back to user's language if needed
             if language != 'en':
@@ -196,14 +236,14 @@ class EnhancedCareerPalAI:
         except Exception as e:
             logger.error(f"Multilingual AI Chat Error: {e}")
             # Fallback to English if translation fails
-            return self.chat_with_ai(message, conversation_history, user_context)
+            return self.chat_with_ai(message, conversation_history, user_context, use_cache, conversation_id, user)
     
-    def chat_with_ai(self, message, conversation_history, user_context):
+    def chat_with_ai(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
         """Enhanced AI chat handler with Groq API and fallback"""
         try:
             # Use Groq API if available
             if self.groq_api_key and self.groq_api_key.startswith('gsk_'):
-                return self._call_groq_api(message, conversation_history, user_context)
+                return self._call_groq_api(message, conversation_history, user_context, use_cache, conversation_id, user)
             else:
                 # Enhanced local responses
                 return self._enhanced_local_response(message, user_context)
@@ -212,39 +252,24 @@ class EnhancedCareerPalAI:
             logger.error(f"AI Chat Error: {e}")
             return self._get_smart_fallback(message)
     
-    def _call_groq_api(self, message, conversation_history, user_context):
+    def _call_groq_api(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
         """Call Groq API with enhanced context"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Create enhanced system prompt
-            system_prompt = self._create_enhanced_system_prompt(user_context)
-            
-            # Build messages
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # Add conversation history (last 6 messages)
-            for msg in conversation_history[-6:]:
-                messages.append(msg)
-            
-            # Add current message
-            messages.append({"role": "user", "content": message})
-            
-            payload = {
-                "messages": messages,
-                "model": "llama-3.1-8b-instant",
-                "temperature": 0.8,
-                "max_tokens": 1024,
-                "top_p": 0.9
-            }
-            
-            response = requests.post(self.groq_url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            ai_response = response.json()["choices"][0]["message"]["content"]
+            # Repeat questions are answered from the cache - enhancement still runs fresh
+            ai_response = response_cache.get(message, user_context, bypass=not use_cache)
+            if ai_response is None:
+                history = self._conversation_history(conversation_history, conversation_id, user)
+                payload = self._groq_payload(message, history, user_context)
+                
+                # Bounded, retried call on the shared gateway - None once the latency budget is spent
+                ai_response = llm_gateway.complete_hedged(
+                    self.groq_url, self.groq_api_key, payload,
+                    on_late=self._cache_late_answer(message, user_context, use_cache),
+                )
+                if ai_response is None:
+                    logger.info("Groq over the latency budget - answering locally, the reply will be cached")
+                    return self._enhanced_local_response(message, user_context)
+                response_cache.put(message, ai_response, user_context, bypass=not use_cache)
             
             # Post-process AI response
             return self._enhance_ai_response(ai_response, message, user_context)
@@ -256,6 +281,178 @@ class EnhancedCareerPalAI:
             logger.error(f"Groq processing error: {e}")
             return self._enhanced_local_response(message, user_context)
     
+    # =============== ASYNC CHAT ===============
+    async def chat_with_ai_async(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
+        """chat_with_ai for async views - awaits the pooled LLM client instead of holding a thread"""
+        try:
+            if self.groq_api_key and self.groq_api_key.startswith('gsk_'):
+                return await self._call_groq_api_async(message, conversation_history, user_context, use_cache, conversation_id, user)
+            else:
+                return await run_blocking(self._enhanced_local_response)(message, user_context)
+                
+        except Exception as e:
+            logger.error(f"AI Chat Error: {e}")
+            return self._get_smart_fallback(message)
+    
+    async def _call_groq_api_async(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
+        """Async _call_groq_api"""
+        try:
+            ai_response = response_cache.get(message, user_context, bypass=not use_cache)
+            if ai_response is None:
+                # A cold conversation is read from the database - not on the event loop
+                history = await run_blocking(self._conversation_history)(conversation_history, conversation_id, user)
+                payload = self._groq_payload(message, history, user_context)
+                ai_response = await llm_gateway.acomplete_hedged(
+                    self.groq_url, self.groq_api_key, payload,
+                    on_late=self._cache_late_answer(message, user_context, use_cache),
+                )
+                if ai_response is None:
+                    logger.info("Groq over the latency budget - answering locally, the reply will be cached")
+                    return await run_blocking(self._enhanced_local_response)(message, user_context)
+                response_cache.put(message, ai_response, user_context, bypass=not use_cache)
+            
+            # Post-processing may hit the scraper - keep it off the event loop
+            return await run_blocking(self._enhance_ai_response)(ai_response, message, user_context)
+            
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Groq API failed: {e}. Using enhanced local response.")
+            return await run_blocking(self._enhanced_local_response)(message, user_context)
+        except Exception as e:
+            logger.error(f"Groq processing error: {e}")
+            return await run_blocking(self._enhanced_local_response)(message, user_context)
+    
+    async def chat_with_ai_multilingual_async(self, message, conversation_history, user_context, language='en', use_cache=True, conversation_id=None, user=None):
+        """Async chat_with_ai_multilingual"""
+        try:
+            if language != 'en':
+                message_en = await run_blocking(translation_service.translate_text)(message, 'en')
+            else:
+                message_en = message
+            
+            response_en = await self.chat_with_ai_async(message_en, conversation_history, user_context, use_cache, conversation_id, user)
+            
+            if language != 'en':
+                return await run_blocking(translation_service.translate_text)(response_en, language)
+            return response_en
+            
+        except Exception as e:
+            logger.error(f"Multilingual AI Chat Error: {e}")
+            return await self.chat_with_ai_async(message, conversation_history, user_context, use_cache, conversation_id, user)
+    
+    @staticmethod
+    def _cache_late_answer(message, user_context, use_cache):
+        """Callback for a reply that came in after the local answer was sent - the next ask is a cache hit"""
+        def cache(ai_response):
+            response_cache.put(message, ai_response, user_context, bypass=not use_cache)
+        return cache
+    
+    def _conversation_history(self, conversation_history, conversation_id, user=None):
+        """Server-side history of the caller's conversation, else whatever the client sent"""
+        history = conversation_store.history(conversation_id, user) if conversation_id else []
+        return history or conversation_history or []
+    
+    def _groq_payload(self, message, conversation_history, user_context, stream=False):
+        """Chat completion request body"""
+        payload = {
+            "messages": self._build_groq_messages(message, conversation_history, user_context),
+            "model": "llama-3.1-8b-instant",
+            "temperature": 0.8,
+            "max_tokens": 1024,
+            "top_p": 0.9
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+    
+    def _build_groq_messages(self, message, conversation_history, user_context):
+        """System prompt + recent history + current message, within the prompt token budget"""
+        # Older or over-long history is summarized/clipped instead of sent whole
+        return prompt_builder.build(message, conversation_history, self._format_user_context(user_context))
+    
+    # =============== STREAMING CHAT ===============
+    def stream_chat(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
+        """Yield the reply piece by piece as the model produces it.
+        
+        The enhancement suffix (internship links, courses, CTA) only depends on
+        the question, so it is prepared on a worker thread while tokens stream
+        and sent once the model is done.
+        """
+        enhancement = enhancement_executor.submit(self._enhance_ai_response, '', message, user_context)
+        
+        use_local = True
+        if self.groq_api_key and self.groq_api_key.startswith('gsk_'):
+            cached = response_cache.get(message, user_context, bypass=not use_cache)
+            try:
+                if cached is not None:
+                    yield from self._chunk_text(cached)
+                else:
+                    yield from self._stream_groq_api(message, conversation_history, user_context, use_cache, conversation_id, user)
+                use_local = False
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f"Groq streaming failed: {e}. Using enhanced local response.")
+        
+        if use_local:
+            # Local replies already carry their own suggestions
+            enhancement.cancel()
+            enhancement = None
+            yield from self._chunk_text(self._enhanced_local_response(message, user_context))
+        
+        if enhancement is not None:
+            try:
+                suffix = enhancement.result(timeout=STREAM_ENHANCE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Response enhancement skipped: {e}")
+                suffix = ''
+            if suffix:
+                yield suffix
+    
+    def _stream_groq_api(self, message, conversation_history, user_context, use_cache=True, conversation_id=None, user=None):
+        """Groq chat completion with stream=True - yields content deltas.
+        
+        Errors before the first delta are raised so the caller can fall back.
+        Only replies that streamed to the end are cached.
+        """
+        history = self._conversation_history(conversation_history, conversation_id, user)
+        payload = self._groq_payload(message, history, user_context, stream=True)
+        
+        parts = []
+        sent_any = False
+        try:
+            with llm_gateway.stream(self.groq_url, self.groq_api_key, payload) as response:
+                response.raise_for_status()
+                response.encoding = 'utf-8'
+                # chunk_size=None hands lines over as they arrive instead of filling 512 byte reads
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if not line or not line.startswith('data:'):
+                        continue
+                    data = line[5:].strip()
+                    if data == '[DONE]':
+                        break
+                    choices = json.loads(data).get('choices') or [{}]
+                    delta = choices[0].get('delta', {}).get('content')
+                    if delta:
+                        sent_any = True
+                        parts.append(delta)
+                        yield delta
+            response_cache.put(message, ''.join(parts), user_context, bypass=not use_cache)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if not sent_any:
+                raise
+            # Keep what the user has already seen - just end the reply here
+            logger.warning(f"Groq stream interrupted: {e}")
+    
+    @staticmethod
+    def _chunk_text(text, size=STREAM_CHUNK_CHARS):
+        """Split a ready-made reply into word-aligned chunks for streaming"""
+        chunk = ''
+        for word in re.split(r'(?<=\s)', text):
+            chunk += word
+            if len(chunk) >= size:
+                yield chunk
+                chunk = ''
+        if chunk:
+            yield chunk
+    
     def text_to_speech(self, text, language='en'):
         """Convert text to speech and return audio file path"""
         try:
@@ -265,14 +462,11 @@ class EnhancedCareerPalAI:
             # Clean text for TTS
             clean_text = self._clean_text_for_speech(text)
             
-            # Create TTS
-            tts = gTTS(text=clean_text, lang=language, slow=False)
-            
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            tts.save(temp_file.name)
-            
-            return temp_file.name
+            # Content-addressed cache - the same text/language is only synthesized once
+            return audio_cache.get_or_create(
+                clean_text, language,
+                lambda path: gTTS(text=clean_text, lang=language, slow=False).save(path)
+            )
             
         except Exception as e:
             print(f"TTS Error: {e}")
@@ -318,6 +512,71 @@ class EnhancedCareerPalAI:
         except Exception as e:
             return f"Error: {str(e)}"
     
+    # =============== PIPELINED VOICE ===============
+    def stream_voice(self, message, conversation_history, user_context, language='en', conversation_id=None, user=None):
+        """Yield voice clips in order while the answer is still being generated.
+        
+        The streamed reply is cut into sentences; each one is translated and
+        synthesized on ``voice_executor`` as soon as it is complete, so the first
+        clip is ready while the model is still writing the rest.
+        """
+        clips = queue.Queue()
+        
+        def produce():
+            try:
+                tokens = self.stream_chat(message, conversation_history, user_context, conversation_id=conversation_id, user=user)
+                for index, sentence in enumerate(self._split_sentences(tokens)):
+                    clips.put(voice_executor.submit(self._voice_clip, index, sentence, language))
+            except Exception as e:
+                logger.error(f"Voice pipeline error: {e}")
+            finally:
+                clips.put(None)
+        
+        # Sentences are produced on their own thread so each clip is handed over
+        # the moment it is ready - always in playback order
+        threading.Thread(target=produce, daemon=True).start()
+        while True:
+            future = clips.get()
+            if future is None:
+                break
+            yield future.result()
+    
+    @staticmethod
+    def _split_sentences(tokens, min_chars=VOICE_MIN_SENTENCE_CHARS):
+        """Regroup a token stream into sentences (short ones are merged with the next)"""
+        buffer = ''
+        for token in tokens:
+            buffer += token
+            parts = SENTENCE_BOUNDARY_RE.split(buffer)
+            # The last part may still be growing
+            buffer = parts.pop()
+            sentence = ''
+            for part in parts:
+                sentence = f"{sentence} {part}".strip()
+                if len(sentence) >= min_chars:
+                    yield sentence
+                    sentence = ''
+            if sentence:
+                buffer = f"{sentence} {buffer}"
+        if buffer.strip():
+            yield buffer.strip()
+    
+    def _voice_clip(self, index, sentence, language):
+        """Translate + synthesize one sentence"""
+        text = sentence
+        try:
+            if language != 'en':
+                text = translation_service.translate_text(sentence, language)
+            audio_path = self.text_to_speech(text, language)
+        except Exception as e:
+            logger.warning(f"Voice clip {index} failed: {e}")
+            audio_path = None
+        return {
+            'index': index,
+            'text': text,
+            'audio_url': f'/chatbot/audio/{os.path.basename(audio_path)}/' if audio_path else None
+        }
+    
     def get_audio_response(self, text, user_context):
         """Get AI response with audio"""
         text_response = self.chat_with_ai(text, [], user_context)
@@ -333,45 +592,8 @@ class EnhancedCareerPalAI:
 
     def _create_enhanced_system_prompt(self, user_context):
         """Create detailed system prompt for Groq"""
-        user_info = self._format_user_context(user_context)
-        
-        prompt = f"""You are CareerPal AI, an advanced career assistant specialized for BPUT students in Odisha, India.
-
-USER PROFILE:
-{user_info}
-
-YOUR EXPERTISE:
-1. **CV/Resume Analysis**: ATS optimization, formatting, content improvement
-2. **Internship Matching**: Real opportunities from Indian companies
-3. **Skill Development**: Gap analysis, learning paths, course recommendations
-4. **Interview Preparation**: Technical questions, mock interviews, HR rounds
-5. **Career Planning**: Roadmaps, goal setting, progression strategies
-6. **BPUT Specific**: College resources, placement trends, alumni network
-
-RESPONSE GUIDELINES:
-- Be specific, actionable, and practical
-- Mention Indian companies (TCS, Infosys, Wipro, etc.)
-- Recommend free/affordable resources (NPTEL, YouTube, FreeCodeCamp)
-- Include Odisha-specific opportunities
-- Use emojis appropriately for engagement
-- Break complex advice into numbered/bulleted points
-- Always ask follow-up questions to continue conversation
-- Be encouraging and motivational
-
-FORMAT REQUIREMENTS:
-- Use markdown formatting for readability
-- Include emojis relevant to the topic
-- Bold important terms
-- Separate sections clearly
-
-EXAMPLE RESPONSES:
-- "🎯 Based on your Python skills, here are 3 internships..."
-- "📄 Your CV needs these ATS optimizations..."
-- "🚀 For web development, follow this 90-day roadmap..."
-
-CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-        return prompt
+        # The static part is rendered once per user profile - see prompt_builder
+        return prompt_builder.system_prompt(self._format_user_context(user_context))
     
     def _format_user_context(self, user_context):
         """Format user context for AI"""
@@ -436,24 +658,7 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
     
     def _detect_intent(self, message):
         """Detect user intent from message"""
-        message_lower = message.lower()
-        
-        intent_keywords = {
-            'greeting': ['hi', 'hello', 'hey', 'namaste', 'good morning', 'good afternoon'],
-            'internship_search': ['internship', 'job', 'placement', 'opportunity', 'work', 'apply', 'vacancy'],
-            'cv_analysis': ['cv', 'resume', 'curriculum vitae', 'ats', 'profile', 'document'],
-            'skill_analysis': ['skill', 'learn', 'course', 'training', 'improve', 'develop', 'gap'],
-            'interview_prep': ['interview', 'mock', 'hr', 'technical', 'prepare', 'question', 'answer'],
-            'career_guidance': ['career', 'future', 'guidance', 'path', 'roadmap', 'plan', 'goal'],
-            'small_talk': ['name', 'who are you', 'what can you do', 'how are you', 'weather', 'time'],
-            'help': ['help', 'assist', 'support', 'guide', 'advice']
-        }
-        
-        for intent, keywords in intent_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
-                return intent
-        
-        return 'general'
+        return intent_engine.analyze(message)['intent']
     
     def _get_personalized_greeting(self, user_context):
         """Generate personalized greeting"""
@@ -895,50 +1100,19 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
     
     def _extract_skills(self, message):
         """Extract skills from message"""
-        skill_keywords = [
-            'python', 'java', 'javascript', 'c++', 'c#',
-            'html', 'css', 'react', 'angular', 'vue',
-            'django', 'flask', 'node', 'express',
-            'sql', 'mongodb', 'mysql', 'postgresql',
-            'aws', 'azure', 'cloud', 'docker', 'kubernetes',
-            'machine learning', 'ai', 'data science', 'analytics',
-            'web development', 'mobile development', 'android', 'ios'
-        ]
-        
-        found_skills = []
-        message_lower = message.lower()
-        
-        for skill in skill_keywords:
-            if skill in message_lower:
-                found_skills.append(skill.title())
-        
-        return found_skills[:5]
+        return intent_engine.analyze(message)['skills']
     
     def _extract_topics(self, message):
         """Extract topics from message"""
-        topics = []
-        common_topics = [
-            'project', 'certification', 'course', 'placement',
-            'salary', 'company', 'interview', 'preparation',
-            'study', 'learning', 'practice', 'portfolio'
-        ]
-        
-        message_lower = message.lower()
-        for topic in common_topics:
-            if topic in message_lower:
-                topics.append(topic)
-        
-        return topics
+        return intent_engine.analyze(message)['topics']
     
     def _is_internship_related(self, message):
         """Check if message is internship related"""
-        internship_keywords = ['internship', 'job', 'placement', 'opportunity', 'work', 'apply']
-        return any(keyword in message.lower() for keyword in internship_keywords)
+        return intent_engine.analyze(message)['internship_related']
     
     def _is_skill_related(self, message):
         """Check if message is skill related"""
-        skill_keywords = ['skill', 'learn', 'course', 'training', 'develop', 'improve']
-        return any(keyword in message.lower() for keyword in skill_keywords)
+        return intent_engine.analyze(message)['skill_related']
     
     def _add_internship_data(self, ai_response, user_context):
         """Add internship data to AI response"""
@@ -1023,32 +1197,25 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             return self._get_cv_analysis_fallback()
 
     def _extract_text_from_cv(self, file_path):
-        """Extract text from CV files - FIXED VERSION"""
-        text = ""
+        """Extract text from CV files - FIXED VERSION
+        
+        Page/character budgeted and parallel for long PDFs - see cv_extraction.py
+        """
         try:
             if file_path.endswith('.pdf') and PDF_SUPPORT:
-                with open(file_path, 'rb') as file:
-                    if PyPDF2:
-                        try:
-                            reader = PyPDF2.PdfReader(file)
-                            for page in reader.pages:
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                        except Exception as pdf_error:
-                            logger.error(f"PDF extraction error: {pdf_error}")
-                            return f"PDF extraction failed: {str(pdf_error)}"
-            
-            elif file_path.endswith('.docx') and DOCX_SUPPORT:
-                if docx:
-                    try:
-                        document = docx(file_path)
-                        for para in document.paragraphs:
-                            if para.text:
-                                text += para.text + "\n"
-                    except Exception as docx_error:
-                        logger.error(f"DOCX extraction error: {docx_error}")
-                        return f"DOCX extraction failed: {str(docx_error)}"
+                try:
+                    text = cv_extractor.extract_pdf(file_path)
+                except Exception as pdf_error:
+                    logger.error(f"PDF extraction error: {pdf_error}")
+                    return f"PDF extraction failed: {str(pdf_error)}"
+            
+            elif file_path.endswith('.docx'):
+                try:
+                    # Streamed from the zip - no python-docx document tree needed
+                    text = cv_extractor.extract_docx(file_path)
+                except Exception as docx_error:
+                    logger.error(f"DOCX extraction error: {docx_error}")
+                    return f"DOCX extraction failed: {str(docx_error)}"
             
             elif file_path.endswith('.doc'):
                 return "⚠️ .DOC files are not supported. Please convert to PDF or DOCX format."
@@ -1065,16 +1232,16 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
     def _perform_simplified_cv_analysis(self, text_content):
         """Simplified CV analysis without complex calculations - FIXED VERSION"""
         try:
-            text_lower = text_content.lower()
-            words = text_content.split()
-            word_count = len(words)
+            # Every count and flag below comes from one scan of the CV
+            scan = ats_scanner.scan(text_content)
+            word_count = scan['word_count']
             
             analysis = "🎯 **CV ANALYSIS REPORT**\n\n"
             
             # 1. BASIC STATS
             analysis += "### 📊 **1. BASIC STATISTICS**\n"
             analysis += f"• **Words:** {word_count}\n"
-            analysis += f"• **Characters:** {len(text_content)}\n"
+            analysis += f"• **Characters:** {scan['char_count']}\n"
             
             length_feedback = ""
             if word_count < 200:
@@ -1093,45 +1260,23 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
             # 2. SECTION CHECK
             analysis += "\n### 📋 **2. ESSENTIAL SECTIONS**\n"
             
-            sections = [
-                ("Contact Info", ['phone', 'email', '@', 'linkedin', 'contact']),
-                ("Education", ['education', 'university', 'college', 'b.tech', 'degree', 'bachelor']),
-                ("Skills", ['skill', 'technical', 'programming', 'language', 'framework']),
-                ("Experience", ['experience', 'internship', 'work', 'employment', 'project']),
-                ("Projects", ['project', 'portfolio', 'developed', 'built', 'created'])
-            ]
-            
-            found_sections = []
-            for name, keywords in sections:
-                found = any(keyword in text_lower for keyword in keywords)
+            found_sections = scan['sections']
+            for name, _ in SECTION_KEYWORDS:
+                found = name in found_sections
                 icon = "✅" if found else "❌"
                 analysis += f"{icon} **{name}:** {'Present' if found else 'Missing'}\n"
-                if found:
-                    found_sections.append(name)
             
             # 3. KEYWORD ANALYSIS
             analysis += "\n### 🔑 **3. KEYWORD ANALYSIS**\n"
             
-            tech_keywords = {
-                'Programming': ['python', 'java', 'javascript', 'c++', 'sql'],
-                'Web Dev': ['html', 'css', 'react', 'django', 'node'],
-                'Databases': ['mysql', 'mongodb', 'postgresql', 'sql'],
-                'Tools': ['git', 'github', 'docker', 'aws']
-            }
-            
-            found_keywords = []
-            for category, keywords in tech_keywords.items():
-                found = [kw for kw in keywords if kw in text_lower]
-                if found:
-                    found_keywords.extend(found)
-                    analysis += f"✅ **{category}:** {', '.join(found[:3])}\n"
+            found_keywords = scan['keywords']
+            for category, found in scan['tech_keywords'].items():
+                analysis += f"✅ **{category}:** {', '.join(found[:3])}\n"
             
             if not found_keywords:
                 analysis += "❌ **Few technical keywords found.** Add more specific skills.\n"
             
             # 4. ATS SCORE CALCULATION - STORE INDIVIDUAL SCORES
-            import re
-            
             # Calculate length score
             length_score = 0
             if 300 <= word_count <= 700:
@@ -1161,8 +1306,7 @@ CURRENT CONTEXT: {datetime.now().strftime('%Y-%m-%d %H:%M')}
                 keyword_score = 5
             
             # Calculate quantification score
-            numbers = re.findall(r'\b\d+\b', text_content)
-            num_count = len(numbers)
+            num_count = scan['number_count']
             quant_score = 0
             if num_count >= 3:
                 quant_score = 10
@@ -1360,42 +1504,122 @@ career_ai = EnhancedCareerPalAI()
 
 # =============== FIXED VIEW FUNCTIONS ===============
 
+def _conversation_id(data, user):
+    """The client's conversation_id if it is theirs, else a new conversation"""
+    conversation_id = data.get('conversation_id')
+    if conversation_store.claim(conversation_id, user):
+        return conversation_id
+    return conversation_store.start(user)
+
 @csrf_exempt
 @require_POST
-def chat_handler(request):
-    """Handle chat messages - UPDATED FOR MULTILINGUAL"""
+async def chat_handler(request):
+    """Handle chat messages - UPDATED FOR MULTILINGUAL
+    
+    History is kept server side: send the ``conversation_id`` from the previous
+    reply instead of ``conversation_history`` (still accepted for new chats).
+    """
     try:
         data = json.loads(request.body)
         message = data.get('message', '')
         conversation_history = data.get('conversation_history', [])
         user_context = data.get('user_context', {})
         language = data.get('language', 'en')  # Get language from request
+        use_cache = not data.get('bypass_cache', False)
+        user = await request.auser()
+        conversation_id = await run_blocking(_conversation_id)(data, user)
         
         # Use the new multilingual method if language is specified and not English
         if language and language != 'en':
-            response = career_ai.chat_with_ai_multilingual(
+            response = await career_ai.chat_with_ai_multilingual_async(
                 message=message,
                 conversation_history=conversation_history,
                 user_context=user_context,
-                language=language
+                language=language,
+                use_cache=use_cache,
+                conversation_id=conversation_id,
+                user=user
             )
         else:
             # Use original method for English
-            response = career_ai.chat_with_ai(message, conversation_history, user_context)
+            response = await career_ai.chat_with_ai_async(message, conversation_history, user_context, use_cache, conversation_id, user)
         
+        await run_blocking(conversation_store.append)(conversation_id, user, message, response)
         return JsonResponse({
             'response': response,
-            'language': language
+            'language': language,
+            'conversation_id': conversation_id
         })
         
     except Exception as e:
         logger.error(f"Chat handler error: {e}")
         return JsonResponse({'error': 'Server error'}, status=500)
 
+def _sse_event(data, event=None):
+    """Format one Server-Sent Event"""
+    lines = f"event: {event}\n" if event else ""
+    return lines + f"data: {json.dumps(data)}\n\n"
+
+@csrf_exempt
+@require_POST
+def chat_stream(request):
+    """Streaming chat - forwards model tokens to the browser as Server-Sent Events
+    
+    Events: ``data: {"delta": "..."}`` per chunk, then ``event: done`` with the
+    full response, or ``event: error``.
+    """
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    message = data.get('message', '')
+    conversation_history = data.get('conversation_history', [])
+    user_context = data.get('user_context', {})
+    language = data.get('language', 'en')
+    use_cache = not data.get('bypass_cache', False)
+    
+    if not message:
+        return JsonResponse({'error': 'Empty message'}, status=400)
+    conversation_id = _conversation_id(data, request.user)
+    
+    def event_stream():
+        parts = []
+        try:
+            if language and language != 'en':
+                # Translation needs the whole reply - send it as one chunk
+                chunks = [career_ai.chat_with_ai_multilingual(message, conversation_history, user_context, language, use_cache, conversation_id, request.user)]
+            else:
+                chunks = career_ai.stream_chat(message, conversation_history, user_context, use_cache, conversation_id, request.user)
+            
+            for chunk in chunks:
+                parts.append(chunk)
+                yield _sse_event({'delta': chunk})
+            
+            response = ''.join(parts)
+            conversation_store.append(conversation_id, request.user, message, response)
+            yield _sse_event({'response': response, 'language': language, 'conversation_id': conversation_id}, event='done')
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}")
+            yield _sse_event({'error': 'Server error', 'response': ''.join(parts)}, event='error')
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+def chat_cache_stats(request):
+    """Hit/miss metrics for the chat response cache, plus prompt sizes and LLM queue stats"""
+    stats = response_cache.metrics()
+    stats['prompt'] = prompt_builder.metrics()
+    stats['llm'] = llm_gateway.metrics()
+    return JsonResponse(stats)
+
 # =============== NEW MULTILINGUAL ENDPOINTS ===============
 @csrf_exempt
 @require_POST
-def chat_multilingual(request):
+async def chat_multilingual(request):
     """New endpoint specifically for multilingual chat"""
     try:
         data = json.loads(request.body)
@@ -1403,21 +1627,29 @@ def chat_multilingual(request):
         language = data.get('language', 'en')
         conversation_history = data.get('conversation_history', [])
         user_context = data.get('user_context', {})
+        use_cache = not data.get('bypass_cache', False)
         
         if not message:
             return JsonResponse({'error': 'Empty message'}, status=400)
+        user = await request.auser()
+        conversation_id = await run_blocking(_conversation_id)(data, user)
         
         # Use the new multilingual method
-        response = career_ai.chat_with_ai_multilingual(
+        response = await career_ai.chat_with_ai_multilingual_async(
             message=message,
             conversation_history=conversation_history,
             user_context=user_context,
-            language=language
+            language=language,
+            use_cache=use_cache,
+            conversation_id=conversation_id,
+            user=user
         )
         
+        await run_blocking(conversation_store.append)(conversation_id, user, message, response)
         return JsonResponse({
             'response': response,
             'language': language,
+            'conversation_id': conversation_id,
             'success': True
         })
         
@@ -1509,7 +1741,16 @@ def get_supported_languages(request):
 @csrf_exempt
 @require_POST
 def analyze_cv(request):
-    """Handle CV analysis - COMPLETELY FIXED VERSION"""
+    """Queue a CV for analysis - returns a job id at once (202)
+    
+    Follow the job with ``status_url`` (poll), or ``events_url`` (SSE, only
+    sent when ``CV_EVENTS_ENABLED``); the report and ``ats_score`` arrive when
+    it is done. A file this user already
+    had analysed comes back finished straight away (200, ``cached``).
+    """
+    # Hash the upload as it streams in - must be installed before request.FILES is read
+    hasher = ContentHashUploadHandler(request)
+    request.upload_handlers.insert(0, hasher)
     try:
         if 'cv_file' not in request.FILES:
             return JsonResponse({'error': 'No file uploaded'}, status=400)
@@ -1525,35 +1766,25 @@ def analyze_cv(request):
                 'error': f'Invalid file type. Please upload PDF or DOCX files only. Received: {file_ext}'
             }, status=400)
         
-        # Create temporary file
-        import tempfile
-        temp_dir = tempfile.gettempdir()
-        temp_filename = f"cv_upload_{uuid.uuid4().hex}{file_ext}"
-        temp_path = os.path.join(temp_dir, temp_filename)
-        
-        # Save uploaded file
-        with open(temp_path, 'wb+') as destination:
-            for chunk in cv_file.chunks():
-                destination.write(chunk)
-        
-        try:
-            # Perform analysis
-            analysis = career_ai.analyze_cv_file(temp_path)
-            
-            # Return successful response
+        if cv_file.size > CV_MAX_UPLOAD_MB * 1024 * 1024:
             return JsonResponse({
-                'response': analysis,
-                'filename': cv_file.name,
-                'file_size': cv_file.size,
-                'success': True
-            })
-            
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
+                'error': f'File too large. CVs must be under {CV_MAX_UPLOAD_MB} MB.'
+            }, status=413)
+        
+        job, cached = cv_jobs.submit(cv_file, request.user, career_ai.analyze_cv_file,
+                                     content_hash=hasher.hashes.get('cv_file'))
+        
+        data = cv_jobs.as_dict(job)
+        data.update({
+            'status_url': f'/chatbot/cv-analysis/{job.job_id}/',
+            'filename': cv_file.name,
+            'file_size': cv_file.size,
+            'cached': cached,
+            'success': True
+        })
+        if CV_EVENTS_ENABLED:
+            data['events_url'] = f'/chatbot/cv-analysis/{job.job_id}/events/'
+        return JsonResponse(data, status=200 if job.status == 'done' else 202)
             
     except Exception as e:
         logger.error(f"CV analysis error: {e}", exc_info=True)
@@ -1562,6 +1793,52 @@ def analyze_cv(request):
             'details': str(e) if settings.DEBUG else 'Internal server error'
         }, status=500)
 
+def cv_analysis_status(request, job_id):
+    """Current state of a CV analysis job - includes the report once done"""
+    job = cv_jobs.get(job_id, request.user)
+    if job is None:
+        return JsonResponse({'error': 'Job not found'}, status=404)
+    return JsonResponse(cv_jobs.as_dict(job))
+
+async def cv_analysis_events(request, job_id):
+    """CV analysis job as Server-Sent Events
+    
+    Events: ``event: status`` whenever the state changes, then ``event: done``
+    with the report and ``ats_score``, or ``event: error``. Async, so under
+    ASGI a waiting stream holds no thread - only the job lookups run in the
+    pool.
+    """
+    user = await request.auser()
+    job = await run_blocking(cv_jobs.get)(job_id, user)
+    if job is None:
+        return JsonResponse({'error': 'Job not found'}, status=404)
+    
+    async def event_stream():
+        current = job
+        last_status = None
+        deadline = time.monotonic() + CV_JOB_TIMEOUT + CV_EVENTS_POLL_SECONDS
+        while True:
+            if current.status != last_status:
+                last_status = current.status
+                if current.status == 'done':
+                    yield _sse_event(cv_jobs.as_dict(current), event='done')
+                    return
+                if current.status == 'failed':
+                    yield _sse_event(cv_jobs.as_dict(current), event='error')
+                    return
+                yield _sse_event(cv_jobs.as_dict(current), event='status')
+            if time.monotonic() > deadline:
+                yield _sse_event({'job_id': job_id, 'error': 'Timed out waiting for the analysis'}, event='error')
+                return
+            
+            await asyncio.sleep(CV_EVENTS_POLL_SECONDS)
+            current = await run_blocking(cv_jobs.get)(job_id, user) or current
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 # =============== TEXT-BASED CV ANALYSIS ===============
 @csrf_exempt
 @require_POST
@@ -1718,6 +1995,79 @@ def voice_chat(request):
         logger.error(f"Voice chat error: {e}")
         return JsonResponse({'error': 'Voice processing failed'}, status=500)
 
+@csrf_exempt
+@require_POST
+def voice_chat_stream(request):
+    """Pipelined voice chat - streams an ordered playlist of sentence clips as Server-Sent Events
+    
+    Accepts an ``audio_file`` upload (transcribed first) or a JSON ``message``.
+    Events: ``event: transcript`` with the recognised text, one ``data`` event
+    per clip ``{"index", "text", "audio_url"}`` in playback order, then
+    ``event: done`` with the full playlist.
+    """
+    try:
+        if 'audio_file' in request.FILES:
+            audio_file = request.FILES['audio_file']
+            suffix = os.path.splitext(audio_file.name)[1] or '.wav'
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_audio:
+                for chunk in audio_file.chunks():
+                    temp_audio.write(chunk)
+            try:
+                message = career_ai.speech_to_text(temp_audio.name, language='en-IN')
+            finally:
+                os.unlink(temp_audio.name)
+            data = request.POST
+            conversation_history = []
+            user_context = {}
+        else:
+            data = json.loads(request.body)
+            message = data.get('message', '')
+            conversation_history = data.get('conversation_history', [])
+            user_context = data.get('user_context', {})
+    except Exception as e:
+        logger.error(f"Voice stream input error: {e}")
+        return JsonResponse({'error': 'Voice processing failed'}, status=400)
+    
+    if not message:
+        return JsonResponse({'error': 'Empty message'}, status=400)
+    
+    language = data.get('language') or career_ai.language
+    if not user_context and request.user.is_authenticated:
+        user = request.user
+        user_context = {
+            'username': user.username,
+            'department': getattr(user, 'department', 'Computer Science'),
+            'year': getattr(user, 'year', '3rd Year')
+        }
+    conversation_id = _conversation_id(data, request.user)
+    
+    def event_stream():
+        playlist = []
+        try:
+            yield _sse_event({'text': message, 'language': language}, event='transcript')
+            message_en = translation_service.translate_text(message, 'en') if language != 'en' else message
+            
+            for clip in career_ai.stream_voice(message_en, conversation_history, user_context, language, conversation_id, request.user):
+                playlist.append(clip)
+                yield _sse_event(clip)
+            
+            response = ' '.join(clip['text'] for clip in playlist)
+            conversation_store.append(conversation_id, request.user, message, response)
+            yield _sse_event({
+                'response': response,
+                'playlist': playlist,
+                'language': language,
+                'conversation_id': conversation_id
+            }, event='done')
+        except Exception as e:
+            logger.error(f"Voice stream error: {e}")
+            yield _sse_event({'error': 'Voice processing failed', 'playlist': playlist}, event='error')
+    
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 @csrf_exempt
 @require_POST
 def toggle_audio(request):
@@ -1755,16 +2105,26 @@ def change_language(request):
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+def _audio_file_response(request, audio_path, disposition='inline', filename=None):
+    """Serve a cached clip - its name is its content hash, so browsers can keep it"""
+    etag = f'"{os.path.splitext(os.path.basename(audio_path))[0]}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+    else:
+        response = FileResponse(open(audio_path, 'rb'), content_type='audio/mpeg')
+        response['Content-Disposition'] = f'{disposition}; filename="{filename or os.path.basename(audio_path)}"'
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 def get_audio_file(request, filename):
     """Serve audio files"""
     try:
-        audio_path = os.path.join('/tmp', filename)
+        # Only content-addressed clips from the audio cache can be fetched
+        audio_path = audio_cache.path_for_filename(filename)
         
-        if os.path.exists(audio_path):
-            with open(audio_path, 'rb') as audio_file:
-                response = HttpResponse(audio_file.read(), content_type='audio/mpeg')
-                response['Content-Disposition'] = f'inline; filename="{filename}"'
-                return response
+        if audio_path:
+            return _audio_file_response(request, audio_path)
         else:
             return HttpResponse('Audio not found', status=404)
             
@@ -1783,18 +2143,8 @@ def text_to_speech_api(request):
             audio_path = career_ai.text_to_speech(text, language)
             
             if audio_path:
-                with open(audio_path, 'rb') as audio_file:
-                    audio_data = audio_file.read()
-                    response = HttpResponse(audio_data, content_type='audio/mpeg')
-                    response['Content-Disposition'] = f'attachment; filename="speech.mp3"'
-                    
-                    # Clean up temp file
-                    try:
-                        os.unlink(audio_path)
-                    except:
-                        pass
-                    
-                    return response
+                # Served straight from the audio cache - nothing to clean up
+                return _audio_file_response(request, audio_path, 'attachment', 'speech.mp3')
             else:
                 return JsonResponse({'error': 'TTS failed'}, status=500)
                 
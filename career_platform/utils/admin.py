@@ -1,3 +1,12 @@
 from django.contrib import admin
 
+from .models import TranslationMemory
+
 # Register your models here.
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ('source_text', 'target_lang', 'translated_text', 'provider', 'created_at')
+    list_filter = ('target_lang', 'provider')
+    search_fields = ('source_text', 'translated_text')
@@ -0,0 +1,61 @@
+# utils/management/commands/pretranslate_ui.py
+import re
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.translation import COMMON_TRANSLATIONS, translate_many
+from utils.translation_memory import translation_memory
+
+# Elements whose text is UI chrome rather than page data
+UI_ELEMENTS = ['a', 'button', 'label', 'th', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'option', 'span', 'p']
+TEMPLATE_TAG_RE = re.compile(r'{[{%#].*?[}%#]}', re.S)
+
+
+def template_strings(template_dirs, max_length=80):
+    """Short static text from the project templates (template tags stripped)"""
+    strings = set()
+    for template_dir in template_dirs:
+        for path in Path(template_dir).rglob('*.html'):
+            html = TEMPLATE_TAG_RE.sub(' ', path.read_text(encoding='utf-8', errors='ignore'))
+            soup = BeautifulSoup(html, 'html.parser')
+            for element in soup.find_all(UI_ELEMENTS):
+                text = ' '.join(element.get_text(' ', strip=True).split())
+                if 2 <= len(text) <= max_length and re.search(r'[A-Za-z]{2}', text):
+                    strings.add(text)
+    return sorted(strings)
+
+
+class Command(BaseCommand):
+    help = 'Pre-translate static UI strings into the translation memory so pages never translate them at request time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lang', action='append', default=None, help="Target language (repeatable, default 'or')")
+        parser.add_argument('--dry-run', action='store_true', help='Only list the strings that would be translated')
+
+    def handle(self, *args, **options):
+        languages = options['lang'] or ['or']
+
+        # Hand-made translations win over machine translations
+        english = COMMON_TRANSLATIONS['en']
+        for lang in languages:
+            known = COMMON_TRANSLATIONS.get(lang, {})
+            seeded = {english[key]: value for key, value in known.items() if key in english}
+            if seeded and not options['dry_run']:
+                translation_memory.store(seeded, 'en', lang, provider='static', overwrite=True)
+                self.stdout.write(f"📌 Seeded {len(seeded)} static '{lang}' strings")
+
+        strings = template_strings(settings.TEMPLATES[0]['DIRS'])
+        self.stdout.write(f"🔎 Found {len(strings)} UI strings in templates")
+        if options['dry_run']:
+            for text in strings:
+                self.stdout.write(f"  {text}")
+            return
+
+        for lang in languages:
+            translated = translate_many(strings, lang)
+            done = sum(1 for source, target in zip(strings, translated) if source != target)
+            self.stdout.write(self.style.SUCCESS(f"✅ '{lang}': {done}/{len(strings)} strings in translation memory"))
+        self.stdout.write(f"📊 {translation_memory.metrics()}")
@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-19 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source_hash", models.CharField(max_length=64)),
+                ("source_lang", models.CharField(max_length=10)),
+                ("target_lang", models.CharField(max_length=10)),
+                ("source_text", models.TextField()),
+                ("translated_text", models.TextField()),
+                (
+                    "provider",
+                    models.CharField(
+                        choices=[
+                            ("static", "Static UI string"),
+                            ("mymemory", "MyMemory"),
+                            ("googletrans", "Google Translate"),
+                        ],
+                        default="mymemory",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("source_hash", "source_lang", "target_lang")},
+            },
+        ),
+    ]
@@ -1,3 +1,27 @@
 from django.db import models
 
 # Create your models here.
+
+
+class TranslationMemory(models.Model):
+    """Persistent translation cache - consulted before any translation API call"""
+
+    PROVIDERS = [
+        ('static', 'Static UI string'),
+        ('mymemory', 'MyMemory'),
+        ('googletrans', 'Google Translate'),
+    ]
+
+    source_hash = models.CharField(max_length=64)
+    source_lang = models.CharField(max_length=10)
+    target_lang = models.CharField(max_length=10)
+    source_text = models.TextField()
+    translated_text = models.TextField()
+    provider = models.CharField(max_length=20, choices=PROVIDERS, default='mymemory')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['source_hash', 'source_lang', 'target_lang']
+
+    def __str__(self):
+        return f"{self.source_lang}->{self.target_lang}: {self.source_text[:40]}"
@@ -2,26 +2,76 @@ import requests
 import json
 from django.conf import settings
 
+from .translation_memory import translation_memory
+
+MYMEMORY_URL = "https://api.mymemory.translated.net/get"
+# MyMemory rejects queries over 500 bytes
+MYMEMORY_MAX_BYTES = 500
+
+_session = requests.Session()
+
+
+def _mymemory_request(text, target_lang, source_lang='en'):
+    response = _session.get(MYMEMORY_URL, params={'q': text, 'langpair': f"{source_lang}|{target_lang}"}, timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    if str(data.get('responseStatus')) != '200':
+        raise ValueError(data.get('responseDetails') or 'MyMemory error')
+    return data.get('responseData', {}).get('translatedText') or text
+
+
+def _mymemory_batch(texts, target_lang, source_lang='en'):
+    """Translate several strings per request by sending them as lines of one query"""
+    groups, group, size = [], [], 0
+    for text in texts:
+        length = len(text.encode('utf-8')) + 1
+        if '\n' in text or length > MYMEMORY_MAX_BYTES:
+            continue  # translated on its own
+        if group and size + length > MYMEMORY_MAX_BYTES:
+            groups.append(group)
+            group, size = [], 0
+        group.append(text)
+        size += length
+    if group:
+        groups.append(group)
+
+    def translate_group(group):
+        try:
+            lines = _mymemory_request('\n'.join(group), target_lang, source_lang).split('\n')
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return {}
+        # Only trust the batch when every line came back
+        if len(lines) != len(group):
+            return {}
+        return {text: line.strip() for text, line in zip(group, lines) if line.strip()}
+
+    translations = {}
+    for result in translation_memory.executor.map(translate_group, [g for g in groups if len(g) > 1]):
+        translations.update(result)
+    return translations
+
+
+def translate_many(texts, target_lang='or', source_lang='en'):
+    """Translate a list of strings - translation memory first, then batched MyMemory calls"""
+    if target_lang == source_lang:
+        return list(texts)
+    return translation_memory.translate_many(
+        texts, target_lang, source_lang,
+        translate_one=lambda text: _mymemory_request(text, target_lang, source_lang),
+        translate_batch=lambda missing: _mymemory_batch(missing, target_lang, source_lang),
+        provider='mymemory',
+    )
+
+
 def translate_text(text, target_lang='or'):
     """
     Simple translation utility using free API
     For hackathon demo - uses MyMemory Translation API
     """
-    try:
-        if target_lang == 'or':
-            # Odia language code for MyMemory API
-            target_lang = 'or'
-            
-        url = f"https://api.mymemory.translated.net/get?q={text}&langpair=en|{target_lang}"
-        response = requests.get(url, timeout=5)
-        
-        if response.status_code == 200:
-            translation = response.json().get('responseData', {}).get('translatedText', text)
-            return translation
-        return text
-    except Exception as e:
-        print(f"Translation error: {e}")
+    if not text:
         return text
+    return translate_many([text], target_lang)[0]
 
 def create_multilingual_context(request, context):
     """Add multilingual support to template context"""
@@ -35,12 +85,21 @@ def translate_dict_data(data, lang):
     if lang != 'or':
         return data
     
+    # Every string in the dict is translated in one go
+    strings = []
+    for value in data.values():
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, list):
+            strings.extend(item for item in value if isinstance(item, str))
+    translated = dict(zip(strings, translate_many(strings, lang)))
+    
     translated_data = {}
     for key, value in data.items():
         if isinstance(value, str):
-            translated_data[key] = translate_text(value)
+            translated_data[key] = translated.get(value, value)
         elif isinstance(value, list):
-            translated_data[key] = [translate_text(item) if isinstance(item, str) else item for item in value]
+            translated_data[key] = [translated.get(item, item) if isinstance(item, str) else item for item in value]
         else:
             translated_data[key] = value
     return translated_data
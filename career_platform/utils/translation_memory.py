@@ -0,0 +1,144 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import DatabaseError
+
+TRANSLATION_WORKERS = int(os.getenv('TRANSLATION_WORKERS', '8'))
+TRANSLATION_LOCAL_ENTRIES = int(os.getenv('TRANSLATION_LOCAL_ENTRIES', '5000'))
+
+
+def source_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemoryStore:
+    """Translation memory in front of every translation provider.
+
+    Lookups go to a small in-process LRU, then one query against the
+    TranslationMemory table for everything still missing. Only the remaining
+    misses reach the network: first as batched requests when the provider
+    supports it, then concurrently one string per request for whatever the
+    batch could not resolve. Successful translations are written back.
+    """
+
+    def __init__(self, workers=TRANSLATION_WORKERS, local_entries=TRANSLATION_LOCAL_ENTRIES):
+        self.local_entries = local_entries
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.stats = {'local_hits': 0, 'db_hits': 0, 'misses': 0, 'failed': 0}
+
+    # ---------- storage ----------
+
+    def _local_put(self, key, translation):
+        with self._lock:
+            self._local[key] = translation
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_entries:
+                self._local.popitem(last=False)
+
+    def lookup(self, texts, source_lang, target_lang):
+        """{text: translation} for every text already in memory"""
+        found, missing = {}, {}
+        with self._lock:
+            for text in texts:
+                key = (source_hash(text), source_lang, target_lang)
+                if key in self._local:
+                    self._local.move_to_end(key)
+                    found[text] = self._local[key]
+                else:
+                    missing[key[0]] = text
+        self.stats['local_hits'] += len(found)
+
+        if missing:
+            from .models import TranslationMemory
+            try:
+                rows = TranslationMemory.objects.filter(
+                    source_hash__in=list(missing), source_lang=source_lang, target_lang=target_lang
+                ).values_list('source_hash', 'translated_text')
+                for hash_value, translation in rows:
+                    found[missing[hash_value]] = translation
+                    self._local_put((hash_value, source_lang, target_lang), translation)
+                    self.stats['db_hits'] += 1
+            except DatabaseError as e:
+                print(f"⚠️ Translation memory unavailable: {e}")
+        return found
+
+    def store(self, translations, source_lang, target_lang, provider, overwrite=False):
+        """Persist {text: translation} pairs - ``overwrite`` replaces existing rows"""
+        if not translations:
+            return
+        from .models import TranslationMemory
+        rows = []
+        for text, translation in translations.items():
+            hash_value = source_hash(text)
+            self._local_put((hash_value, source_lang, target_lang), translation)
+            rows.append(TranslationMemory(
+                source_hash=hash_value, source_lang=source_lang, target_lang=target_lang,
+                source_text=text, translated_text=translation, provider=provider,
+            ))
+        try:
+            if overwrite:
+                TranslationMemory.objects.bulk_create(
+                    rows, update_conflicts=True, update_fields=['translated_text', 'provider'],
+                    unique_fields=['source_hash', 'source_lang', 'target_lang'],
+                )
+            else:
+                TranslationMemory.objects.bulk_create(rows, ignore_conflicts=True)
+        except DatabaseError as e:
+            print(f"⚠️ Could not save translations: {e}")
+
+    # ---------- translating ----------
+
+    def translate_many(self, texts, target_lang, source_lang, translate_one, translate_batch=None, provider='mymemory'):
+        """Translate a list of strings, returning them in order.
+
+        ``translate_one(text)`` and ``translate_batch(texts) -> {text: translation}``
+        call the provider and raise (or leave texts out) on failure. Strings that
+        can't be translated come back unchanged and are not remembered.
+        """
+        unique = list(dict.fromkeys(t for t in texts if isinstance(t, str) and t.strip()))
+        found = self.lookup(unique, source_lang, target_lang)
+        missing = [t for t in unique if t not in found]
+
+        fresh = {}
+        if missing and translate_batch:
+            try:
+                fresh.update(translate_batch(missing))
+            except Exception as e:
+                print(f"⚠️ Batch translation failed: {e}")
+        remainder = [t for t in missing if t not in fresh]
+
+        def attempt(text):
+            try:
+                return translate_one(text)
+            except Exception as e:
+                print(f"Translation error: {e}")
+                return None
+
+        if remainder:
+            for text, translation in zip(remainder, self.executor.map(attempt, remainder)):
+                if translation:
+                    fresh[text] = translation
+                else:
+                    self.stats['failed'] += 1
+
+        self.stats['misses'] += len(missing)
+        self.store(fresh, source_lang, target_lang, provider)
+        found.update(fresh)
+        return [found.get(t, t) if isinstance(t, str) else t for t in texts]
+
+    def translate(self, text, target_lang, source_lang, translate_one, translate_batch=None, provider='mymemory'):
+        return self.translate_many([text], target_lang, source_lang, translate_one, translate_batch, provider)[0]
+
+    def metrics(self):
+        stats = dict(self.stats)
+        stats['local_entries'] = len(self._local)
+        return stats
+
+
+# Create global instance
+translation_memory = TranslationMemoryStore()